@@ -12,6 +12,7 @@ Available fixtures:
     - test_page: Creates a test page under home_page
     - admin_credentials: Returns default admin credentials
     - admin_user_e2e: Creates an admin user for E2E testing
+    - authenticated_start_path: Admin path authenticated_page opens
     - authenticated_page: Playwright page logged into Wagtail admin
     - storage_state_path: Path for storing authentication state
     - authenticated_browser_context: Session-scoped authenticated context
@@ -115,6 +116,10 @@ def home_page(db, wagtail_site):
     creating test pages. It ensures a page exists under the root
     for proper URL routing.
 
+    The fixture is function-scoped on purpose: transactional E2E tests
+    flush every table after each test, so a page created once per
+    session would be gone by the next test.
+
     Args:
         db: pytest-django db fixture
         wagtail_site: Ensures site and root page exist
@@ -133,11 +138,12 @@ def home_page(db, wagtail_site):
     """
     from wagtail.models import Page
 
-    root = Page.objects.get(depth=1)
-    home = root.get_children().first()
+    # Children of the single root page are exactly the depth-2 pages, so
+    # the existing home page is found without loading the root first
+    home = Page.objects.filter(depth=2).order_by("path").first()
     if home is None:
         home = Page(title="Home", slug="home")
-        root.add_child(instance=home)
+        Page.objects.get(depth=1).add_child(instance=home)
     return home
 
 
@@ -206,24 +212,68 @@ def admin_user_e2e(db, wagtail_site, admin_credentials):
     return user
 
 
+def _session_cookie(user, server_url: str) -> dict[str, str]:
+    """
+    Log a user in server-side and return the session cookie for Playwright.
+
+    Args:
+        user: The user to log in
+        server_url: The URL the cookie should be sent to
+
+    Returns:
+        dict: A cookie in the format accepted by BrowserContext.add_cookies
+    """
+    from django.conf import settings
+    from django.test import Client
+
+    client = Client()
+    client.force_login(user)
+    return {
+        "name": settings.SESSION_COOKIE_NAME,
+        "value": client.cookies[settings.SESSION_COOKIE_NAME].value,
+        "url": server_url,
+    }
+
+
+@pytest.fixture
+def authenticated_start_path() -> str | None:
+    """
+    Return the admin path authenticated_page opens after logging in.
+
+    Override this fixture to return None when every test navigates on
+    its own; the page then stays blank and one page load per test is
+    saved.
+
+    Returns:
+        str | None: Path relative to server_url, or None to skip navigating
+    """
+    return "/admin/"
+
+
 @pytest.fixture
 def authenticated_page(
     page: Page,
     server_url: str,
     admin_user_e2e,
-    admin_credentials: dict[str, str],
+    authenticated_start_path: str | None,
 ) -> Page:
     """
     Return a Playwright page that is logged into Wagtail admin.
 
     This is the main fixture for E2E tests. It provides a browser
-    page that is already authenticated as an admin user.
+    page that is already authenticated as an admin user and open on
+    the admin dashboard (see authenticated_start_path).
+
+    The session is created server-side with Django's test client and
+    its cookie handed to the browser, so no login form is submitted.
+    A fresh session is minted for every test because transactional
+    tests flush the session table between tests.
 
     Args:
         page: Playwright's page fixture
         server_url: The test server URL
-        admin_user_e2e: Ensures admin user exists
-        admin_credentials: Login credentials
+        admin_user_e2e: The admin user to log in as
+        authenticated_start_path: Admin path to open, or None to skip
 
     Returns:
         Page: Playwright page logged into admin
@@ -233,16 +283,9 @@ def authenticated_page(
             authenticated_page.goto(f"{server_url}/admin/snippets/")
             # Already logged in
     """
-    # Navigate to login page
-    page.goto(f"{server_url}/admin/login/")
-
-    # Fill login form
-    page.get_by_label("Username").fill(admin_credentials["username"])
-    page.get_by_label("Password").fill(admin_credentials["password"])
-    page.get_by_role("button", name="Sign in").click()
-
-    # Wait for redirect to admin dashboard
-    page.wait_for_url(f"{server_url}/admin/**")
+    page.context.add_cookies([_session_cookie(admin_user_e2e, server_url)])
+    if authenticated_start_path is not None:
+        page.goto(f"{server_url}{authenticated_start_path}")
 
     return page
 
@@ -273,7 +316,8 @@ def _authenticated_storage_state(
     Create and save authenticated storage state (session-scoped).
 
     This fixture logs in once per session and saves the browser state,
-    allowing subsequent tests to skip the login process.
+    allowing subsequent tests to skip the login process. The session is
+    created with Django's test client, so no page is loaded.
 
     Returns:
         Path: Path to the saved storage state file
@@ -295,16 +339,11 @@ def _authenticated_storage_state(
             user.set_password("e2e_password_123")
             user.save()
 
-    # Create context and login
-    context = browser.new_context()
-    page = context.new_page()
+        # Log in server-side instead of submitting the login form
+        cookie = _session_cookie(user, str(live_server.url))
 
-    server_url = str(live_server.url)
-    page.goto(f"{server_url}/admin/login/")
-    page.get_by_label("Username").fill("e2e_admin")
-    page.get_by_label("Password").fill("e2e_password_123")
-    page.get_by_role("button", name="Sign in").click()
-    page.wait_for_url(f"{server_url}/admin/**")
+    context = browser.new_context()
+    context.add_cookies([cookie])
 
     # Save storage state
     storage_state_path.parent.mkdir(parents=True, exist_ok=True)
@@ -482,6 +521,11 @@ def pytest_sessionfinish(session, exitstatus):
     if not session.config.getoption("--gif", default=False):
         return
 
+    # Under pytest-xdist every worker finishes its own session; convert once,
+    # on the controller, after all workers have written their videos
+    if hasattr(session.config, "workerinput"):
+        return
+
     from pathlib import Path
 
     from wagtail_scenario_test.utils.video import (
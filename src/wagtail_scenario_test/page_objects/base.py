@@ -10,10 +10,58 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from playwright.sync_api import Locator, expect
+from playwright.sync_api import expect
 
 if TYPE_CHECKING:
-    from playwright.sync_api import Page
+    from playwright.sync_api import Locator, Page
+
+# Sets each field's value and fires the given events on it; returns the
+# selectors that matched nothing
+_SET_FIELD_VALUES_JS = """([entries, events]) => {
+    const missing = [];
+    for (const [selector, value] of entries) {
+        const field = document.querySelector(selector);
+        if (!field) {
+            missing.push(selector);
+            continue;
+        }
+        field.value = value;
+        for (const type of events) {
+            field.dispatchEvent(new Event(type, {bubbles: true}));
+        }
+    }
+    return missing;
+}"""
+
+
+def _set_field_values(
+    page: Page,
+    values: dict[str, str],
+    *,
+    events: tuple[str, ...],
+    raise_missing: bool = True,
+) -> list[str]:
+    """
+    Set several field values in a single evaluate call.
+
+    Args:
+        page: Playwright Page instance
+        values: Mapping of CSS selector to value
+        events: Event types dispatched on each field after setting it
+        raise_missing: Raise if a selector matches nothing, instead of
+            skipping it
+
+    Returns:
+        The selectors that matched nothing
+
+    Raises:
+        ValueError: If a field is not on the page and raise_missing is set
+    """
+    entries = [[selector, value] for selector, value in values.items()]
+    missing = page.evaluate(_SET_FIELD_VALUES_JS, [entries, list(events)])
+    if missing and raise_missing:
+        raise ValueError(f"Form fields not found: {', '.join(missing)}")
+    return missing
 
 
 class BasePage:
@@ -48,15 +96,20 @@ class BasePage:
     # Navigation
     # =========================================================================
 
-    def goto(self, path: str) -> None:
+    def goto(self, path: str, *, wait_until: str | None = None) -> None:
         """
         Navigate to a path relative to base_url.
 
         Args:
             path: URL path starting with /
+            wait_until: Playwright load event to wait for (e.g.
+                "domcontentloaded"). Defaults to Playwright's "load".
         """
         url = f"{self.base_url}{path}"
-        self.page.goto(url)
+        if wait_until is None:
+            self.page.goto(url)
+        else:
+            self.page.goto(url, wait_until=wait_until)
 
     def current_path(self) -> str:
         """Return the current URL path (without base_url)."""
@@ -149,6 +202,32 @@ class BasePage:
         field = self.page.locator(selector)
         field.fill(value)
 
+    def fill_form(self, fields: dict[str, str]) -> None:
+        """
+        Fill several form fields by ID in a single browser call.
+
+        Values are set directly and an input event is dispatched for each
+        field, so fields on inactive tabs (such as the slug on Wagtail's
+        Promote tab) can be filled without switching to them. Meant for
+        text inputs; use the locator methods for selects and checkboxes.
+
+        Args:
+            fields: Mapping of field id (with or without #) to value
+
+        Raises:
+            ValueError: If a field is not on the page
+
+        Example:
+            page_admin.fill_form({"id_title": "My Page", "id_slug": "my-page"})
+        """
+        selectors = {
+            (field_id if field_id.startswith("#") else f"#{field_id}"): value
+            for field_id, value in fields.items()
+        }
+        # No change event: Wagtail re-syncs the slug from the title on
+        # change, which would undo an explicitly filled slug
+        _set_field_values(self.page, selectors, events=("input",))
+
     def clear_and_fill(self, selector: str, value: str) -> None:
         """
         Clear a field and fill it with a new value.
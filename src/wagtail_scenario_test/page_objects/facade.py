@@ -61,6 +61,8 @@ class WagtailAdmin:
         self.page = page
         self.base_url = base_url.rstrip("/")
         self._admin_page = WagtailAdminPage(page, base_url)
+        # SnippetAdminPage per model identifier, built on first use
+        self._snippets: dict[str, SnippetAdminPage] = {}
 
     # =========================================================================
     # Factory methods for Page Objects
@@ -70,6 +72,9 @@ class WagtailAdmin:
         """
         Get a SnippetAdminPage for the specified model.
 
+        The Page Object is created on the first call for a model and
+        returned again on later calls with the same identifier.
+
         Args:
             model: Model identifier in "app_name.model_name" or "model_name" format.
                    If only model_name is provided, app_name defaults to model_name.
@@ -84,6 +89,9 @@ class WagtailAdmin:
             # Short format (app_name = model_name)
             admin.snippet("mymodel")
         """
+        if model in self._snippets:
+            return self._snippets[model]
+
         if "." in model:
             app_name, model_name = model.split(".", 1)
         else:
@@ -91,12 +99,14 @@ class WagtailAdmin:
             app_name = model
             model_name = model
 
-        return SnippetAdminPage(
+        snippet = SnippetAdminPage(
             self.page,
             self.base_url,
             app_name=app_name,
             model_name=model_name,
         )
+        self._snippets[model] = snippet
+        return snippet
 
     def pages(self) -> PageAdminPage:
         """
@@ -153,7 +163,7 @@ class WagtailAdmin:
         Check if currently logged into admin.
 
         Returns:
-            True if on admin page (not login page)
+            True if the browser holds an admin session cookie
         """
         return self._admin_page.is_logged_in()
 
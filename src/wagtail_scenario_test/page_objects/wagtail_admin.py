@@ -7,14 +7,25 @@ Wagtail's admin interface in E2E tests.
 
 from __future__ import annotations
 
+import re
+from functools import cached_property
 from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import expect
 
-from wagtail_scenario_test.page_objects.base import BasePage
+from wagtail_scenario_test.page_objects.base import BasePage, _set_field_values
 
 if TYPE_CHECKING:
-    from playwright.sync_api import Page
+    from playwright.sync_api import Locator, Page
+
+# Static asset responses by URL as (status, headers, body), shared by every
+# browser context in the process: static files do not change during a run
+_STATIC_ASSET_CACHE: dict[str, tuple[int, dict[str, str], bytes]] = {}
+
+# Events Wagtail's block widgets listen for after a value is set directly
+_WIDGET_EVENTS = ("input", "change")
 
 
 class WagtailAdminPage(BasePage):
@@ -38,13 +49,115 @@ class WagtailAdminPage(BasePage):
     LOGIN_URL = "/admin/login/"
     LOGOUT_URL = "/admin/logout/"
 
+    # Django's default SESSION_COOKIE_NAME; override if your project changes it
+    SESSION_COOKIE_NAMES: tuple[str, ...] = ("sessionid",)
+
+    # =========================================================================
+    # Timeouts
+    # =========================================================================
+
+    # Error messages are already in the DOM once save() has waited for
+    # navigation, so error assertions fail fast instead of waiting out the
+    # nav budget.
+    DEFAULT_FAST_TIMEOUT_MS = 2000
+    # For waits that genuinely race a navigation or modal opening, including
+    # the success message that appears after a form submit
+    DEFAULT_NAV_TIMEOUT_MS = 10000
+    # For read-only probes of elements that may legitimately be absent
+    PROBE_TIMEOUT = 500
+
+    # =========================================================================
+    # Selectors
+    # =========================================================================
+
+    _DROPDOWN_TOGGLE_SELECTOR = (
+        "[data-controller='w-dropdown'] button[data-w-dropdown-target='toggle']"
+    )
+
+    @cached_property
+    def _dropdown_toggle(self) -> Locator:
+        """Return the w-dropdown toggle button (built once per Page Object)."""
+        return self.page.locator(self._DROPDOWN_TOGGLE_SELECTOR)
+
+    # =========================================================================
+    # Network
+    # =========================================================================
+
+    # Playwright resource types that admin assertions never depend on
+    _HEAVY_TYPES = frozenset({"image", "font", "media"})
+
+    def block_heavy_resources(self) -> None:
+        """
+        Abort image, font and media requests for the whole browser context.
+
+        Opt-in: admin pages then load only documents, CSS, JS and XHR, which
+        cuts bytes over the wire and renderer work on every navigation.
+        The route stays installed for the lifetime of the context.
+
+        Example:
+            admin = WagtailAdminPage(page, base_url)
+            admin.block_heavy_resources()
+            admin.login("admin", "password")
+        """
+        self.page.context.route("**/*", self._route_heavy_resource)
+
+    def _route_heavy_resource(self, route) -> None:
+        """Abort heavy resource types and let everything else through."""
+        if route.request.resource_type in self._HEAVY_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    def cache_static_assets(self, static_url: str = "/static/") -> None:
+        """
+        Serve static files from an in-process cache for the browser context.
+
+        Every test gets a fresh browser context with an empty HTTP cache, so
+        each one downloads the admin's JS and CSS again. With this route,
+        a static file is fetched from the server once per process and then
+        replayed from memory. Only successful GET responses are cached.
+
+        Call it after block_heavy_resources(): later routes run first, and
+        heavy resource types are passed on to the earlier route.
+
+        Args:
+            static_url: The project's STATIC_URL
+
+        Example:
+            admin = WagtailAdminPage(page, base_url)
+            admin.block_heavy_resources()
+            admin.cache_static_assets()
+        """
+        self.page.context.route(f"**{static_url}**", self._route_static_asset)
+
+    def _route_static_asset(self, route) -> None:
+        """Fulfill a static file request from the cache, filling it on a miss."""
+        request = route.request
+        if request.method != "GET" or request.resource_type in self._HEAVY_TYPES:
+            route.fallback()
+            return
+        cached = _STATIC_ASSET_CACHE.get(request.url)
+        if cached is None:
+            response = route.fetch()
+            if response.status != 200:
+                route.fulfill(response=response)
+                return
+            cached = (response.status, response.headers, response.body())
+            _STATIC_ASSET_CACHE[request.url] = cached
+        status, headers, body = cached
+        route.fulfill(status=status, headers=headers, body=body)
+
     # =========================================================================
     # Authentication
     # =========================================================================
 
     def login(self, username: str, password: str) -> None:
         """
-        Log into Wagtail admin.
+        Log into Wagtail admin through the login form.
+
+        Always submits the form, so it also switches users when the browser
+        is already logged in. Use ensure_logged_in() to skip the form when
+        any valid session will do.
 
         Args:
             username: Admin username
@@ -56,6 +169,30 @@ class WagtailAdminPage(BasePage):
         self.page.get_by_role("button", name="Sign in").click()
         self.page.wait_for_url(f"**{self.ADMIN_ROOT}**")
 
+    def ensure_logged_in(self, username: str, password: str) -> None:
+        """
+        Log in only if the browser has no valid admin session.
+
+        With a session cookie present, requests the admin root without
+        loading it in the page and skips the form unless the server
+        redirects to the login page (e.g. the session was flushed). The
+        session may belong to any user; call login() to act as a specific
+        one.
+
+        Args:
+            username: Admin username
+            password: Admin password
+        """
+        if self.is_logged_in() and self._has_valid_session():
+            return
+        self.login(username, password)
+
+    def _has_valid_session(self) -> bool:
+        """Return True if the server accepts the browser's admin session."""
+        # page.request shares the context's cookies but not its navigation
+        response = self.page.request.get(f"{self.base_url}{self.ADMIN_ROOT}")
+        return urlparse(response.url).path != self.LOGIN_URL
+
     def logout(self) -> None:
         """Log out of Wagtail admin using the UI logout button."""
         # Click the user menu button in sidebar footer to expand the dropdown
@@ -71,8 +208,18 @@ class WagtailAdminPage(BasePage):
             self.wait_for_navigation()
 
     def is_logged_in(self) -> bool:
-        """Check if currently logged in."""
-        return self.LOGIN_URL not in self.page.url
+        """
+        Check if currently logged in.
+
+        Reads the session cookie from the browser context rather than the
+        current URL, so it never requires (or triggers) a navigation. Cookies
+        belong to the shared browser context, so they are read on every call.
+
+        Returns:
+            True if a session cookie exists for base_url
+        """
+        cookies = self.page.context.cookies(self.base_url)
+        return any(c["name"] in self.SESSION_COOKIE_NAMES for c in cookies)
 
     # =========================================================================
     # Navigation
@@ -139,9 +286,10 @@ class WagtailAdminPage(BasePage):
             Success message text or None
         """
         success = self.page.locator(".w-message--success")
-        if success.count() > 0:
-            return success.first.text_content()
-        return None
+        try:
+            return success.first.text_content(timeout=self.PROBE_TIMEOUT)
+        except PlaywrightTimeoutError:
+            return None
 
     def get_error_message(self) -> str | None:
         """
@@ -151,25 +299,40 @@ class WagtailAdminPage(BasePage):
             Error message text or None
         """
         error = self.page.locator(".w-message--error")
-        if error.count() > 0:
-            return error.first.text_content()
-        return None
+        try:
+            return error.first.text_content(timeout=self.PROBE_TIMEOUT)
+        except PlaywrightTimeoutError:
+            return None
 
     def assert_success_message(self, contains: str | None = None) -> None:
         """
         Assert a success message is displayed.
 
+        Waits for the message element itself, so it can be called straight
+        after submitting a form without waiting for the navigation first.
+
         Args:
             contains: Optional text that should be in the message
+
+        Raises:
+            AssertionError: If no success message appears
         """
         # Multiple selectors for Wagtail version compatibility
         success = self.page.locator(
             ".w-message--success, .success, "
             "[data-w-messages-target='container'] .success"
-        )
-        expect(success.first).to_be_visible(timeout=10000)
+        ).first
+        try:
+            success.wait_for(state="visible", timeout=self.DEFAULT_NAV_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            raise AssertionError("No success message was displayed") from None
         if contains:
-            expect(success.first).to_contain_text(contains)
+            # The message is rendered with the page, so once it is visible
+            # a plain read is enough; no need for a second polling assertion
+            text = success.text_content() or ""
+            assert contains in text, (
+                f"Success message {text.strip()!r} does not contain {contains!r}"
+            )
 
     def assert_error_message(self, contains: str | None = None) -> None:
         """
@@ -179,7 +342,7 @@ class WagtailAdminPage(BasePage):
             contains: Optional text that should be in the message
         """
         error = self.page.locator(".w-message--error")
-        expect(error).to_be_visible()
+        expect(error).to_be_visible(timeout=self.DEFAULT_FAST_TIMEOUT_MS)
         if contains:
             expect(error).to_contain_text(contains)
 
@@ -210,6 +373,11 @@ class SnippetAdminPage(WagtailAdminPage):
         )
     """
 
+    # The success message after creating a snippet links to its edit view
+    _CREATED_ITEM_EDIT_LINK_SELECTOR = ".w-message--success a[href*='/edit/']"
+    # Title links in the list rows (the same cells the list snapshot reads)
+    _LIST_LINK_SELECTOR = "table tbody tr td a"
+
     def __init__(
         self,
         page: Page,
@@ -235,15 +403,15 @@ class SnippetAdminPage(WagtailAdminPage):
     # URLs
     # =========================================================================
 
-    @property
+    @cached_property
     def list_url(self) -> str:
-        """Return the snippet list URL."""
+        """Return the snippet list URL (built once per Page Object)."""
         return f"/admin/snippets/{self.app_name}/{self.model_name}/"
 
-    @property
+    @cached_property
     def add_url(self) -> str:
-        """Return the snippet add URL."""
-        return f"/admin/snippets/{self.app_name}/{self.model_name}/add/"
+        """Return the snippet add URL (built once per Page Object)."""
+        return f"{self.list_url}add/"
 
     def edit_url(self, item_id: int) -> str:
         """
@@ -252,7 +420,7 @@ class SnippetAdminPage(WagtailAdminPage):
         Args:
             item_id: Snippet primary key
         """
-        return f"/admin/snippets/{self.app_name}/{self.model_name}/edit/{item_id}/"
+        return f"{self.list_url}edit/{item_id}/"
 
     def delete_url(self, item_id: int) -> str:
         """
@@ -261,7 +429,12 @@ class SnippetAdminPage(WagtailAdminPage):
         Args:
             item_id: Snippet primary key
         """
-        return f"/admin/snippets/{self.app_name}/{self.model_name}/delete/{item_id}/"
+        return f"{self.list_url}delete/{item_id}/"
+
+    @cached_property
+    def _edit_path_pattern(self) -> re.Pattern[str]:
+        """Return a pattern capturing the key from this model's edit URLs."""
+        return re.compile(rf"{re.escape(self.list_url)}edit/(\d+)/")
 
     # =========================================================================
     # Navigation
@@ -271,6 +444,18 @@ class SnippetAdminPage(WagtailAdminPage):
         """Navigate to the snippet list page."""
         self.goto(self.list_url)
 
+    def refresh_list(self) -> None:
+        """Reload the list page, e.g. after changing data outside the browser."""
+        self.go_to_list()
+
+    def _ensure_on_list(self) -> None:
+        """Navigate to the list page only if the browser is not already there."""
+        # Wagtail redirects to the list after a successful save. A query
+        # string (e.g. after search()) means a filtered view, not the list
+        url = urlparse(self.page.url)
+        if url.path != self.list_url or url.query:
+            self.go_to_list()
+
     def go_to_add(self) -> None:
         """Navigate to the add snippet page."""
         self.goto(self.add_url)
@@ -294,7 +479,7 @@ class SnippetAdminPage(WagtailAdminPage):
         name: str | None = None,
         save: bool = True,
         **fields: str,
-    ) -> None:
+    ) -> int | None:
         """
         Create a new snippet.
 
@@ -303,20 +488,26 @@ class SnippetAdminPage(WagtailAdminPage):
             save: Whether to save after filling the form
             **fields: Additional fields to fill (field_id=value)
 
+        Returns:
+            The primary key of the created snippet, or None if it was not
+            saved or its key could not be read from the admin
+
         Example:
             # Simple creation with just name
-            page.create(name="My Item")
+            item_id = page.create(name="My Item")
 
             # With additional fields
             page.create(name="My Item", id_slug="my-slug", id_description="...")
         """
-        self.go_to_add()
-        self.wait_for_navigation()
+        # The add form is usable once the DOM is parsed; waiting for
+        # networkidle would also wait on Wagtail's autosave/preview XHRs.
+        # Field fills and the Save click auto-wait for their elements.
+        self.goto(self.add_url, wait_until="domcontentloaded")
 
         # Fill name field if provided
         if name is not None:
             name_input = self.page.locator("#id_name")
-            name_input.wait_for(state="visible", timeout=10000)
+            name_input.wait_for(state="visible", timeout=self.DEFAULT_NAV_TIMEOUT_MS)
             name_input.fill(name)
 
         # Fill additional fields
@@ -327,22 +518,59 @@ class SnippetAdminPage(WagtailAdminPage):
 
         if save:
             self.save()
+            return self._created_item_id()
+        return None
+
+    def _created_item_id(self) -> int | None:
+        """
+        Read the primary key of a snippet that was just created.
+
+        Snippets with draft support redirect to the new item's edit view,
+        so the key is taken from the URL. Other snippets redirect to the
+        list; then the Edit link in the success message is used.
+
+        Returns:
+            The primary key, or None if neither source contains it
+        """
+        pattern = self._edit_path_pattern
+        match = pattern.search(urlparse(self.page.url).path)
+        if match is None:
+            link = self.page.locator(self._CREATED_ITEM_EDIT_LINK_SELECTOR).first
+            try:
+                href = link.get_attribute("href", timeout=self.PROBE_TIMEOUT)
+            except PlaywrightTimeoutError:
+                return None
+            match = pattern.search(href or "")
+        return int(match.group(1)) if match else None
 
     # =========================================================================
     # Form interactions
     # =========================================================================
 
-    def save(self) -> None:
-        """Click the Save button."""
+    def save(self, wait: bool = True) -> None:
+        """
+        Click the Save button.
+
+        Args:
+            wait: Wait for the resulting navigation to finish. Pass False
+                when the next call navigates (or waits) on its own anyway.
+        """
         self.page.get_by_role("button", name="Save").click()
-        self.wait_for_navigation()
+        if wait:
+            self.wait_for_navigation()
 
-    def save_draft(self) -> None:
-        """Save as draft (if available)."""
+    def save_draft(self, wait: bool = True) -> None:
+        """
+        Save as draft (if available).
+
+        Args:
+            wait: Wait for the resulting navigation to finish
+        """
         self.page.get_by_role("button", name="Save draft").click()
-        self.wait_for_navigation()
+        if wait:
+            self.wait_for_navigation()
 
-    def delete(self, confirm: bool = True) -> None:
+    def delete(self, confirm: bool = True, wait: bool = True) -> None:
         """
         Delete the current snippet.
 
@@ -352,13 +580,11 @@ class SnippetAdminPage(WagtailAdminPage):
 
         Args:
             confirm: Whether to confirm the deletion
+            wait: Wait for the resulting navigation to finish
         """
         # In Wagtail 7+, Delete is in the header "More" dropdown as a link
         # Open the dropdown first using the w-dropdown controller
-        dropdown_toggle = self.page.locator(
-            "[data-controller='w-dropdown'] button[data-w-dropdown-target='toggle']"
-        )
-        dropdown_toggle.click()
+        self._dropdown_toggle.click()
 
         # Click the Delete link (not button) in the dropdown
         # Use exact=True to avoid matching items like "Delete Test Snippet"
@@ -366,12 +592,39 @@ class SnippetAdminPage(WagtailAdminPage):
 
         if confirm:
             self.page.get_by_role("button", name="Yes, delete").click()
-        self.wait_for_navigation()
+        if wait:
+            self.wait_for_navigation()
 
     # =========================================================================
     # List operations
     # =========================================================================
 
+    _LIST_SNAPSHOT_JS = """() => ({
+        rows: document.querySelectorAll('table tbody tr').length,
+        titles: Array.from(
+            document.querySelectorAll('table tbody tr td a'),
+            (a) => a.textContent,
+        ),
+    })"""
+
+    def _read_list_snapshot(self) -> dict:
+        """Read the list in one round-trip, loading it only if not already open."""
+        # Not cached: the list can change through other Page Objects sharing
+        # the browser page, raw page navigations or saves without a wait
+        self._ensure_on_list()
+        return self.page.evaluate(self._LIST_SNAPSHOT_JS)
+
+    def get_list_snapshot(self) -> list[str]:
+        """
+        Get all item titles from the list in a single evaluate call.
+
+        Navigates to the list only when the browser is elsewhere.
+
+        Returns:
+            List of item titles
+        """
+        return [title or "" for title in self._read_list_snapshot()["titles"]]
+
     def get_item_count(self) -> int:
         """
         Return the number of items in the list.
@@ -379,34 +632,45 @@ class SnippetAdminPage(WagtailAdminPage):
         Returns:
             Number of items
         """
-        self.go_to_list()
-        rows = self.page.locator("table tbody tr")
-        return rows.count()
+        return self._read_list_snapshot()["rows"]
 
-    def item_exists_in_list(self, title: str) -> bool:
+    def item_exists_in_list(self, title: str, *, skip_reload: bool = False) -> bool:
         """
         Check if an item with the given title exists in the list.
 
         Args:
             title: Item title to look for
+            skip_reload: Reuse the list if the browser is already on it
+                instead of reloading it
 
         Returns:
             True if found, False otherwise
         """
-        self.go_to_list()
-        return self.page.get_by_role("link", name=title).count() > 0
+        if skip_reload:
+            self._ensure_on_list()
+        else:
+            self.go_to_list()
+        return self._list_link(title).count() > 0
 
     def click_item_in_list(self, title: str) -> None:
         """
         Click on an item in the list to edit it.
 
+        Loads the list only if the browser is not already on it.
+
         Args:
             title: Item title to click
         """
-        self.go_to_list()
-        self.page.get_by_role("link", name=title).click()
+        self._ensure_on_list()
+        self._list_link(title).click()
         self.wait_for_navigation()
 
+    def _list_link(self, title: str) -> Locator:
+        """Return the list row link whose text contains title."""
+        # A CSS match filtered by text; get_by_role would build the page's
+        # accessibility tree to resolve link names
+        return self.page.locator(self._LIST_LINK_SELECTOR).filter(has_text=title)
+
     def get_list_items(self) -> list[str]:
         """
         Get all item titles from the list.
@@ -414,9 +678,7 @@ class SnippetAdminPage(WagtailAdminPage):
         Returns:
             List of item titles
         """
-        self.go_to_list()
-        links = self.page.locator("table tbody tr td a").all()
-        return [link.text_content() or "" for link in links]
+        return self.get_list_snapshot()
 
     # =========================================================================
     # Assertions
@@ -438,7 +700,9 @@ class SnippetAdminPage(WagtailAdminPage):
             title: Expected item title
         """
         self.assert_success_message()
-        assert self.item_exists_in_list(title), f"Item '{title}' not found in list"
+        assert self.item_exists_in_list(title, skip_reload=True), (
+            f"Item '{title}' not found in list"
+        )
 
     def assert_item_updated(self, title: str) -> None:
         """
@@ -448,7 +712,9 @@ class SnippetAdminPage(WagtailAdminPage):
             title: Expected item title
         """
         self.assert_success_message()
-        assert self.item_exists_in_list(title), f"Item '{title}' not found in list"
+        assert self.item_exists_in_list(title, skip_reload=True), (
+            f"Item '{title}' not found in list"
+        )
 
     def assert_validation_error(self, message: str | None = None) -> None:
         """
@@ -458,7 +724,7 @@ class SnippetAdminPage(WagtailAdminPage):
             message: Optional specific error message to check for
         """
         error = self.page.locator(".w-field__errors, .errorlist")
-        expect(error.first).to_be_visible(timeout=5000)
+        expect(error.first).to_be_visible(timeout=self.DEFAULT_FAST_TIMEOUT_MS)
         if message:
             self.assert_visible(message)
 
@@ -476,6 +742,29 @@ class PageAdminPage(WagtailAdminPage):
         page_admin.navigate_to_explorer()
     """
 
+    # =========================================================================
+    # Selectors
+    # =========================================================================
+
+    # Tab labels are rendered as "tab-label-<panel identifier>"
+    _PROMOTE_TAB_SELECTOR = "#tab-label-promote"
+    # Scoped to the footer: the schedule-publishing dialog has its own
+    # .action-save button
+    _SAVE_DRAFT_SELECTOR = "footer button.action-save"
+    # The success message after creating a page links to its edit view
+    _CREATED_PAGE_EDIT_LINK_SELECTOR = ".w-message--success a[href*='/edit/']"
+    _EDIT_PATH_PATTERN = re.compile(r"/admin/pages/(\d+)/edit/")
+
+    @cached_property
+    def _promote_tab(self) -> Locator:
+        """Return the editor's Promote tab label (built once per Page Object)."""
+        return self.page.locator(self._PROMOTE_TAB_SELECTOR)
+
+    @cached_property
+    def _save_draft_button(self) -> Locator:
+        """Return the editor's Save draft button (built once per Page Object)."""
+        return self.page.locator(self._SAVE_DRAFT_SELECTOR)
+
     # =========================================================================
     # Navigation
     # =========================================================================
@@ -490,7 +779,9 @@ class PageAdminPage(WagtailAdminPage):
         """
         self.page.get_by_role("button", name="Pages").click()
         # Wait for the explorer panel to open (uses role="dialog" and aria-label)
-        self.page.locator(".c-page-explorer").wait_for(state="visible", timeout=10000)
+        self.page.locator(".c-page-explorer").wait_for(
+            state="visible", timeout=self.DEFAULT_NAV_TIMEOUT_MS
+        )
 
     # =========================================================================
     # URLs
@@ -527,6 +818,15 @@ class PageAdminPage(WagtailAdminPage):
         """
         return f"/admin/pages/{page_id}/delete/"
 
+    def unpublish_page_url(self, page_id: int) -> str:
+        """
+        Return the URL of the unpublish confirmation page.
+
+        Args:
+            page_id: The page ID to unpublish
+        """
+        return f"/admin/pages/{page_id}/unpublish/"
+
     def preview_url(self, page_id: int) -> str:
         """
         Return the preview URL for a page.
@@ -559,29 +859,51 @@ class PageAdminPage(WagtailAdminPage):
         """
         # In Wagtail 7+, the status link has aria-label "Visit the live page"
         # This is more specific than just "Live" which can match multiple elements
-        link = self.page.locator("a.page-status-tag[href]")
-        if link.count() == 0:
-            return None
-        return link.first.get_attribute("href")
+        # Read the href inside the browser in a single round-trip instead of
+        # a count() followed by get_attribute()
+        return self.page.evaluate(
+            "() => document.querySelector('a.page-status-tag[href]')"
+            "?.getAttribute('href') ?? null"
+        )
 
     # =========================================================================
     # Page Navigation
     # =========================================================================
 
-    def edit_page(self, page_id: int) -> None:
+    def _navigate(self, path: str, wait_until: str | None) -> None:
+        """
+        Navigate to a path and wait until it has loaded.
+
+        Without wait_until the navigation waits for network idle, so that
+        scripts fetching data after the load event have finished.
+
+        Args:
+            path: URL path starting with /
+            wait_until: Playwright load event to stop at instead of
+                network idle (e.g. "domcontentloaded")
+        """
+        if wait_until is None:
+            self.goto(path)
+            self.wait_for_navigation()
+        else:
+            self.goto(path, wait_until=wait_until)
+
+    def edit_page(self, page_id: int, *, wait_until: str | None = None) -> None:
         """
         Navigate to the edit page for an existing page.
 
         Args:
             page_id: The page ID to edit
+            wait_until: Playwright load event to stop at instead of network
+                idle. Pass "domcontentloaded" when only the URL or the
+                server-rendered form is checked.
 
         Example:
             page_admin.edit_page(5)  # Navigate to edit page with ID 5
         """
-        self.goto(self.edit_page_url(page_id))
-        self.wait_for_navigation()
+        self._navigate(self.edit_page_url(page_id), wait_until)
 
-    def visit_preview(self, page_id: int) -> None:
+    def visit_preview(self, page_id: int, *, wait_until: str | None = None) -> None:
         """
         Navigate to the preview of a page.
 
@@ -591,14 +913,15 @@ class PageAdminPage(WagtailAdminPage):
 
         Args:
             page_id: The page ID to preview
+            wait_until: Playwright load event to stop at instead of network
+                idle, e.g. "domcontentloaded" when only the URL is checked
 
         Example:
             page_admin.visit_preview(5)  # Preview page with ID 5
         """
-        self.goto(self.preview_url(page_id))
-        self.wait_for_navigation()
+        self._navigate(self.preview_url(page_id), wait_until)
 
-    def visit_live(self, page_id: int) -> None:
+    def visit_live(self, page_id: int, *, wait_until: str | None = None) -> None:
         """
         Navigate to the live URL of a published page.
 
@@ -607,6 +930,8 @@ class PageAdminPage(WagtailAdminPage):
 
         Args:
             page_id: The page ID to view live
+            wait_until: Playwright load event both navigations stop at
+                instead of network idle, e.g. "domcontentloaded"
 
         Raises:
             ValueError: If the page is not published or has no live URL
@@ -614,12 +939,11 @@ class PageAdminPage(WagtailAdminPage):
         Example:
             page_admin.visit_live(5)  # View live page with ID 5
         """
-        self.edit_page(page_id)
+        self.edit_page(page_id, wait_until=wait_until)
         live_url = self.get_live_url()
         if live_url is None:
             raise ValueError(f"Page {page_id} is not published or has no routable URL")
-        self.goto(live_url)
-        self.wait_for_navigation()
+        self._navigate(live_url, wait_until)
 
     # =========================================================================
     # Page Deletion
@@ -657,7 +981,9 @@ class PageAdminPage(WagtailAdminPage):
         if confirm:
             # Wait for confirmation page to load before clicking confirm button
             confirm_button = self.page.get_by_role("button", name="Yes, delete")
-            confirm_button.wait_for(state="visible", timeout=10000)
+            confirm_button.wait_for(
+                state="visible", timeout=self.DEFAULT_NAV_TIMEOUT_MS
+            )
             confirm_button.click()
         self.wait_for_navigation()
 
@@ -702,15 +1028,16 @@ class PageAdminPage(WagtailAdminPage):
         """
         Unpublish a live page.
 
-        If page_id is provided, navigates to the edit page first.
-        Otherwise, assumes we are already on the page edit screen.
+        If page_id is provided, navigates straight to the unpublish
+        confirmation page. Otherwise, assumes we are already on the page
+        edit screen and follows the Unpublish link there.
 
         In Wagtail, the Unpublish action is in the "Actions" dropdown menu
         at the top of the page editor (same dropdown as Delete, Copy, Move).
 
         Args:
-            page_id: Optional page ID to unpublish. If provided, navigates to
-                the edit page first. If None, assumes already on edit page.
+            page_id: Optional page ID to unpublish. If provided, skips the
+                edit page. If None, assumes already on edit page.
             confirm: Whether to confirm the unpublish action (default True)
 
         Example:
@@ -725,22 +1052,48 @@ class PageAdminPage(WagtailAdminPage):
             page_admin.unpublish(page_id=5, confirm=False)
         """
         if page_id is not None:
-            self.edit_page(page_id)
-
-        # Unpublish is in the "Actions" dropdown (same as Delete, Copy, Move)
-        # This is different from the "More actions" dropdown which has Publish
-        self.page.get_by_role("button", name="Actions", exact=True).click()
+            # The dropdown link only leads to this URL, so loading the edit
+            # page first would cost a full page load for nothing
+            self.goto(self.unpublish_page_url(page_id))
+        else:
+            # Unpublish is in the "Actions" dropdown (same as Delete, Copy,
+            # Move). This is different from the "More actions" dropdown which
+            # has Publish
+            self.page.get_by_role("button", name="Actions", exact=True).click()
 
-        # Click the Unpublish link in the dropdown
-        self.page.get_by_role("link", name="Unpublish", exact=True).click()
+            # Click the Unpublish link in the dropdown
+            self.page.get_by_role("link", name="Unpublish", exact=True).click()
 
         if confirm:
             # Wait for confirmation page to load before clicking confirm button
             confirm_button = self.page.get_by_role("button", name="Yes, unpublish")
-            confirm_button.wait_for(state="visible", timeout=10000)
+            confirm_button.wait_for(
+                state="visible", timeout=self.DEFAULT_NAV_TIMEOUT_MS
+            )
             confirm_button.click()
         self.wait_for_navigation()
 
+    # =========================================================================
+    # Editor actions
+    # =========================================================================
+
+    def open_promote_tab(self) -> None:
+        """Switch the page editor to the Promote tab."""
+        self._promote_tab.click()
+
+    def save_draft(self, wait: bool = True) -> None:
+        """
+        Click the Save draft button in the page editor footer.
+
+        Args:
+            wait: Wait for the resulting navigation to finish. Pass False
+                when the next call waits on its own, such as
+                assert_success_message().
+        """
+        self._save_draft_button.click()
+        if wait:
+            self.wait_for_navigation()
+
     # =========================================================================
     # Page Creation
     # =========================================================================
@@ -755,7 +1108,7 @@ class PageAdminPage(WagtailAdminPage):
         save: bool = True,
         publish: bool = False,
         **fields: str,
-    ) -> None:
+    ) -> int | None:
         """
         Create a child page under a parent.
 
@@ -775,9 +1128,13 @@ class PageAdminPage(WagtailAdminPage):
             **fields: Additional fields to fill (field_id=value).
                 Field IDs should be without the "#" prefix.
 
+        Returns:
+            The ID of the created page, or None if the page was not saved
+            or its ID could not be read from the admin
+
         Example:
             # Create a simple page as draft
-            page_admin.create_child_page(
+            page_id = page_admin.create_child_page(
                 parent_page_id=1,
                 page_type="testapp.TestPage",
                 title="My New Page",
@@ -799,40 +1156,57 @@ class PageAdminPage(WagtailAdminPage):
         app_name, model_name = page_type.split(".")
         model_name = model_name.lower()
 
-        # Navigate to the add page form
+        # Navigate to the add page form. goto() returns after the load
+        # event; the title wait below covers the editor being ready, so
+        # waiting for network idle here would only add idle time
         url = self.add_child_page_url(parent_page_id, app_name, model_name)
         self.goto(url)
-        self.wait_for_navigation()
 
-        # Fill the title field (required)
+        # Wait for the editor form before filling it
         title_input = self.page.locator("#id_title")
-        title_input.wait_for(state="visible", timeout=10000)
-        title_input.fill(title)
+        title_input.wait_for(state="visible", timeout=self.DEFAULT_NAV_TIMEOUT_MS)
+
+        # Fill title and slug (both required by Wagtail) in one call; the
+        # slug is set without switching to the Promote tab
+        actual_slug = slug if slug else self._generate_slug(title)
+        self.fill_form({"id_title": title, "id_slug": actual_slug})
 
         # Fill additional fields in Content tab
         for field_id, value in fields.items():
             selector = field_id if field_id.startswith("#") else f"#{field_id}"
             self.page.locator(selector).fill(value)
 
-        # Fill slug in Promote tab (required by Wagtail)
-        actual_slug = slug if slug else self._generate_slug(title)
-        self.page.get_by_role("tab", name="Promote").click()
-        slug_input = self.page.locator("#id_slug")
-        slug_input.wait_for(state="visible", timeout=10000)
-        slug_input.fill(actual_slug)
-
         if save:
             if publish:
                 # Publish is in a dropdown menu - expand it first
-                dropdown_toggle = (
-                    "[data-controller='w-dropdown'] "
-                    "button[data-w-dropdown-target='toggle']"
-                )
-                self.page.locator(dropdown_toggle).click()
+                self._dropdown_toggle.click()
                 self.page.get_by_role("button", name="Publish").click()
             else:
-                self.page.get_by_role("button", name="Save draft").click()
+                self._save_draft_button.click()
             self.wait_for_navigation()
+            return self._created_page_id()
+        return None
+
+    def _created_page_id(self) -> int | None:
+        """
+        Read the ID of a page that was just created.
+
+        Saving a draft redirects to the new page's edit view, so the ID is
+        taken from the URL. Publishing redirects to the parent's listing
+        instead; then the Edit link in the success message is used.
+
+        Returns:
+            The page ID, or None if neither source contains it
+        """
+        match = self._EDIT_PATH_PATTERN.search(urlparse(self.page.url).path)
+        if match is None:
+            link = self.page.locator(self._CREATED_PAGE_EDIT_LINK_SELECTOR).first
+            try:
+                href = link.get_attribute("href", timeout=self.PROBE_TIMEOUT)
+            except PlaywrightTimeoutError:
+                return None
+            match = self._EDIT_PATH_PATTERN.search(href or "")
+        return int(match.group(1)) if match else None
 
     def _generate_slug(self, title: str) -> str:
         """
@@ -844,8 +1218,6 @@ class PageAdminPage(WagtailAdminPage):
         Returns:
             URL-friendly slug
         """
-        import re
-
         slug = title.lower()
         slug = re.sub(r"[^\w\s-]", "", slug)
         slug = re.sub(r"[\s_]+", "-", slug)
@@ -971,17 +1343,28 @@ class BlockPath:
             sf.block(0).fill("Simple block value")
             sf.block(0).struct("title").fill("Struct field value")
         """
-        selector = self._build_value_selector()
-        field = self._helper.page.locator(selector)
+        self._value_field().fill(value)
 
-        if field.count() > 0:
-            field.fill(value)
-        else:
-            # Try textarea for TextBlock, etc.
-            name = selector[1:]  # Remove # prefix to get name
-            textarea = self._helper.page.locator(f"textarea[name='{name}']")
-            if textarea.count() > 0:
-                textarea.fill(value)
+    def fill_struct(self, fields: dict[str, str]) -> None:
+        """
+        Fill several StructBlock fields at this path in one round trip.
+
+        Unlike fill(), this does not auto-wait for the inputs, so use it on
+        forms that are already rendered.
+
+        Args:
+            fields: Mapping of struct field name to value
+
+        Raises:
+            ValueError: If a field is not on the page (e.g. a misspelled
+                field name)
+
+        Example:
+            sf.block(0).item(0).fill_struct({"title": "Card", "url": "/card/"})
+        """
+        prefix = self._id if self._id.endswith("-value") else f"{self._id}-value"
+        values = {f"#{prefix}-{name}": value for name, value in fields.items()}
+        _set_field_values(self._helper.page, values, events=_WIDGET_EVENTS)
 
     def value(self) -> str:
         """
@@ -993,18 +1376,25 @@ class BlockPath:
         Example:
             title = sf.block(0).struct("title").value()
         """
-        selector = self._build_value_selector()
-        field = self._helper.page.locator(selector)
-        if field.count() > 0:
-            return field.input_value()
+        try:
+            return self._value_field().input_value(timeout=self._helper.PROBE_TIMEOUT)
+        except PlaywrightTimeoutError:
+            return ""
 
-        # Try textarea for TextBlock, etc.
-        name = selector[1:]  # Remove # prefix to get name
-        textarea = self._helper.page.locator(f"textarea[name='{name}']")
-        if textarea.count() > 0:
-            return textarea.input_value()
+    @property
+    def locator(self) -> Locator:
+        """
+        Return the Playwright locator of the field holding this path's value.
+
+        Use it with Playwright's auto-retrying assertions, which wait until
+        the field matches, instead of one-shot reads like value() or
+        is_checked().
 
-        return ""
+        Example:
+            expect(sf.block(0).locator).to_have_value("Hello World")
+            expect(sf.block(1).locator).to_be_checked()
+        """
+        return self._value_field()
 
     def click_chooser(self) -> None:
         """
@@ -1017,15 +1407,23 @@ class BlockPath:
             sf.block(0).struct("image").click_chooser()  # Chooser in StructBlock
         """
         container_id = self._id if "-value" in self._id else f"{self._id}-value"
+        page = self._helper.page
 
-        chooser_button = self._helper.page.locator(
-            f"[id^='{container_id}'] .chooser__choose-button, "
+        # Wagtail's chooser widget wraps its input in <div id="{id}-chooser">,
+        # so an exact id lookup avoids scanning every id by prefix
+        chooser_button = page.locator(
+            f"#{container_id}-chooser .chooser__choose-button, "
             f"#panel-child-content-{container_id}-section .chooser__choose-button"
         ).first
+        if chooser_button.count() == 0:
+            # Fall back to a prefix match for choosers with other wrapper ids
+            chooser_button = page.locator(
+                f"[id^='{container_id}'] .chooser__choose-button"
+            ).first
 
         if chooser_button.count() > 0:
             chooser_button.click()
-            self._helper.page.wait_for_timeout(500)
+            self._helper.page.locator(".modal").wait_for(state="visible")
 
     def check(self) -> None:
         """
@@ -1035,7 +1433,7 @@ class BlockPath:
             sf.block(0).check()  # Check the boolean block
         """
         selector = self._build_value_selector()
-        checkbox = self._helper.page.locator(selector)
+        checkbox = self._helper._loc(selector)
         if checkbox.count() > 0:
             checkbox.check()
 
@@ -1047,7 +1445,7 @@ class BlockPath:
             sf.block(0).uncheck()  # Uncheck the boolean block
         """
         selector = self._build_value_selector()
-        checkbox = self._helper.page.locator(selector)
+        checkbox = self._helper._loc(selector)
         if checkbox.count() > 0:
             checkbox.uncheck()
 
@@ -1063,7 +1461,7 @@ class BlockPath:
                 print("Checkbox is checked")
         """
         selector = self._build_value_selector()
-        checkbox = self._helper.page.locator(selector)
+        checkbox = self._helper._loc(selector)
         if checkbox.count() > 0:
             return checkbox.is_checked()
         return False
@@ -1079,7 +1477,7 @@ class BlockPath:
             sf.block(0).select("option1")  # Select by value
         """
         selector = self._build_value_selector()
-        select_elem = self._helper.page.locator(selector)
+        select_elem = self._helper._loc(selector)
         if select_elem.count() > 0:
             select_elem.select_option(value)
 
@@ -1094,7 +1492,7 @@ class BlockPath:
             sf.block(0).select_multiple(["red", "blue"])
         """
         selector = self._build_value_selector()
-        select_elem = self._helper.page.locator(selector)
+        select_elem = self._helper._loc(selector)
         if select_elem.count() > 0:
             select_elem.select_option(values)
 
@@ -1109,7 +1507,7 @@ class BlockPath:
             sf.block(0).set_date("2024-01-15")
         """
         selector = self._build_value_selector()
-        date_input = self._helper.page.locator(selector)
+        date_input = self._helper._loc(selector)
         if date_input.count() > 0:
             date_input.fill(date)
 
@@ -1124,7 +1522,7 @@ class BlockPath:
             sf.block(0).set_time("14:30")
         """
         selector = self._build_value_selector()
-        time_input = self._helper.page.locator(selector)
+        time_input = self._helper._loc(selector)
         if time_input.count() > 0:
             time_input.fill(time)
 
@@ -1143,7 +1541,7 @@ class BlockPath:
         """
         # DateTimeBlock uses a single input with combined datetime value
         selector = self._build_value_selector()
-        datetime_input = self._helper.page.locator(selector)
+        datetime_input = self._helper._loc(selector)
         if datetime_input.count() > 0:
             datetime_input.fill(f"{date} {time}")
 
@@ -1179,8 +1577,9 @@ class BlockPath:
         # Get current block count from the nested StreamBlock
         base_id = self._id if "-value" in self._id else f"{self._id}-value"
         count_input = self._helper.page.locator(f"input[name='{base_id}-count']")
+        has_count_input = count_input.count() > 0
         current_count = 0
-        if count_input.count() > 0:
+        if has_count_input:
             val = count_input.input_value()
             current_count = int(val) if val else 0
 
@@ -1196,13 +1595,19 @@ class BlockPath:
                 add_button = container.locator(".c-sf-add-button").first
                 if add_button.count() > 0:
                     add_button.click()
-                    self._helper.page.wait_for_timeout(200)
-
-                    # Click the block type in the menu using text selector
-                    menu_item = self._helper.page.get_by_text(block_type, exact=True)
+                    self._helper.page.locator(".w-combobox__menu").wait_for(
+                        state="visible"
+                    )
+
+                    # Click the block type by its accessible name in the menu
+                    menu_item = self._helper.page.get_by_role(
+                        "option", name=block_type, exact=True
+                    ).first
                     if menu_item.count() > 0:
-                        menu_item.first.click()
-                        self._helper.page.wait_for_timeout(300)
+                        menu_item.click()
+                        if has_count_input:
+                            expect(count_input).to_have_value(str(current_count + 1))
+                        self._helper.invalidate_cache()
 
         return current_count
 
@@ -1264,7 +1669,9 @@ class BlockPath:
 
         if add_button.count() > 0:
             add_button.click()
-            self._helper.page.wait_for_timeout(300)
+            if count_input.count() > 0:
+                expect(count_input).to_have_value(str(current_count + 1))
+            self._helper.invalidate_cache()
 
         return current_count
 
@@ -1282,11 +1689,23 @@ class BlockPath:
             count_name = f"{self._id}-count"
         else:
             count_name = f"{self._id}-value-count"
-        count_input = self._helper.page.locator(f"input[name='{count_name}']")
-        if count_input.count() > 0:
-            val = count_input.input_value()
-            return int(val) if val else 0
-        return 0
+        count_input = self._helper._loc(f"input[name='{count_name}']")
+        try:
+            val = count_input.input_value(timeout=self._helper.PROBE_TIMEOUT)
+        except PlaywrightTimeoutError:
+            return 0
+        return int(val) if val else 0
+
+    def _value_field(self) -> Locator:
+        """Return the input or TextBlock textarea holding this path's value."""
+        return self._helper._loc(self._value_field_selector()).first
+
+    def _value_field_selector(self) -> str:
+        """Build the selector matching the input or TextBlock textarea."""
+        selector = self._build_value_selector()
+        name = selector[1:]  # Remove # prefix to get name
+        # One selector union covers both, so a single call resolves the field
+        return f"{selector}, textarea[name='{name}']"
 
     def _build_value_selector(self) -> str:
         """Build the CSS selector for the value input."""
@@ -1333,6 +1752,9 @@ class StreamFieldHelper:
         field_name: The name of the StreamField (e.g., "body")
     """
 
+    # Timeout (ms) for read-only probes of inputs that may not exist
+    PROBE_TIMEOUT = 500
+
     def __init__(self, page: Page, field_name: str = "body") -> None:
         """
         Initialize the StreamFieldHelper.
@@ -1343,6 +1765,18 @@ class StreamFieldHelper:
         """
         self.page = page
         self.field_name = field_name
+        self._locator_cache: dict[str, Locator] = {}
+
+    def _loc(self, selector: str) -> Locator:
+        """Return a Locator for selector, reusing one built earlier."""
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self._locator_cache[selector] = self.page.locator(selector)
+        return locator
+
+    def invalidate_cache(self) -> None:
+        """Forget cached Locators after the block structure changes."""
+        self._locator_cache.clear()
 
     def block(self, index: int) -> BlockPath:
         """
@@ -1371,12 +1805,18 @@ class StreamFieldHelper:
         panel = self.page.locator(panel_selector)
         return panel.locator(".c-sf-add-button").last
 
+    @property
+    def _count_input(self) -> Locator:
+        """Return the hidden input holding this StreamField's block count."""
+        return self._loc(f"input[name='{self.field_name}-count']")
+
     def _get_block_count(self) -> int:
         """Get the current number of blocks in the StreamField."""
-        count_input = self.page.locator(f"input[name='{self.field_name}-count']")
-        if count_input.count() == 0:
+        # A single input_value() call instead of count() + input_value()
+        try:
+            value = self._count_input.input_value(timeout=self.PROBE_TIMEOUT)
+        except PlaywrightTimeoutError:
             return 0
-        value = count_input.input_value()
         return int(value) if value else 0
 
     def add_block(self, block_type: str) -> int:
@@ -1399,8 +1839,35 @@ class StreamFieldHelper:
             index = sf.add_block("Heading")
             sf.block(index).fill("My Heading")
         """
-        current_count = self._get_block_count()
+        return self._append_block(block_type, self._get_block_count())
+
+    def add_blocks(self, block_types: list[str]) -> list[int]:
+        """
+        Add several blocks to the StreamField in order.
 
+        Reads the block count once and tracks it locally, instead of
+        re-reading it from the page before every block.
+
+        Args:
+            block_types: Display names of the block types to add
+
+        Returns:
+            list[int]: The indices of the newly added blocks
+
+        Example:
+            sf = StreamFieldHelper(page, "body")
+            heading, quote = sf.add_blocks(["Heading", "Quote"])
+            sf.block(quote).fill("To be or not to be")
+        """
+        count = self._get_block_count()
+        indices = []
+        for block_type in block_types:
+            indices.append(self._append_block(block_type, count))
+            count += 1
+        return indices
+
+    def _append_block(self, block_type: str, current_count: int) -> int:
+        """Append a block, given the block count before the append."""
         add_button = self._get_add_button()
         add_button.click()
 
@@ -1408,9 +1875,11 @@ class StreamFieldHelper:
 
         # Use exact matching to avoid partial matches (e.g., "Section" vs "Hero")
         option = self.page.get_by_role("option", name=block_type, exact=True)
-        option.click()
+        option.first.click()
 
-        self.page.wait_for_timeout(300)
+        # Wait for Wagtail to register the new block instead of sleeping
+        expect(self._count_input).to_have_value(str(current_count + 1))
+        self.invalidate_cache()
 
         return current_count
 
@@ -1423,6 +1892,94 @@ class StreamFieldHelper:
         """
         return self._get_block_count()
 
+    def bulk_fill(self, values: dict[BlockPath, str]) -> None:
+        """
+        Fill several block fields in a single evaluate call.
+
+        Each fill() is a separate browser round trip, so filling a large
+        StreamField one field at a time is dominated by call latency. The
+        selectors are built in Python and every value is set in one go.
+        Unlike fill(), this does not auto-wait for the inputs: add blocks
+        and list items first, then fill them. Meant for CharBlock, TextBlock,
+        URLBlock and other plain inputs; rich text editors need fill().
+
+        Args:
+            values: Mapping of BlockPath to the value to fill
+
+        Raises:
+            ValueError: If a field is not on the page
+
+        Example:
+            sf.bulk_fill({
+                sf.block(0): "My Heading",
+                sf.block(1).struct("title"): "Welcome",
+                sf.block(2).item(0).struct("url"): "https://example.com",
+            })
+        """
+        selectors = {
+            path._value_field_selector(): value for path, value in values.items()
+        }
+        _set_field_values(self.page, selectors, events=_WIDGET_EVENTS)
+
+    _SNAPSHOT_JS = """(fieldName) => {
+        const prefix = `${fieldName}-`;
+        const readValue = (el) => {
+            if (el.type === "checkbox" || el.type === "radio") return el.checked;
+            if (el.multiple) {
+                return Array.from(el.selectedOptions, (option) => option.value);
+            }
+            return el.value;
+        };
+        const snapshot = { count: 0, blocks: [] };
+        const fields = document.querySelectorAll(
+            `input[name^="${prefix}"], textarea[name^="${prefix}"], ` +
+            `select[name^="${prefix}"]`
+        );
+        for (const el of fields) {
+            const rest = el.name.slice(prefix.length);
+            if (rest === "count") {
+                snapshot.count = parseInt(el.value || "0", 10);
+                continue;
+            }
+            const match = rest.match(/^(\\d+)-(.+)$/);
+            if (!match) continue;
+            const index = parseInt(match[1], 10);
+            const block = (snapshot.blocks[index] ??= { values: {} });
+            const key = match[2];
+            if (["type", "id", "order", "deleted"].includes(key)) {
+                block[key] = el.value;
+            } else if (key === "value") {
+                block.value = readValue(el);
+            } else if (key.startsWith("value-")) {
+                block.values[key.slice("value-".length)] = readValue(el);
+            }
+        }
+        snapshot.blocks = Array.from(snapshot.blocks, (b) => b ?? { values: {} });
+        return snapshot;
+    }"""
+
+    def snapshot(self) -> dict:
+        """
+        Read the whole StreamField's form state in a single evaluate call.
+
+        Use this for batch assertions instead of many get_* calls, each of
+        which is a separate browser round-trip.
+
+        Returns:
+            dict: {"count": int, "blocks": [...]} where each block has
+                "type", "id", "order", "deleted", "value" (for simple
+                blocks) and "values" mapping nested field paths below the
+                block value (e.g. "title", "links-0-value-url") to their
+                values.
+
+        Example:
+            snap = sf.snapshot()
+            assert snap["count"] == 2
+            assert snap["blocks"][0]["type"] == "hero"
+            assert snap["blocks"][0]["values"]["title"] == "Welcome"
+        """
+        return self.page.evaluate(self._SNAPSHOT_JS, self.field_name)
+
     def get_block_type(self, index: int) -> str:
         """
         Get the type of a block at the specified index.
@@ -1433,7 +1990,7 @@ class StreamFieldHelper:
         Returns:
             str: The block type identifier (e.g., "heading", "paragraph")
         """
-        type_input = self.page.locator(f"input[name='{self.field_name}-{index}-type']")
+        type_input = self._loc(f"input[name='{self.field_name}-{index}-type']")
         return type_input.input_value()
 
     def is_block_deleted(self, index: int) -> bool:
@@ -1657,14 +2214,14 @@ class StreamFieldHelper:
         image_item = modal.locator(selector).first
         if image_item.count() > 0:
             image_item.click()
-            self.page.wait_for_timeout(300)
+            modal.wait_for(state="hidden")
             return
 
         # 2. PageChooser: a.choose-page[data-title='...']
         page_item = modal.locator(f"a.choose-page[data-title='{title}']").first
         if page_item.count() > 0:
             page_item.click()
-            self.page.wait_for_timeout(300)
+            modal.wait_for(state="hidden")
             return
 
         # 3. SnippetChooser: [data-chooser-modal-choice] with text content
@@ -1674,14 +2231,14 @@ class StreamFieldHelper:
             text = item.text_content()
             if text and title in text.strip():
                 item.click()
-                self.page.wait_for_timeout(300)
+                modal.wait_for(state="hidden")
                 return
 
         # 4. Fallback: try finding by link role with exact name
         link = modal.get_by_role("link", name=title, exact=True).first
         if link.count() > 0:
             link.click()
-            self.page.wait_for_timeout(300)
+            modal.wait_for(state="hidden")
 
     # Legacy methods for backward compatibility
 
@@ -1735,6 +2292,16 @@ class StreamFieldHelper:
         """
         self.block(block_index).item(item_index).struct(field_name).fill(value)
 
+    def fill_list_item_fields(
+        self, block_index: int, item_index: int, fields: dict[str, str]
+    ) -> None:
+        """
+        Fill several fields of a StructBlock inside a ListBlock at once.
+
+        Equivalent to sf.block(index).item(i).fill_struct(fields).
+        """
+        self.block(block_index).item(item_index).fill_struct(fields)
+
     def get_list_item_field_value(
         self, block_index: int, item_index: int, field_name: str
     ) -> str:
@@ -5,19 +5,31 @@ Provides factory base classes and helper functions.
 """
 
 from wagtail_scenario_test.utils.factories import (
+    DEFAULT_PASSWORD,
     WagtailSuperUserFactory,
     WagtailUserFactory,
+    fast_password_hasher,
 )
 from wagtail_scenario_test.utils.video import (
     convert_all_videos_to_gif,
+    convert_all_videos_to_gif_async,
     convert_video_to_gif,
+    convert_video_to_gif_async,
+    convert_video_to_gif_with_palette,
+    generate_palette,
     is_ffmpeg_available,
 )
 
 __all__ = [
+    "DEFAULT_PASSWORD",
     "WagtailUserFactory",
     "WagtailSuperUserFactory",
+    "fast_password_hasher",
     "convert_video_to_gif",
     "convert_all_videos_to_gif",
+    "convert_video_to_gif_async",
+    "convert_all_videos_to_gif_async",
+    "convert_video_to_gif_with_palette",
+    "generate_palette",
     "is_ffmpeg_available",
 ]
@@ -13,8 +13,55 @@ Example:
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
+
 import factory
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.test import override_settings
+
+# Resolved once; factory subclasses inherit it through Meta
+UserModel = get_user_model()
+
+# Raw password of factory users created without an explicit password
+DEFAULT_PASSWORD = "password123"
+
+
+@cache
+def _hash_password(raw_password: str, hasher: str) -> str:
+    """Hash a password once per (password, hasher) pair."""
+    return make_password(raw_password)
+
+
+@contextmanager
+def fast_password_hasher() -> Iterator[None]:
+    """
+    Use Django's MD5 password hasher for the duration of the block.
+
+    MD5 is insecure but orders of magnitude faster than PBKDF2, which
+    matters for suites that create many users or call set_password()
+    directly. Only use it in tests.
+
+    Example:
+        @pytest.fixture(autouse=True)
+        def _fast_passwords():
+            with fast_password_hasher():
+                yield
+    """
+    with override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+    ):
+        yield
+
+
+def _hashed_password(raw_password: str) -> str:
+    """Return a cached hash of raw_password for the active password hasher."""
+    # Keyed on the hasher so overriding PASSWORD_HASHERS never reuses a
+    # hash the new settings cannot verify
+    return _hash_password(raw_password, settings.PASSWORD_HASHERS[0])
 
 
 class WagtailUserFactory(factory.django.DjangoModelFactory):
@@ -24,27 +71,78 @@ class WagtailUserFactory(factory.django.DjangoModelFactory):
     Note: This creates inactive users by default. For admin users,
     use WagtailSuperUserFactory.
 
+    Passwords are hashed once per distinct raw password and stored in the
+    initial INSERT, so creating many users does not rerun the (deliberately
+    slow) password hasher each time. An explicit password is also applied
+    when the username already exists.
+
     Example:
         user = WagtailUserFactory()
         user = WagtailUserFactory(username="custom_user")
+        user = WagtailUserFactory(password="secret")
+        users = WagtailUserFactory.bulk(20)
+        page.get_by_label("Password").fill(DEFAULT_PASSWORD)
     """
 
     class Meta:
-        model = get_user_model()
+        model = UserModel
         django_get_or_create = ("username",)
-        skip_postgeneration_save = True
 
     username = factory.Sequence(lambda n: f"user{n}")
     email = factory.LazyAttribute(lambda obj: f"{obj.username}@example.com")
     is_active = True
-
-    @factory.post_generation
-    def password(self, create: bool, extracted: str | None, **kwargs: object) -> None:
-        """Set password after user creation."""
-        password = extracted or "password123"
-        self.set_password(password)  # type: ignore[attr-defined]
-        if create:
-            self.save()  # type: ignore[attr-defined]
+    password = None
+
+    @classmethod
+    def _adjust_kwargs(cls, **kwargs: object) -> dict[str, object]:
+        """Replace the raw password with its (cached) hash."""
+        raw_password = kwargs.get("password") or DEFAULT_PASSWORD
+        kwargs["password"] = _hashed_password(str(raw_password))
+        return kwargs
+
+    @classmethod
+    def _get_or_create(cls, model_class, *args: object, **kwargs: object):
+        """Get or create the user, applying an explicit password to existing ones."""
+        user = super()._get_or_create(model_class, *args, **kwargs)
+        # get_or_create() ignores its defaults for an existing username, so
+        # write an explicitly passed password with a single UPDATE
+        explicit = (cls._original_params or {}).get("password")
+        if explicit and user.password != kwargs["password"]:
+            user.password = kwargs["password"]
+            cls._get_manager(model_class).filter(pk=user.pk).update(
+                password=user.password
+            )
+        return user
+
+    @classmethod
+    def bulk(cls, n: int, **kwargs: object) -> list:
+        """
+        Create n users with a single INSERT.
+
+        Instances are built with the factory's declarations (so subclasses
+        keep their username prefix and flags) and saved through
+        bulk_create(). Usernames that already exist are skipped rather than
+        duplicated, mirroring django_get_or_create, and the saved rows are
+        read back in one query so every returned user has a primary key.
+
+        Args:
+            n: Number of users to create
+            **kwargs: Field overrides applied to every user
+
+        Returns:
+            list: The users, in creation order
+
+        Example:
+            users = WagtailUserFactory.bulk(50)
+            admins = WagtailSuperUserFactory.bulk(3, password="secret")
+        """
+        users = cls.build_batch(n, **kwargs)
+        manager = cls._meta.model._default_manager
+        manager.bulk_create(users, ignore_conflicts=True)
+        saved = manager.in_bulk(
+            [user.username for user in users], field_name="username"
+        )
+        return [saved[user.username] for user in users]
 
 
 class WagtailSuperUserFactory(WagtailUserFactory):
@@ -7,17 +7,32 @@ to GIF format for easier sharing and documentation.
 
 from __future__ import annotations
 
+import asyncio
+import os
 import shutil
 import subprocess
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 
 if TYPE_CHECKING:
     pass
 
+# Maximum time (seconds) a single ffmpeg invocation may run
+FFMPEG_TIMEOUT = 120
 
+
+@cache
 def is_ffmpeg_available() -> bool:
-    """Check if ffmpeg is available on the system."""
+    """
+    Check if ffmpeg is available on the system.
+
+    The PATH lookup runs once per process; call
+    is_ffmpeg_available.cache_clear() after installing ffmpeg at runtime.
+    """
     return shutil.which("ffmpeg") is not None
 
 
@@ -27,6 +42,10 @@ def convert_video_to_gif(
     fps: int = 10,
     width: int = 800,
     delete_original: bool = False,
+    threads: int | None = None,
+    incremental: bool = False,
+    capture_logs: bool = False,
+    scale_flags: str | None = None,
 ) -> Path | None:
     """
     Convert a video file to GIF format using ffmpeg.
@@ -37,6 +56,15 @@ def convert_video_to_gif(
         fps: Frames per second for the GIF (lower = smaller file). Default: 10
         width: Width of the GIF in pixels (height auto-scaled). Default: 800
         delete_original: Whether to delete the original video after conversion.
+        threads: Threads ffmpeg may use for filtering and encoding.
+            Defaults to the number of CPUs.
+        incremental: Skip ffmpeg when the GIF already exists and is newer
+            than the video.
+        capture_logs: Write ffmpeg's log output next to the GIF (as
+            <name>.ffmpeg.log) instead of discarding it.
+        scale_flags: ffmpeg scaler algorithm (e.g. "lanczos", "bilinear").
+            Defaults to "bilinear" up to 800px wide, where it looks the same
+            as "lanczos" at a fraction of the cost, and "lanczos" above.
 
     Returns:
         Path to the created GIF, or None if conversion failed.
@@ -45,6 +73,139 @@ def convert_video_to_gif(
         >>> convert_video_to_gif("test-results/video.webm")
         PosixPath('test-results/video.gif')
     """
+    plan = _plan_gif_conversion(
+        video_path, output_path, fps, width, threads, incremental, scale_flags
+    )
+    if plan is None:
+        return None
+    cmd, video_path, output_path = plan
+    if cmd is not None and not _run_ffmpeg(cmd, _log_path(output_path, capture_logs)):
+        return None
+    return _finish_conversion(video_path, output_path, delete_original)
+
+
+async def convert_video_to_gif_async(
+    video_path: str | Path,
+    output_path: str | Path | None = None,
+    fps: int = 10,
+    width: int = 800,
+    delete_original: bool = False,
+    threads: int | None = None,
+    incremental: bool = False,
+    capture_logs: bool = False,
+    scale_flags: str | None = None,
+) -> Path | None:
+    """
+    Convert a video file to GIF format without blocking the event loop.
+
+    Async counterpart of convert_video_to_gif(), for callers that already
+    run inside an event loop (e.g. async Playwright tests). Takes the same
+    arguments and returns the same result.
+
+    Example:
+        >>> await convert_video_to_gif_async("test-results/video.webm")
+        PosixPath('test-results/video.gif')
+    """
+    plan = _plan_gif_conversion(
+        video_path, output_path, fps, width, threads, incremental, scale_flags
+    )
+    if plan is None:
+        return None
+    cmd, video_path, output_path = plan
+    log_path = _log_path(output_path, capture_logs)
+    if cmd is not None and not await _run_ffmpeg_async(cmd, log_path):
+        return None
+    return _finish_conversion(video_path, output_path, delete_original)
+
+
+def generate_palette(
+    video_path: str | Path,
+    palette_path: str | Path,
+    fps: int = 10,
+    width: int = 800,
+    threads: int | None = None,
+    scale_flags: str | None = None,
+) -> Path | None:
+    """
+    Generate a GIF colour palette PNG from a video using ffmpeg.
+
+    Args:
+        video_path: Path to the video to sample colours from
+        palette_path: Path for the output palette PNG
+        fps: Frames per second, matching the later GIF conversion
+        width: Width in pixels, matching the later GIF conversion
+        threads: Threads ffmpeg may use for filtering and encoding.
+            Defaults to the number of CPUs.
+        scale_flags: ffmpeg scaler algorithm (e.g. "lanczos", "bilinear").
+            Defaults to "bilinear" up to 800px wide, where it looks the same
+            as "lanczos" at a fraction of the cost, and "lanczos" above.
+
+    Returns:
+        Path to the palette, or None if generation failed.
+    """
+    if not is_ffmpeg_available():
+        return None
+
+    video_path = Path(video_path)
+    palette_path = Path(palette_path)
+    if not video_path.exists():
+        return None
+
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-i",
+        str(video_path),
+        *_thread_args(threads),
+        "-vf",
+        f"{_scale_filter(fps, width, scale_flags)},palettegen",
+        str(palette_path),
+    ]
+
+    if not _run_ffmpeg(cmd) or not palette_path.exists():
+        return None
+    return palette_path
+
+
+def convert_video_to_gif_with_palette(
+    video_path: str | Path,
+    palette_path: str | Path,
+    output_path: str | Path | None = None,
+    fps: int = 10,
+    width: int = 800,
+    delete_original: bool = False,
+    threads: int | None = None,
+    incremental: bool = False,
+    capture_logs: bool = False,
+    scale_flags: str | None = None,
+) -> Path | None:
+    """
+    Convert a video file to GIF format using a pre-generated palette.
+
+    Skips the per-video palettegen pass, which is a large share of the
+    conversion time. Colours degrade when the video looks very different
+    from the one the palette was generated from.
+
+    Args:
+        video_path: Path to the input video file (webm, mp4, etc.)
+        palette_path: Palette PNG created by generate_palette()
+        output_path: Path for the output GIF. Defaults to same name with .gif.
+        fps: Frames per second for the GIF. Default: 10
+        width: Width of the GIF in pixels (height auto-scaled). Default: 800
+        delete_original: Whether to delete the original video after conversion.
+        threads: Threads ffmpeg may use for filtering and encoding.
+            Defaults to the number of CPUs.
+        incremental: Skip ffmpeg when the GIF already exists and is newer
+            than the video.
+        capture_logs: Write ffmpeg's log output next to the GIF (as
+            <name>.ffmpeg.log) instead of discarding it.
+        scale_flags: ffmpeg scaler algorithm (e.g. "lanczos", "bilinear").
+            Defaults to "bilinear" up to 800px wide, where it looks the same
+            as "lanczos" at a fraction of the cost, and "lanczos" above.
+
+    Returns:
+        Path to the created GIF, or None if conversion failed.
+    """
     if not is_ffmpeg_available():
         return None
 
@@ -57,35 +218,204 @@ def convert_video_to_gif(
     else:
         output_path = Path(output_path)
 
-    # ffmpeg command to convert video to GIF with good quality
-    # Uses palette generation for better colors
+    if incremental and _is_up_to_date(video_path, output_path):
+        return _finish_conversion(video_path, output_path, delete_original)
+
     cmd = [
+        "ffmpeg",
+        "-y",
+        "-i",
+        str(video_path),
+        "-i",
+        str(palette_path),
+        *_thread_args(threads),
+        "-lavfi",
+        f"{_scale_filter(fps, width, scale_flags)}[x];[x][1:v]paletteuse",
+        "-loop",
+        "0",
+        str(output_path),
+    ]
+
+    if not _run_ffmpeg(cmd, _log_path(output_path, capture_logs)):
+        return None
+
+    return _finish_conversion(video_path, output_path, delete_original)
+
+
+def _scale_filter(fps: int, width: int, scale_flags: str | None = None) -> str:
+    """Return the ffmpeg frame-rate and scaling filter shared by all passes."""
+    if scale_flags is None:
+        # Playwright records at most 800px wide by default, so a cheap
+        # 2-tap kernel is indistinguishable from lanczos at these sizes
+        scale_flags = "bilinear" if width <= 800 else "lanczos"
+    return f"fps={fps},scale={width}:-1:flags={scale_flags}"
+
+
+@lru_cache(maxsize=16)
+def _palette_filter(fps: int, width: int, scale_flags: str | None = None) -> str:
+    """Return the single-pass palettegen/paletteuse filter graph."""
+    # Batch conversions reuse the same (fps, width) for every file
+    return (
+        f"{_scale_filter(fps, width, scale_flags)},split[s0][s1];"
+        "[s0]palettegen[p];[s1][p]paletteuse"
+    )
+
+
+def _thread_args(threads: int | None) -> list[str]:
+    """Return ffmpeg options that let one job use the given number of threads."""
+    # Without these ffmpeg picks conservative defaults for the filter graph,
+    # leaving cores idle during palettegen/paletteuse
+    count = str(threads or os.cpu_count() or 1)
+    return [
+        "-threads",
+        count,
+        "-filter_threads",
+        count,
+        "-filter_complex_threads",
+        count,
+    ]
+
+
+def _gif_command(
+    video_path: Path,
+    output_path: Path,
+    fps: int,
+    width: int,
+    threads: int | None,
+    scale_flags: str | None,
+) -> list[str]:
+    """Build the single-pass ffmpeg command for convert_video_to_gif()."""
+    # Uses palette generation for better colors
+    return [
         "ffmpeg",
         "-y",  # Overwrite output file
         "-i",
         str(video_path),
+        *_thread_args(threads),
         "-vf",
-        f"fps={fps},scale={width}:-1:flags=lanczos,split[s0][s1];"
-        "[s0]palettegen[p];[s1][p]paletteuse",
+        _palette_filter(fps, width, scale_flags),
         "-loop",
         "0",  # Loop forever
         str(output_path),
     ]
 
+
+def _plan_gif_conversion(
+    video_path: str | Path,
+    output_path: str | Path | None,
+    fps: int,
+    width: int,
+    threads: int | None,
+    incremental: bool,
+    scale_flags: str | None,
+) -> tuple[list[str] | None, Path, Path] | None:
+    """
+    Resolve the paths and ffmpeg command for convert_video_to_gif().
+
+    Returns:
+        (cmd, video_path, output_path), with cmd None when the GIF is
+        already up to date, or None if the video cannot be converted.
+    """
+    if not is_ffmpeg_available():
+        return None
+
+    video_path = Path(video_path)
+    if not video_path.exists():
+        return None
+
+    if output_path is None:
+        output_path = video_path.with_suffix(".gif")
+    else:
+        output_path = Path(output_path)
+
+    if incremental and _is_up_to_date(video_path, output_path):
+        return None, video_path, output_path
+
+    cmd = _gif_command(video_path, output_path, fps, width, threads, scale_flags)
+    return cmd, video_path, output_path
+
+
+def _batch_concurrency(max_workers: int | None, video_count: int) -> tuple[int, int]:
+    """Return (concurrent ffmpeg jobs, threads per job) for a batch."""
+    cpu_count = os.cpu_count() or 1
+    if max_workers is None:
+        max_workers = cpu_count
+    max_workers = max(1, min(max_workers, video_count))
+    # Split the cores between concurrent jobs instead of oversubscribing
+    return max_workers, max(1, cpu_count // max_workers)
+
+
+def _log_path(output_path: Path, capture_logs: bool) -> Path | None:
+    """Return where to write ffmpeg's log for output_path, if requested."""
+    return output_path.with_suffix(".ffmpeg.log") if capture_logs else None
+
+
+@contextmanager
+def _ffmpeg_stderr(log_path: Path | None) -> Iterator[IO[bytes] | int]:
+    """Yield the stderr target for ffmpeg: a log file or DEVNULL."""
+    # ffmpeg writes progress for every frame; piping it into Python memory
+    # just to discard it wastes RAM on long recordings
+    if log_path is None:
+        yield subprocess.DEVNULL
+        return
+    with open(log_path, "wb") as log_file:
+        yield log_file
+
+
+def _run_ffmpeg(cmd: list[str], log_path: Path | None = None) -> bool:
+    """Run an ffmpeg command, returning whether it succeeded."""
     try:
-        subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            timeout=120,  # 2 minute timeout
-        )
+        with _ffmpeg_stderr(log_path) as stderr:
+            subprocess.run(
+                cmd,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr,
+                timeout=FFMPEG_TIMEOUT,
+            )
     except (
         subprocess.CalledProcessError,
         subprocess.TimeoutExpired,
         FileNotFoundError,
     ):
-        return None
+        return False
+    return True
 
+
+async def _run_ffmpeg_async(cmd: list[str], log_path: Path | None = None) -> bool:
+    """Run an ffmpeg command asynchronously, returning whether it succeeded."""
+    # Never PIPE: an unread pipe could fill up and stall ffmpeg
+    with _ffmpeg_stderr(log_path) as stderr:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=stderr,
+            )
+        except FileNotFoundError:
+            return False
+
+        try:
+            returncode = await asyncio.wait_for(proc.wait(), timeout=FFMPEG_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False
+    return returncode == 0
+
+
+def _is_up_to_date(video_path: Path, output_path: Path) -> bool:
+    """Return True if output_path exists and is not older than video_path."""
+    try:
+        return output_path.stat().st_mtime >= video_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def _finish_conversion(
+    video_path: Path, output_path: Path, delete_original: bool
+) -> Path | None:
+    """Return the GIF path if it was written, deleting the video if asked."""
     if output_path.exists():
         if delete_original:
             video_path.unlink()
@@ -99,32 +429,143 @@ def convert_all_videos_to_gif(
     fps: int = 10,
     width: int = 800,
     delete_originals: bool = False,
+    max_workers: int | None = None,
+    shared_palette: str | Path | None = None,
+    incremental: bool = True,
+    scale_flags: str | None = None,
 ) -> list[Path]:
     """
     Convert all video files in a directory to GIF format.
 
+    Videos are converted in parallel. Each conversion runs in its own
+    ffmpeg process, so a thread pool is enough to keep every core busy.
+
     Args:
         directory: Directory containing video files
         fps: Frames per second for GIFs
         width: Width of GIFs in pixels
         delete_originals: Whether to delete original videos after conversion
+        max_workers: Maximum number of concurrent ffmpeg processes.
+            Defaults to the number of CPUs.
+        shared_palette: Path for a palette PNG generated once from the
+            first video and reused for every GIF. Much faster for similar
+            recordings (e.g. the same admin screens), but colours suffer
+            when the videos look very different. Falls back to per-video
+            palettes if the palette cannot be generated.
+        incremental: Skip videos whose GIF is already newer than the video,
+            so repeated runs only convert new recordings.
+        scale_flags: ffmpeg scaler algorithm; see convert_video_to_gif().
 
     Returns:
         List of paths to created GIF files
     """
     directory = Path(directory)
-    if not directory.exists():
+    if not directory.exists() or not is_ffmpeg_available():
+        return []
+
+    video_files = list(directory.rglob("*.webm"))
+    if not video_files:
         return []
 
-    gifs = []
-    for video_file in directory.rglob("*.webm"):
-        gif_path = convert_video_to_gif(
+    max_workers, threads = _batch_concurrency(max_workers, len(video_files))
+
+    palette = None
+    if shared_palette is not None:
+        # Sample the palette from a video that will actually be converted
+        pending = [
+            video_file
+            for video_file in video_files
+            if not (
+                incremental
+                and _is_up_to_date(video_file, video_file.with_suffix(".gif"))
+            )
+        ]
+        if pending:
+            palette = generate_palette(
+                pending[0],
+                shared_palette,
+                fps=fps,
+                width=width,
+                scale_flags=scale_flags,
+            )
+
+    def convert(video_file: Path) -> Path | None:
+        if palette is not None:
+            return convert_video_to_gif_with_palette(
+                video_file,
+                palette,
+                fps=fps,
+                width=width,
+                delete_original=delete_originals,
+                threads=threads,
+                incremental=incremental,
+                scale_flags=scale_flags,
+            )
+        return convert_video_to_gif(
             video_file,
             fps=fps,
             width=width,
             delete_original=delete_originals,
+            threads=threads,
+            incremental=incremental,
+            scale_flags=scale_flags,
         )
-        if gif_path:
-            gifs.append(gif_path)
 
-    return gifs
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [gif for gif in executor.map(convert, video_files) if gif]
+
+
+async def convert_all_videos_to_gif_async(
+    directory: str | Path,
+    fps: int = 10,
+    width: int = 800,
+    delete_originals: bool = False,
+    max_workers: int | None = None,
+    incremental: bool = True,
+    scale_flags: str | None = None,
+) -> list[Path]:
+    """
+    Convert all video files in a directory to GIF format asynchronously.
+
+    Async counterpart of convert_all_videos_to_gif(). Conversions run as
+    concurrent ffmpeg processes, bounded by a semaphore.
+
+    Args:
+        directory: Directory containing video files
+        fps: Frames per second for GIFs
+        width: Width of GIFs in pixels
+        delete_originals: Whether to delete original videos after conversion
+        max_workers: Maximum number of concurrent ffmpeg processes.
+            Defaults to the number of CPUs.
+        incremental: Skip videos whose GIF is already newer than the video,
+            so repeated runs only convert new recordings.
+        scale_flags: ffmpeg scaler algorithm; see convert_video_to_gif().
+
+    Returns:
+        List of paths to created GIF files
+    """
+    directory = Path(directory)
+    if not directory.exists() or not is_ffmpeg_available():
+        return []
+
+    video_files = list(directory.rglob("*.webm"))
+    if not video_files:
+        return []
+
+    max_workers, threads = _batch_concurrency(max_workers, len(video_files))
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def convert(video_file: Path) -> Path | None:
+        async with semaphore:
+            return await convert_video_to_gif_async(
+                video_file,
+                fps=fps,
+                width=width,
+                delete_original=delete_originals,
+                threads=threads,
+                incremental=incremental,
+                scale_flags=scale_flags,
+            )
+
+    results = await asyncio.gather(*(convert(video_file) for video_file in video_files))
+    return [gif for gif in results if gif]
@@ -1,9 +1,40 @@
 """Pytest configuration for wagtail-scenario-test tests."""
 
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from wagtail_scenario_test.page_objects.wagtail_admin import WagtailAdminPage
+
+# Show pytest's detailed assertion diffs for the shared helpers too
+pytest.register_assert_rewrite("tests.helpers")
+
+# Actions fail fast instead of after Playwright's 30s default
+E2E_ACTION_TIMEOUT_MS = 5000
+
+# Injected into every document so transitions and animations end instantly
+_DISABLE_MOTION_JS = """
+addEventListener("DOMContentLoaded", () => {
+    const style = document.createElement("style");
+    style.textContent = "*, *::before, *::after "
+        + "{ animation: none !important; transition: none !important; }";
+    document.head.appendChild(style);
+});
+"""
+
+
+def pytest_configure(config):
+    """Keep the test database at a stable path when it is reused."""
+    if config.getoption("reuse_db", False) and not os.environ.get(
+        "WAGTAIL_SCENARIO_TEST_DB"
+    ):
+        from django.conf import settings
+
+        from tests.settings import REUSABLE_TEST_DB_NAME
+
+        settings.DATABASES["default"]["TEST"]["NAME"] = REUSABLE_TEST_DB_NAME
+
 
 @pytest.fixture
 def mock_playwright_expect():
@@ -18,21 +49,18 @@ def mock_playwright_expect():
             yield mock_expect
 
 
-@pytest.fixture
-def mock_page():
-    """Create a mock Playwright page for unit testing."""
-    from unittest.mock import MagicMock
-
-    page = MagicMock()
+def _wire_mock_page(page: MagicMock, locator: MagicMock) -> None:
+    """Configure the default return values of the mock page graph."""
     page.url = "http://localhost:8000/admin/"
 
     # Mock locator chain
-    locator = MagicMock()
     locator.count.return_value = 1
     locator.first = locator
+    locator.filter.return_value = locator
     locator.all.return_value = [locator]
     locator.text_content.return_value = "Test Item"
     locator.inner_text.return_value = "Page content"
+    locator.get_attribute.return_value = None
     page.locator.return_value = locator
 
     # Mock get_by_* methods
@@ -41,12 +69,23 @@ def mock_page():
     page.get_by_text.return_value = locator
     page.get_by_placeholder.return_value = locator
 
+    # Mock evaluate (e.g. fill_form reports no missing fields)
+    page.evaluate.return_value = []
+
     # Mock content
     page.content.return_value = "<html><body>Test</body></html>"
 
     # Mock screenshot
     page.screenshot.return_value = b"fake-screenshot-data"
 
+
+@pytest.fixture
+def mock_page():
+    """Create a mock Playwright page for unit testing."""
+    # A fresh graph per test: reset_mock() would keep plain attributes and
+    # children a previous test assigned, making results depend on test order
+    page = MagicMock()
+    _wire_mock_page(page, MagicMock())
     return page
 
 
@@ -56,6 +95,44 @@ def test_url():
     return "http://localhost:8000"
 
 
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args):
+    """
+    Extend pytest-playwright's browser launch arguments for E2E tests.
+
+    /dev/shm is small in CI containers, so Chromium writes shared memory
+    to /tmp instead; the GPU is never used by the headless runs.
+    """
+    args = [*browser_type_launch_args.get("args", [])]
+    args += ["--disable-dev-shm-usage", "--disable-gpu"]
+    return {**browser_type_launch_args, "args": args}
+
+
+@pytest.fixture
+def page(page):
+    """
+    Return pytest-playwright's page tuned for this suite's E2E tests.
+
+    Image, font and media requests are aborted, static files are replayed
+    from an in-process cache, CSS motion is disabled and actions time out
+    after E2E_ACTION_TIMEOUT_MS. Navigations keep the admin page objects'
+    navigation budget.
+    """
+    admin = WagtailAdminPage(page, "")
+    admin.block_heavy_resources()
+    admin.cache_static_assets()
+    page.add_init_script(_DISABLE_MOTION_JS)
+    page.set_default_timeout(E2E_ACTION_TIMEOUT_MS)
+    page.set_default_navigation_timeout(WagtailAdminPage.DEFAULT_NAV_TIMEOUT_MS)
+    return page
+
+
+@pytest.fixture
+def authenticated_start_path():
+    """Skip the dashboard load: every E2E test navigates on its own."""
+    return None
+
+
 # Override pytest-base-url's base_url fixture to avoid conflicts
 @pytest.fixture(scope="session")
 def base_url():
@@ -96,3 +173,54 @@ def test_related_page(db, home_page):
     )
     home_page.add_child(instance=page)
     return page
+
+
+def _add_page_url(parent, model_name):
+    """Return the admin path for adding a testapp page under parent."""
+    from django.urls import reverse
+
+    return reverse("wagtailadmin_pages:add", args=("testapp", model_name, parent.id))
+
+
+@pytest.fixture
+def streamfield_add_url(home_page):
+    """
+    Return the admin path for adding a StreamFieldPage under the home page.
+
+    Function-scoped: transactional tests flush the tables, so the home page
+    gets a new ID in every test.
+    """
+    return _add_page_url(home_page, "streamfieldpage")
+
+
+@pytest.fixture
+def advanced_add_url(home_page):
+    """Return the admin path for adding an AdvancedStreamFieldPage under home."""
+    return _add_page_url(home_page, "advancedstreamfieldpage")
+
+
+@pytest.fixture
+def create_test_page(db):
+    """
+    Return a factory that creates a TestPage directly through the ORM.
+
+    Use it for pages that are only setup for the behavior under test, so
+    the test does not pay for the admin create-page flow.
+
+    Returns:
+        Callable: ``create_test_page(parent, title, slug, publish=False)``
+        returning the saved TestPage
+    """
+    from tests.testapp.models import TestPage
+
+    def factory(parent, title, slug, publish=False):
+        page = parent.add_child(instance=TestPage(title=title, slug=slug, live=False))
+        # Save a revision like the admin does, so drafts and published
+        # pages look the same as ones created through the UI
+        revision = page.save_revision()
+        if publish:
+            revision.publish()
+            page.refresh_from_db()
+        return page
+
+    return factory
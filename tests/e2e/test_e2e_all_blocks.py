@@ -1,580 +1,195 @@
-"""E2E tests for all StreamField block types."""
+"""E2E tests for all StreamField block types.
 
-import pytest
-
-from wagtail_scenario_test import PageAdminPage, StreamFieldHelper
-
-
-@pytest.mark.e2e
-@pytest.mark.django_db(transaction=True)
-class TestTextInputBlocksE2E:
-    """E2E tests for text input block types."""
-
-    def test_char_block(self, authenticated_page, server_url, home_page):
-        """Test CharBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Char Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Char Block")
-        sf.block(index).fill("Hello World")
-
-        assert sf.block(index).value() == "Hello World"
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("char-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="Char Block Test")
-        assert created_page.body[0].block_type == "char"
-        assert created_page.body[0].value == "Hello World"
-
-    def test_email_block(self, authenticated_page, server_url, home_page):
-        """Test EmailBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Email Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Email Block")
-        sf.block(index).fill("test@example.com")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("email-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
+Input tests are parametrized over the block matrix and only read the typed
+values back from the form. Persistence is covered by a single roundtrip
+test that fills every block type on one page and saves it once.
+"""
 
-        from tests.testapp.models import AllBlockTypesPage
+from datetime import date, time
+from decimal import Decimal
 
-        created_page = AllBlockTypesPage.objects.get(title="Email Block Test")
-        assert created_page.body[0].block_type == "email"
-        assert created_page.body[0].value == "test@example.com"
-
-    def test_url_block(self, authenticated_page, server_url, home_page):
-        """Test URLBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("URL Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("URL Block")
-        sf.block(index).fill("https://example.com")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("url-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="URL Block Test")
-        assert created_page.body[0].block_type == "url"
-        assert created_page.body[0].value == "https://example.com"
-
-    def test_regex_block(self, authenticated_page, server_url, home_page):
-        """Test RegexBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Regex Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Regex Block (3 uppercase)")
-        sf.block(index).fill("ABC")
+import pytest
+from playwright.sync_api import expect
 
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("regex-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
+from tests.testapp.models import AllBlockTypesPage
+from wagtail_scenario_test import PageAdminPage, StreamFieldHelper
 
-        from tests.testapp.models import AllBlockTypesPage
 
-        created_page = AllBlockTypesPage.objects.get(title="Regex Block Test")
-        assert created_page.body[0].block_type == "regex"
-        assert created_page.body[0].value == "ABC"
+@pytest.fixture
+def add_page_form(authenticated_page, server_url, home_page):
+    """Return a PageAdminPage on a fresh AllBlockTypesPage add form."""
+    page_admin = PageAdminPage(authenticated_page, server_url)
+    # goto() already waits for the load event, which runs the StreamField
+    # scripts; waiting for network idle on top only adds idle time
+    page_admin.goto(
+        page_admin.add_child_page_url(home_page.id, "testapp", "allblocktypespage")
+    )
+    return page_admin
+
+
+def _save_draft(page_admin, title, slug):
+    """Set the title and slug, then save the page as a draft."""
+    page_admin.fill_form({"id_title": title, "id_slug": slug})
+    page_admin.save_draft(wait=False)
+
+
+# (label, block_type, typed text, stored value) for blocks filled as text
+FILL_CASES = [
+    ("Char Block", "char", "Hello World", "Hello World"),
+    ("Email Block", "email", "test@example.com", "test@example.com"),
+    ("URL Block", "url", "https://example.com", "https://example.com"),
+    ("Regex Block (3 uppercase)", "regex", "ABC", "ABC"),
+    ("Integer Block", "integer", "42", 42),
+    ("Float Block", "float", "3.14", 3.14),
+    ("Decimal Block", "decimal", "99.99", Decimal("99.99")),
+    (
+        "Raw HTML Block",
+        "rawhtml",
+        "<p>Hello <strong>World</strong></p>",
+        "<p>Hello <strong>World</strong></p>",
+    ),
+    ("Block Quote", "blockquote", "To be or not to be", "To be or not to be"),
+]
+
+# (label, BlockPath setter, setter args, resulting form value)
+SETTER_CASES = [
+    ("Date Block", "set_date", ("2024-06-15",), "2024-06-15"),
+    ("Time Block", "set_time", ("14:30",), "14:30"),
+    ("DateTime Block", "set_datetime", ("2024-06-15", "14:30"), "2024-06-15 14:30"),
+    ("Choice Block", "select", ("option2",), "option2"),
+]
 
 
 @pytest.mark.e2e
 @pytest.mark.django_db(transaction=True)
-class TestNumericBlocksE2E:
-    """E2E tests for numeric block types."""
-
-    def test_integer_block(self, authenticated_page, server_url, home_page):
-        """Test IntegerBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Integer Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Integer Block")
-        sf.block(index).fill("42")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("integer-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="Integer Block Test")
-        assert created_page.body[0].block_type == "integer"
-        assert created_page.body[0].value == 42
-
-    def test_float_block(self, authenticated_page, server_url, home_page):
-        """Test FloatBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Float Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Float Block")
-        sf.block(index).fill("3.14")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("float-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="Float Block Test")
-        assert created_page.body[0].block_type == "float"
-        assert created_page.body[0].value == 3.14
-
-    def test_decimal_block(self, authenticated_page, server_url, home_page):
-        """Test DecimalBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Decimal Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Decimal Block")
-        sf.block(index).fill("99.99")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("decimal-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from decimal import Decimal
-
-        from tests.testapp.models import AllBlockTypesPage
+class TestBlockInputE2E:
+    """E2E tests for block inputs, without saving."""
+
+    @pytest.mark.parametrize(
+        "label,typed",
+        [(label, typed) for label, _, typed, _ in FILL_CASES],
+        ids=[block_type for _, block_type, _, _ in FILL_CASES],
+    )
+    def test_fill_block(self, add_page_form, label, typed):
+        """Text typed into a block should be read back from the form."""
+        sf = StreamFieldHelper(add_page_form.page, "body")
+        index = sf.add_block(label)
+        sf.block(index).fill(typed)
+
+        expect(sf.block(index).locator).to_have_value(typed)
+
+    @pytest.mark.parametrize(
+        "label,setter,args,form_value",
+        SETTER_CASES,
+        ids=["date", "time", "datetime", "choice"],
+    )
+    def test_set_block(self, add_page_form, label, setter, args, form_value):
+        """Values set through BlockPath setters should be read back."""
+        sf = StreamFieldHelper(add_page_form.page, "body")
+        index = sf.add_block(label)
+        getattr(sf.block(index), setter)(*args)
+
+        expect(sf.block(index).locator).to_have_value(form_value)
+
+    @pytest.mark.parametrize("checked", [True, False], ids=["checked", "unchecked"])
+    def test_boolean_block(self, add_page_form, checked):
+        """BooleanBlock should report whether it is checked."""
+        sf = StreamFieldHelper(add_page_form.page, "body")
+        index = sf.add_block("Boolean Block")
+        if checked:
+            sf.block(index).check()
 
-        created_page = AllBlockTypesPage.objects.get(title="Decimal Block Test")
-        assert created_page.body[0].block_type == "decimal"
-        assert created_page.body[0].value == Decimal("99.99")
+        expect(sf.block(index).locator).to_be_checked(checked=checked)
 
 
 @pytest.mark.e2e
 @pytest.mark.django_db(transaction=True)
-class TestDateTimeBlocksE2E:
-    """E2E tests for date/time block types."""
-
-    def test_date_block(self, authenticated_page, server_url, home_page):
-        """Test DateBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Date Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Date Block")
-        sf.block(index).set_date("2024-06-15")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("date-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from datetime import date
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="Date Block Test")
-        assert created_page.body[0].block_type == "date"
-        assert created_page.body[0].value == date(2024, 6, 15)
-
-    def test_time_block(self, authenticated_page, server_url, home_page):
-        """Test TimeBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Time Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Time Block")
-        sf.block(index).set_time("14:30")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("time-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from datetime import time
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="Time Block Test")
-        assert created_page.body[0].block_type == "time"
-        assert created_page.body[0].value == time(14, 30)
-
-    def test_datetime_block(self, authenticated_page, server_url, home_page):
-        """Test DateTimeBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("DateTime Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("DateTime Block")
-        sf.block(index).set_datetime("2024-06-15", "14:30")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("datetime-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="DateTime Block Test")
-        assert created_page.body[0].block_type == "datetime"
+class TestAllBlocksRoundtripE2E:
+    """E2E test that saves every block type on one page."""
+
+    def test_all_blocks_roundtrip(self, add_page_form):
+        """Every block type should be saved with the page in a single save."""
+        page_admin = add_page_form
+        sf = StreamFieldHelper(page_admin.page, "body")
+        fill_indices = sf.add_blocks([label for label, _, _, _ in FILL_CASES])
+        for index, (_, _, typed, _) in zip(fill_indices, FILL_CASES, strict=True):
+            sf.block(index).fill(typed)
+
+        date_, time_, datetime_, choice, checked, multiple_choice, embed = (
+            sf.add_blocks(
+                [
+                    "Date Block",
+                    "Time Block",
+                    "DateTime Block",
+                    "Choice Block",
+                    "Boolean Block",
+                    "Multiple Choice Block",
+                    "Embed Block",
+                ]
+            )
+        )
+        sf.block(date_).set_date("2024-06-15")
+        sf.block(time_).set_time("14:30")
+        sf.block(datetime_).set_datetime("2024-06-15", "14:30")
+        sf.block(choice).select("option2")
+        sf.block(checked).check()
+        sf.block(multiple_choice).select_multiple(["red", "blue"])
+        # Embeds resolve through FakeEmbedFinder, so saving never hits the network
+        sf.block(embed).fill("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+
+        nested = sf.add_block("Nested Stream Block")
+        inner = sf.block(nested).add_block("Text")
+        sf.block(nested).block(inner).fill("Nested text content")
+
+        _save_draft(page_admin, "All Blocks Test", "all-blocks-test")
+        page_admin.assert_success_message()
+
+        body = list(AllBlockTypesPage.objects.get(title="All Blocks Test").body)
+        fill_count = len(FILL_CASES)
+        assert [(block.block_type, block.value) for block in body[:fill_count]] == [
+            (block_type, expected) for _, block_type, _, expected in FILL_CASES
+        ]
+
+        rest = body[fill_count:]
+        assert [block.block_type for block in rest] == [
+            "date",
+            "time",
+            "datetime",
+            "choice",
+            "boolean",
+            "multiple_choice",
+            "embed",
+            "nested_stream",
+        ]
+        assert rest[0].value == date(2024, 6, 15)
+        assert rest[1].value == time(14, 30)
         # Compare without timezone info
-        dt_value = created_page.body[0].value
-        assert dt_value.year == 2024
-        assert dt_value.month == 6
-        assert dt_value.day == 15
-        assert dt_value.hour == 14
-        assert dt_value.minute == 30
-
-
-@pytest.mark.e2e
-@pytest.mark.django_db(transaction=True)
-class TestContentBlocksE2E:
-    """E2E tests for content block types."""
-
-    def test_rawhtml_block(self, authenticated_page, server_url, home_page):
-        """Test RawHTMLBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("RawHTML Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Raw HTML Block")
-        sf.block(index).fill("<p>Hello <strong>World</strong></p>")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("rawhtml-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="RawHTML Block Test")
-        assert created_page.body[0].block_type == "rawhtml"
-        assert "<strong>World</strong>" in created_page.body[0].value
-
-    def test_blockquote_block(self, authenticated_page, server_url, home_page):
-        """Test BlockQuoteBlock input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("BlockQuote Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Block Quote")
-        sf.block(index).fill("To be or not to be")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("blockquote-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="BlockQuote Test")
-        assert created_page.body[0].block_type == "blockquote"
-        assert created_page.body[0].value == "To be or not to be"
-
-
-@pytest.mark.e2e
-@pytest.mark.django_db(transaction=True)
-class TestSelectionBlocksE2E:
-    """E2E tests for selection block types."""
-
-    def test_boolean_block_checked(self, authenticated_page, server_url, home_page):
-        """Test BooleanBlock checkbox - checked."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Boolean Block True Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Boolean Block")
-        sf.block(index).check()
-
-        assert sf.block(index).is_checked() is True
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("boolean-true-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="Boolean Block True Test")
-        assert created_page.body[0].block_type == "boolean"
-        assert created_page.body[0].value is True
-
-    def test_boolean_block_unchecked(self, authenticated_page, server_url, home_page):
-        """Test BooleanBlock checkbox - unchecked."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Boolean Block False Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Boolean Block")
-        # Don't check it - should be false
-
-        assert sf.block(index).is_checked() is False
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("boolean-false-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="Boolean Block False Test")
+        dt_value = rest[2].value
+        assert (dt_value.year, dt_value.month, dt_value.day) == (2024, 6, 15)
+        assert (dt_value.hour, dt_value.minute) == (14, 30)
+        assert rest[3].value == "option2"
+        assert rest[4].value is True
+        assert set(rest[5].value) == {"red", "blue"}
+        assert rest[6].value.url == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        assert [(child.block_type, child.value) for child in rest[7].value] == [
+            ("text", "Nested text content")
+        ]
+
+
+@pytest.mark.django_db
+class TestSelectionBlocksStorage:
+    """Storage tests for selection blocks that need no browser."""
+
+    def test_unchecked_boolean_persists_false(self, home_page):
+        """An unchecked BooleanBlock should be stored as False."""
+        home_page.add_child(
+            instance=AllBlockTypesPage(
+                title="Boolean False Test",
+                slug="boolean-false-test",
+                body=[("boolean", False)],
+            )
+        )
+
+        created_page = AllBlockTypesPage.objects.get(title="Boolean False Test")
         assert created_page.body[0].block_type == "boolean"
         assert created_page.body[0].value is False
-
-    def test_choice_block(self, authenticated_page, server_url, home_page):
-        """Test ChoiceBlock dropdown selection."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Choice Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Choice Block")
-        sf.block(index).select("option2")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("choice-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="Choice Block Test")
-        assert created_page.body[0].block_type == "choice"
-        assert created_page.body[0].value == "option2"
-
-    def test_multiple_choice_block(self, authenticated_page, server_url, home_page):
-        """Test MultipleChoiceBlock multi-select."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Multiple Choice Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Multiple Choice Block")
-        sf.block(index).select_multiple(["red", "blue"])
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("multiple-choice-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="Multiple Choice Test")
-        assert created_page.body[0].block_type == "multiple_choice"
-        assert set(created_page.body[0].value) == {"red", "blue"}
-
-
-@pytest.mark.e2e
-@pytest.mark.django_db(transaction=True)
-class TestEmbedBlockE2E:
-    """E2E tests for EmbedBlock."""
-
-    def test_embed_block(self, authenticated_page, server_url, home_page):
-        """Test EmbedBlock URL input."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Embed Block Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Embed Block")
-        sf.block(index).fill("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
-
-        # Save (may fail validation in some environments without oembed setup)
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("embed-block-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-
-        # Check if saved successfully or if there was a validation error
-        # EmbedBlock may fail if oEmbed providers aren't configured
-        success = authenticated_page.locator(
-            ".w-message--success, .success"
-        ).first.is_visible()
-        if success:
-            from tests.testapp.models import AllBlockTypesPage
-
-            created_page = AllBlockTypesPage.objects.get(title="Embed Block Test")
-            assert created_page.body[0].block_type == "embed"
-
-
-@pytest.mark.e2e
-@pytest.mark.django_db(transaction=True)
-class TestNestedStreamBlockE2E:
-    """E2E tests for nested StreamBlock."""
-
-    def test_nested_stream_block(self, authenticated_page, server_url, home_page):
-        """Test adding blocks to a nested StreamBlock."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "allblocktypespage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Nested Stream Test")
-
-        sf = StreamFieldHelper(authenticated_page, "body")
-        # Add a nested StreamBlock
-        outer_index = sf.add_block("Nested Stream Block")
-
-        # Add blocks inside the nested StreamBlock
-        inner_index = sf.block(outer_index).add_block("Text")
-        sf.block(outer_index).block(inner_index).fill("Nested text content")
-
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("nested-stream-test")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-        page_admin.assert_success_message()
-
-        from tests.testapp.models import AllBlockTypesPage
-
-        created_page = AllBlockTypesPage.objects.get(title="Nested Stream Test")
-        assert created_page.body[0].block_type == "nested_stream"
-        # Nested StreamBlock contains a list of blocks
-        assert len(created_page.body[0].value) == 1
-        assert created_page.body[0].value[0].block_type == "text"
-        assert created_page.body[0].value[0].value == "Nested text content"
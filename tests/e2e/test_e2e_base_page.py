@@ -1,82 +1,104 @@
-"""E2E tests for BasePage base class functionality."""
+"""E2E tests for BasePage base class functionality.
+
+BasePage only wraps Playwright, so these tests run against a static page
+served in-process instead of the Wagtail admin.
+"""
+
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
 
 import pytest
 
 from wagtail_scenario_test.page_objects import BasePage
 
+INDEX_HTML = """<!DOCTYPE html>
+<html>
+<head><title>BasePage Test</title></head>
+<body>
+<nav><a href="/">Snippets</a></nav>
+<main><p>Static page for BasePage tests</p></main>
+</body>
+</html>
+"""
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that does not log every request to stderr."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def static_server(tmp_path_factory):
+    """Serve INDEX_HTML from a local HTTP server and return its base URL."""
+    root = tmp_path_factory.mktemp("static_site")
+    (root / "index.html").write_text(INDEX_HTML)
+    handler = partial(_QuietHandler, directory=str(root))
+    with ThreadingHTTPServer(("127.0.0.1", 0), handler) as server:
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}"
+        server.shutdown()
+
+
+@pytest.fixture
+def base_index(page, static_server):
+    """Return a BasePage on the static index page."""
+    base = BasePage(page, static_server)
+    base.goto("/")
+    return base
+
 
 @pytest.mark.e2e
-@pytest.mark.django_db(transaction=True)
 class TestBasePageE2E:
     """E2E tests for BasePage base class functionality."""
 
-    def test_goto_navigates_to_path(self, authenticated_page, server_url):
+    def test_goto_navigates_to_path(self, page, static_server):
         """Test goto method navigates correctly."""
-        base = BasePage(authenticated_page, server_url)
+        base = BasePage(page, static_server)
 
-        base.goto("/admin/")
+        base.goto("/index.html")
 
-        assert "/admin/" in authenticated_page.url
+        assert page.url == f"{static_server}/index.html"
 
-    def test_current_path_returns_path(self, authenticated_page, server_url):
+    def test_current_path_returns_path(self, base_index):
         """Test current_path returns URL path."""
-        base = BasePage(authenticated_page, server_url)
-        authenticated_page.goto(f"{server_url}/admin/")
-
-        path = base.current_path()
+        path = base_index.current_path()
 
-        assert path == "/admin/"
+        assert path == "/"
 
-    def test_reload_reloads_page(self, authenticated_page, server_url):
+    def test_reload_reloads_page(self, base_index):
         """Test reload method works."""
-        base = BasePage(authenticated_page, server_url)
-        authenticated_page.goto(f"{server_url}/admin/")
+        base_index.reload()
 
-        base.reload()
+        assert base_index.current_path() == "/"
 
-        assert "/admin/" in authenticated_page.url
-
-    def test_wait_for_navigation(self, authenticated_page, server_url):
+    def test_wait_for_navigation(self, base_index):
         """Test wait_for_navigation waits for page load."""
-        base = BasePage(authenticated_page, server_url)
-        authenticated_page.goto(f"{server_url}/admin/")
-
         # Should not raise
-        base.wait_for_navigation()
+        base_index.wait_for_navigation()
 
-    def test_wait_for_element(self, authenticated_page, server_url):
+    def test_wait_for_element(self, base_index):
         """Test wait_for_element waits for selector."""
-        base = BasePage(authenticated_page, server_url)
-        authenticated_page.goto(f"{server_url}/admin/")
-
         # Wait for body element (always exists)
-        element = base.wait_for_element("body")
+        element = base_index.wait_for_element("body")
         assert element is not None
 
-    def test_assert_visible(self, authenticated_page, server_url):
+    def test_assert_visible(self, base_index):
         """Test assert_visible checks text visibility."""
-        base = BasePage(authenticated_page, server_url)
-        authenticated_page.goto(f"{server_url}/admin/")
-
-        # Assert that "Snippets" text is visible (always in sidebar)
-        base.assert_visible("Snippets")
+        base_index.assert_visible("Snippets")
 
-    def test_get_page_content(self, authenticated_page, server_url):
+    def test_get_page_content(self, base_index):
         """Test get_page_content returns HTML."""
-        base = BasePage(authenticated_page, server_url)
-        authenticated_page.goto(f"{server_url}/admin/")
-
-        content = base.get_page_content()
+        content = base_index.get_page_content()
 
         assert "<html" in content.lower()
         assert "</html>" in content.lower()
 
-    def test_get_visible_text(self, authenticated_page, server_url):
+    def test_get_visible_text(self, base_index):
         """Test get_visible_text returns body text."""
-        base = BasePage(authenticated_page, server_url)
-        authenticated_page.goto(f"{server_url}/admin/")
-
-        text = base.get_visible_text()
+        text = base_index.get_visible_text()
 
-        assert isinstance(text, str)
-        assert len(text) > 0
+        assert "Static page for BasePage tests" in text
@@ -1,6 +1,7 @@
 """E2E tests for PageAdminPage."""
 
 import pytest
+from playwright.sync_api import expect
 
 from wagtail_scenario_test import PageAdminPage
 
@@ -33,7 +34,7 @@ class TestPageAdminCreateChildPageE2E:
         """Test creating a child page as draft."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        page_admin.create_child_page(
+        page_id = page_admin.create_child_page(
             parent_page_id=home_page.id,
             page_type="testapp.TestPage",
             title="E2E Test Page Draft",
@@ -43,13 +44,11 @@ class TestPageAdminCreateChildPageE2E:
         # Should show success message
         page_admin.assert_success_message()
 
-        # Verify page was created in database
+        # Verify page was created in database as a draft
         from tests.testapp.models import TestPage
 
-        assert TestPage.objects.filter(title="E2E Test Page Draft").exists()
-
-        # The page should not be live (draft)
-        created_page = TestPage.objects.get(title="E2E Test Page Draft")
+        created_page = TestPage.objects.only("title", "live").get(pk=page_id)
+        assert created_page.title == "E2E Test Page Draft"
         assert not created_page.live
 
     def test_create_child_page_and_publish(
@@ -58,7 +57,7 @@ class TestPageAdminCreateChildPageE2E:
         """Test creating a child page and publishing it."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        page_admin.create_child_page(
+        page_id = page_admin.create_child_page(
             parent_page_id=home_page.id,
             page_type="testapp.TestPage",
             title="E2E Test Page Published",
@@ -72,7 +71,8 @@ class TestPageAdminCreateChildPageE2E:
         # Verify page was created and is live
         from tests.testapp.models import TestPage
 
-        created_page = TestPage.objects.get(title="E2E Test Page Published")
+        created_page = TestPage.objects.only("title", "live").get(pk=page_id)
+        assert created_page.title == "E2E Test Page Published"
         assert created_page.live
 
     def test_create_child_page_with_additional_fields(
@@ -81,7 +81,7 @@ class TestPageAdminCreateChildPageE2E:
         """Test creating a child page with subtitle and body fields."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        page_admin.create_child_page(
+        page_id = page_admin.create_child_page(
             parent_page_id=home_page.id,
             page_type="testapp.TestPage",
             title="E2E Test Page With Fields",
@@ -96,22 +96,10 @@ class TestPageAdminCreateChildPageE2E:
         # Verify fields were saved
         from tests.testapp.models import TestPage
 
-        created_page = TestPage.objects.get(title="E2E Test Page With Fields")
+        created_page = TestPage.objects.only("subtitle", "body").get(pk=page_id)
         assert created_page.subtitle == "Test Subtitle"
         assert created_page.body == "Test body content"
 
-    def test_add_child_page_url(self, authenticated_page, server_url):
-        """Test that add_child_page_url returns correct URL."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-
-        url = page_admin.add_child_page_url(
-            parent_page_id=1,
-            app_name="testapp",
-            model_name="testpage",
-        )
-
-        assert url == "/admin/pages/add/testapp/testpage/1/"
-
 
 @pytest.mark.e2e
 @pytest.mark.django_db(transaction=True)
@@ -119,42 +107,23 @@ class TestPageAdminEditPageE2E:
     """E2E tests for PageAdminPage.edit_page()."""
 
     def test_edit_page_navigates_to_edit_form(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, home_page, create_test_page
     ):
         """Test navigating to edit an existing page."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # First create a page to edit
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Page To Edit",
-            slug="page-to-edit",
-        )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Page To Edit")
+        created_page = create_test_page(home_page, "Page To Edit", "page-to-edit")
 
-        # Navigate to edit the page
-        page_admin.edit_page(created_page.id)
+        # The title is server-rendered, so the DOM is enough
+        page_admin.edit_page(created_page.id, wait_until="domcontentloaded")
 
         # Should be on the edit page
         assert f"/admin/pages/{created_page.id}/edit/" in authenticated_page.url
 
         # The title field should be visible and contain the page title
         title_input = authenticated_page.locator("#id_title")
-        assert title_input.input_value() == "Page To Edit"
-
-    def test_edit_page_url(self, authenticated_page, server_url):
-        """Test that edit_page_url returns correct URL."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-
-        url = page_admin.edit_page_url(page_id=42)
-
-        assert url == "/admin/pages/42/edit/"
+        expect(title_input).to_be_visible()
+        expect(title_input).to_have_value("Page To Edit")
 
 
 @pytest.mark.e2e
@@ -162,23 +131,13 @@ class TestPageAdminEditPageE2E:
 class TestPageAdminPublishE2E:
     """E2E tests for PageAdminPage.publish()."""
 
-    def test_publish_draft_page(self, authenticated_page, server_url, home_page):
+    def test_publish_draft_page(
+        self, authenticated_page, server_url, home_page, create_test_page
+    ):
         """Test publishing a draft page through the admin UI."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # First create a page as draft
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Page To Publish",
-            slug="page-to-publish",
-        )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Page To Publish")
+        created_page = create_test_page(home_page, "Page To Publish", "page-to-publish")
         assert not created_page.live  # Should be draft initially
 
         # Publish the page
@@ -191,23 +150,15 @@ class TestPageAdminPublishE2E:
         created_page.refresh_from_db()
         assert created_page.live
 
-    def test_publish_from_edit_page(self, authenticated_page, server_url, home_page):
+    def test_publish_from_edit_page(
+        self, authenticated_page, server_url, home_page, create_test_page
+    ):
         """Test publishing a page when already on the edit page."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # First create a page as draft
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Page To Publish From Edit",
-            slug="page-to-publish-from-edit",
+        created_page = create_test_page(
+            home_page, "Page To Publish From Edit", "page-to-publish-from-edit"
         )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Page To Publish From Edit")
 
         # Navigate to edit page first
         page_admin.edit_page(created_page.id)
@@ -228,24 +179,15 @@ class TestPageAdminPublishE2E:
 class TestPageAdminUnpublishE2E:
     """E2E tests for PageAdminPage.unpublish()."""
 
-    def test_unpublish_live_page(self, authenticated_page, server_url, home_page):
+    def test_unpublish_live_page(
+        self, authenticated_page, server_url, home_page, create_test_page
+    ):
         """Test unpublishing a live page through the admin UI."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # First create and publish a page
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Page To Unpublish",
-            slug="page-to-unpublish",
-            publish=True,
+        created_page = create_test_page(
+            home_page, "Page To Unpublish", "page-to-unpublish", publish=True
         )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Page To Unpublish")
         assert created_page.live  # Should be live initially
 
         # Unpublish the page
@@ -258,24 +200,18 @@ class TestPageAdminUnpublishE2E:
         created_page.refresh_from_db()
         assert not created_page.live
 
-    def test_unpublish_from_edit_page(self, authenticated_page, server_url, home_page):
+    def test_unpublish_from_edit_page(
+        self, authenticated_page, server_url, home_page, create_test_page
+    ):
         """Test unpublishing a page when already on the edit page."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # First create and publish a page
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Page To Unpublish From Edit",
-            slug="page-to-unpublish-from-edit",
+        created_page = create_test_page(
+            home_page,
+            "Page To Unpublish From Edit",
+            "page-to-unpublish-from-edit",
             publish=True,
         )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Page To Unpublish From Edit")
         assert created_page.live
 
         # Navigate to edit page first
@@ -297,7 +233,9 @@ class TestPageAdminUnpublishE2E:
 class TestPageAdminDeletePageE2E:
     """E2E tests for PageAdminPage.delete_page()."""
 
-    def test_delete_page_removes_page(self, authenticated_page, server_url, home_page):
+    def test_delete_page_removes_page(
+        self, authenticated_page, server_url, home_page, create_test_page
+    ):
         """Test deleting a page through the admin UI.
 
         This tests the Wagtail 7+ UI where Delete is a link in the
@@ -305,19 +243,7 @@ class TestPageAdminDeletePageE2E:
         """
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # First create a page to delete
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Page To Delete",
-            slug="page-to-delete",
-        )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Page To Delete")
+        created_page = create_test_page(home_page, "Page To Delete", "page-to-delete")
         page_id = created_page.id
 
         # Delete the page
@@ -327,15 +253,9 @@ class TestPageAdminDeletePageE2E:
         page_admin.assert_success_message()
 
         # Verify the page no longer exists
-        assert not TestPage.objects.filter(id=page_id).exists()
-
-    def test_delete_page_url(self, authenticated_page, server_url):
-        """Test that delete_page_url returns correct URL."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-
-        url = page_admin.delete_page_url(page_id=42)
+        from tests.testapp.models import TestPage
 
-        assert url == "/admin/pages/42/delete/"
+        assert not TestPage.objects.filter(id=page_id).exists()
 
 
 @pytest.mark.e2e
@@ -344,25 +264,14 @@ class TestPageAdminGetLiveUrlE2E:
     """E2E tests for PageAdminPage.get_live_url()."""
 
     def test_get_live_url_returns_url_for_published_page(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, home_page, create_test_page
     ):
         """Test get_live_url returns URL for a published page."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # Create and publish a page
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Published Page For URL",
-            slug="published-page-for-url",
-            publish=True,
+        created_page = create_test_page(
+            home_page, "Published Page For URL", "published-page-for-url", publish=True
         )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Published Page For URL")
 
         # Navigate to edit the page
         page_admin.edit_page(created_page.id)
@@ -375,24 +284,14 @@ class TestPageAdminGetLiveUrlE2E:
         assert "published-page-for-url" in live_url
 
     def test_get_live_url_returns_none_for_draft_page(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, home_page, create_test_page
     ):
         """Test get_live_url returns None for a draft (unpublished) page."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # Create a draft page (not published)
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Draft Page For URL",
-            slug="draft-page-for-url",
+        created_page = create_test_page(
+            home_page, "Draft Page For URL", "draft-page-for-url"
         )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Draft Page For URL")
 
         # Navigate to edit the page
         page_admin.edit_page(created_page.id)
@@ -410,27 +309,15 @@ class TestPageAdminVisitPreviewE2E:
     """E2E tests for PageAdminPage.visit_preview()."""
 
     def test_visit_preview_navigates_to_preview(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, home_page, create_test_page
     ):
         """Test visit_preview navigates to the preview URL."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # Create a page
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Page To Preview",
-            slug="page-to-preview",
-        )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Page To Preview")
+        created_page = create_test_page(home_page, "Page To Preview", "page-to-preview")
 
         # Visit preview
-        page_admin.visit_preview(created_page.id)
+        page_admin.visit_preview(created_page.id, wait_until="domcontentloaded")
 
         # Should be on the preview URL
         assert f"/admin/pages/{created_page.id}/edit/preview/" in authenticated_page.url
@@ -442,28 +329,17 @@ class TestPageAdminVisitLiveE2E:
     """E2E tests for PageAdminPage.visit_live()."""
 
     def test_visit_live_navigates_to_live_page(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, home_page, create_test_page
     ):
         """Test visit_live navigates to the live URL of a published page."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # Create and publish a page
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Page To Visit Live",
-            slug="page-to-visit-live",
-            publish=True,
+        created_page = create_test_page(
+            home_page, "Page To Visit Live", "page-to-visit-live", publish=True
         )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Page To Visit Live")
 
         # Visit live page
-        page_admin.visit_live(created_page.id)
+        page_admin.visit_live(created_page.id, wait_until="domcontentloaded")
 
         # Should be on the live URL (contains the slug)
         assert "page-to-visit-live" in authenticated_page.url
@@ -471,26 +347,16 @@ class TestPageAdminVisitLiveE2E:
         assert "/admin/" not in authenticated_page.url
 
     def test_visit_live_raises_error_for_draft_page(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, home_page, create_test_page
     ):
         """Test visit_live raises ValueError for unpublished page."""
         import pytest as pt
 
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # Create a draft page (not published)
-        page_admin.create_child_page(
-            parent_page_id=home_page.id,
-            page_type="testapp.TestPage",
-            title="Draft Page To Visit",
-            slug="draft-page-to-visit",
+        created_page = create_test_page(
+            home_page, "Draft Page To Visit", "draft-page-to-visit"
         )
-        page_admin.assert_success_message()
-
-        # Get the created page ID
-        from tests.testapp.models import TestPage
-
-        created_page = TestPage.objects.get(title="Draft Page To Visit")
 
         # Should raise ValueError
         with pt.raises(ValueError, match="not published or has no routable URL"):
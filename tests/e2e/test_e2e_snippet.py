@@ -1,21 +1,27 @@
 """E2E tests for snippet operations."""
 
+import re
+
 import pytest
+from playwright.sync_api import expect
 
 from wagtail_scenario_test import WagtailAdmin
 
 
+@pytest.fixture
+def snippet(authenticated_page, server_url):
+    """Return the SnippetAdminPage for the test app's TestSnippet."""
+    return WagtailAdmin(authenticated_page, server_url).snippet("testapp.testsnippet")
+
+
 @pytest.mark.e2e
 @pytest.mark.django_db(transaction=True)
 class TestSnippetE2E:
     """E2E tests for snippet operations using the WagtailAdmin facade."""
 
-    def test_create_snippet(self, authenticated_page, server_url):
+    def test_create_snippet(self, snippet):
         """Test creating a snippet through the admin UI."""
-        admin = WagtailAdmin(authenticated_page, server_url)
-
         # Navigate to snippet list
-        snippet = admin.snippet("testapp.testsnippet")
         snippet.go_to_list()
 
         # Create a new snippet
@@ -24,11 +30,8 @@ class TestSnippetE2E:
         # Verify success
         snippet.assert_success_message()
 
-    def test_get_success_message_after_create(self, authenticated_page, server_url):
+    def test_get_success_message_after_create(self, snippet):
         """Test getting success message after creation."""
-        admin = WagtailAdmin(authenticated_page, server_url)
-        snippet = admin.snippet("testapp.testsnippet")
-
         # Create a snippet
         snippet.create(name="Message Test Snippet")
 
@@ -37,119 +40,84 @@ class TestSnippetE2E:
         # Message should exist after successful creation
         assert message is None or isinstance(message, str)
 
-    def test_snippet_list_operations(self, authenticated_page, server_url):
+    def test_snippet_list_operations(self, authenticated_page, snippet):
         """Test listing snippets."""
-        admin = WagtailAdmin(authenticated_page, server_url)
-        snippet = admin.snippet("testapp.testsnippet")
-
         # Go to list page
         snippet.go_to_list()
 
         # Verify we're on the list page by checking URL contains the path
-        assert snippet.list_url in authenticated_page.url
+        expect(authenticated_page).to_have_url(re.compile(re.escape(snippet.list_url)))
 
         # Get item count (may be 0 or more depending on test order)
         count = snippet.get_item_count()
         assert isinstance(count, int)
 
-    def test_get_list_items(self, authenticated_page, server_url):
+    def test_get_list_items(self, snippet):
         """Test getting list items."""
-        admin = WagtailAdmin(authenticated_page, server_url)
-        snippet = admin.snippet("testapp.testsnippet")
-
         # Create a snippet first
         snippet.create(name="List Test Snippet")
 
-        # Go to list and get items
-        snippet.go_to_list()
+        # Saving redirected to the list, so the items are read in place
         items = snippet.get_list_items()
 
         assert isinstance(items, list)
 
-    def test_item_exists_in_list(self, authenticated_page, server_url):
+    def test_item_exists_in_list(self, snippet):
         """Test checking if item exists in list."""
-        admin = WagtailAdmin(authenticated_page, server_url)
-        snippet = admin.snippet("testapp.testsnippet")
-
         # Create a snippet
         snippet.create(name="Exists Test Snippet")
 
-        # Go to list and check existence
-        snippet.go_to_list()
-        exists = snippet.item_exists_in_list("Exists Test Snippet")
+        # Saving redirected to the list, so check it without reloading
+        exists = snippet.item_exists_in_list("Exists Test Snippet", skip_reload=True)
 
         assert exists is True
 
-    def test_click_item_in_list(self, authenticated_page, server_url):
+    def test_click_item_in_list(self, authenticated_page, snippet):
         """Test clicking an item in the list."""
-        admin = WagtailAdmin(authenticated_page, server_url)
-        snippet = admin.snippet("testapp.testsnippet")
-
         # Create a snippet
         snippet.create(name="Click Test Snippet")
 
-        # Go to list and click the item
-        snippet.go_to_list()
+        # Click the item on the list the save redirected to
         snippet.click_item_in_list("Click Test Snippet")
 
         # Should be on edit page
-        assert "/edit/" in authenticated_page.url
-
-    def test_snippet_urls(self, authenticated_page, server_url):
-        """Test snippet URL properties."""
-        admin = WagtailAdmin(authenticated_page, server_url)
-        snippet = admin.snippet("testapp.testsnippet")
-
-        assert snippet.list_url == "/admin/snippets/testapp/testsnippet/"
-        assert snippet.add_url == "/admin/snippets/testapp/testsnippet/add/"
-        assert snippet.edit_url(123) == "/admin/snippets/testapp/testsnippet/edit/123/"
-        assert (
-            snippet.delete_url(123) == "/admin/snippets/testapp/testsnippet/delete/123/"
-        )
+        expect(authenticated_page).to_have_url(re.compile("/edit/"))
 
-    def test_on_list_page_url_check(self, authenticated_page, server_url):
+    def test_on_list_page_url_check(self, authenticated_page, snippet):
         """Test that go_to_list navigates to correct URL."""
-        admin = WagtailAdmin(authenticated_page, server_url)
-        snippet = admin.snippet("testapp.testsnippet")
 
         snippet.go_to_list()
 
         # Verify URL contains the list path
-        assert snippet.list_url in authenticated_page.url
+        expect(authenticated_page).to_have_url(re.compile(re.escape(snippet.list_url)))
 
-    def test_on_add_page_url_check(self, authenticated_page, server_url):
+    def test_on_add_page_url_check(self, authenticated_page, snippet):
         """Test that go_to_add navigates to correct URL."""
-        admin = WagtailAdmin(authenticated_page, server_url)
-        snippet = admin.snippet("testapp.testsnippet")
 
         snippet.go_to_add()
 
         # Verify URL contains the add path
-        assert snippet.add_url in authenticated_page.url
+        expect(authenticated_page).to_have_url(re.compile(re.escape(snippet.add_url)))
 
-    def test_delete_snippet(self, authenticated_page, server_url):
+    def test_delete_snippet(self, authenticated_page, snippet):
         """Test deleting a snippet through the admin UI.
 
         This tests the Wagtail 7+ UI where Delete is a link in the
         header dropdown menu, not a direct button.
         """
-        admin = WagtailAdmin(authenticated_page, server_url)
-        snippet = admin.snippet("testapp.testsnippet")
-
-        # Create a snippet first
-        snippet.create(name="Delete Test Snippet")
-        snippet.assert_success_message()
-
-        # Click the item to go to edit page
-        snippet.click_item_in_list("Delete Test Snippet")
+        # Create a snippet first; its key comes from the success message,
+        # so the edit view is opened directly instead of through the list
+        item_id = snippet.create(name="Delete Test Snippet")
+        assert item_id is not None
+        snippet.go_to_edit(item_id)
 
         # Delete the snippet (this uses the new Wagtail 7 dropdown UI)
         snippet.delete()
 
         # Verify we're back on the list page with success message
         snippet.assert_success_message()
-        assert snippet.list_url in authenticated_page.url
+        expect(authenticated_page).to_have_url(re.compile(re.escape(snippet.list_url)))
 
-        # Verify the snippet no longer exists
-        exists = snippet.item_exists_in_list("Delete Test Snippet")
+        # Verify the snippet no longer exists on the list deleting redirected to
+        exists = snippet.item_exists_in_list("Delete Test Snippet", skip_reload=True)
         assert exists is False
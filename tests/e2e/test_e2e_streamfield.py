@@ -1,7 +1,10 @@
 """E2E tests for StreamFieldHelper with Fluent Builder API."""
 
 import pytest
+from playwright.sync_api import expect
 
+from tests.helpers import assert_streamfield_content
+from tests.testapp.models import AdvancedStreamFieldPage, StreamFieldPage
 from wagtail_scenario_test import PageAdminPage, StreamFieldHelper
 
 
@@ -10,151 +13,85 @@ from wagtail_scenario_test import PageAdminPage, StreamFieldHelper
 class TestStreamFieldHelperAddBlockE2E:
     """E2E tests for StreamFieldHelper.add_block()."""
 
-    def test_add_heading_block(self, authenticated_page, server_url, home_page):
-        """Test adding a heading block to StreamField."""
+    def test_add_and_fill_blocks(
+        self, authenticated_page, server_url, advanced_add_url
+    ):
+        """Test adding simple and StructBlocks and filling them on one form."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        # Navigate to add StreamFieldPage
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        # One add form serves every block type checked here
+        page_admin.goto(advanced_add_url)
 
-        # Create StreamFieldHelper
         sf = StreamFieldHelper(authenticated_page, "body")
 
-        # Add heading block
-        index = sf.add_block("Heading")
-
-        # Verify block was added
-        assert index == 0
+        # Add a heading block and fill it using the fluent API
+        heading_idx = sf.add_block("Heading")
+        assert heading_idx == 0
         assert sf.get_block_count() == 1
-        assert sf.get_block_type(0) == "heading"
-
-    def test_add_multiple_blocks(self, authenticated_page, server_url, home_page):
-        """Test adding multiple blocks to StreamField."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-
-        # Navigate to add StreamFieldPage
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        # Create StreamFieldHelper
-        sf = StreamFieldHelper(authenticated_page, "body")
-
-        # Add multiple blocks
-        index1 = sf.add_block("Heading")
-        index2 = sf.add_block("Quote")
+        sf.block(heading_idx).fill("My Test Heading")
 
-        # Verify blocks were added
-        assert index1 == 0
-        assert index2 == 1
-        assert sf.get_block_count() == 2
-        assert sf.get_block_type(0) == "heading"
-        assert sf.get_block_type(1) == "quote"
-
-    def test_add_and_fill_block_fluent(self, authenticated_page, server_url, home_page):
-        """Test adding a block and filling it using fluent API."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-
-        # Navigate to add StreamFieldPage
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        # Create StreamFieldHelper
-        sf = StreamFieldHelper(authenticated_page, "body")
-
-        # Add and fill heading block using fluent API
-        index = sf.add_block("Heading")
-        sf.block(index).fill("My Test Heading")
+        # Add a second simple block
+        quote_idx = sf.add_block("Quote")
+        assert quote_idx == 1
 
-        # Verify value was filled
-        input_field = authenticated_page.locator("#body-0-value")
-        assert input_field.input_value() == "My Test Heading"
+        # Add Hero Section (StructBlock) and fill its fields
+        hero_idx = sf.add_block("Hero Section")
+        sf.block(hero_idx).struct("title").fill("Welcome to Our Site")
+        sf.block(hero_idx).struct("subtitle").fill("The best place to be")
+
+        # Verify every block with one read of the form state
+        snap = sf.snapshot()
+        assert snap["count"] == 3
+        assert [block["type"] for block in snap["blocks"]] == [
+            "heading",
+            "quote",
+            "hero",
+        ]
+        assert snap["blocks"][heading_idx]["value"] == "My Test Heading"
+        assert snap["blocks"][hero_idx]["values"]["title"] == "Welcome to Our Site"
+        assert snap["blocks"][hero_idx]["values"]["subtitle"] == (
+            "The best place to be"
+        )
 
-    def test_add_block_and_save_page(self, authenticated_page, server_url, home_page):
+    def test_add_block_and_save_page(
+        self, authenticated_page, server_url, streamfield_add_url
+    ):
         """Test adding a block, filling it, and saving the page."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
         # Navigate to add StreamFieldPage
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        # Fill title
-        authenticated_page.locator("#id_title").fill("StreamField Test Page")
+        page_admin.goto(streamfield_add_url)
 
         # Add and fill heading block using fluent API
         sf = StreamFieldHelper(authenticated_page, "body")
         index = sf.add_block("Heading")
         sf.block(index).fill("Welcome Heading")
 
-        # Fill slug in Promote tab
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("streamfield-test-page")
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "StreamField Test Page", "id_slug": "streamfield-test-page"}
+        )
 
         # Save as draft
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        page_admin.save_draft(wait=False)
 
         # Verify success
         page_admin.assert_success_message()
 
-        # Verify page was created with StreamField content
-        from tests.testapp.models import StreamFieldPage
-
-        created_page = StreamFieldPage.objects.get(title="StreamField Test Page")
-        assert len(created_page.body) == 1
-        assert created_page.body[0].block_type == "heading"
-        assert created_page.body[0].value == "Welcome Heading"
-
 
 @pytest.mark.e2e
 @pytest.mark.django_db(transaction=True)
 class TestStreamFieldHelperStructBlockE2E:
     """E2E tests for StreamFieldHelper StructBlock methods with fluent API."""
 
-    def test_add_and_fill_struct_block(self, authenticated_page, server_url, home_page):
-        """Test adding a StructBlock and filling its fields with fluent API."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-
-        # Navigate to add AdvancedStreamFieldPage
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        # Create StreamFieldHelper
-        sf = StreamFieldHelper(authenticated_page, "body")
-
-        # Add Hero Section block (StructBlock)
-        index = sf.add_block("Hero Section")
-
-        # Fill StructBlock fields using fluent API
-        sf.block(index).struct("title").fill("Welcome to Our Site")
-        sf.block(index).struct("subtitle").fill("The best place to be")
-
-        # Verify values were filled using fluent API
-        assert sf.block(index).struct("title").value() == "Welcome to Our Site"
-        assert sf.block(index).struct("subtitle").value() == "The best place to be"
-
     def test_save_page_with_struct_block(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, advanced_add_url
     ):
         """Test saving a page with StructBlock content."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
         # Navigate to add AdvancedStreamFieldPage
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        # Fill title
-        authenticated_page.locator("#id_title").fill("Advanced StreamField Test")
+        page_admin.goto(advanced_add_url)
 
         # Add and fill Hero Section using fluent API
         sf = StreamFieldHelper(authenticated_page, "body")
@@ -162,49 +99,34 @@ class TestStreamFieldHelperStructBlockE2E:
         sf.block(index).struct("title").fill("Hero Title")
         sf.block(index).struct("subtitle").fill("Hero Subtitle")
 
-        # Fill slug
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("advanced-streamfield-test")
+        # Fill title and slug
+        page_admin.fill_form(
+            {
+                "id_title": "Advanced StreamField Test",
+                "id_slug": "advanced-streamfield-test",
+            }
+        )
 
         # Save
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        page_admin.save_draft(wait=False)
 
         # Verify success
         page_admin.assert_success_message()
 
-        # Verify content
-        from tests.testapp.models import AdvancedStreamFieldPage
-
-        created_page = AdvancedStreamFieldPage.objects.get(
-            title="Advanced StreamField Test"
-        )
-        assert len(created_page.body) == 1
-        assert created_page.body[0].block_type == "hero"
-        assert created_page.body[0].value["title"] == "Hero Title"
-        assert created_page.body[0].value["subtitle"] == "Hero Subtitle"
-
 
 @pytest.mark.e2e
 @pytest.mark.django_db(transaction=True)
 class TestStreamFieldHelperListBlockE2E:
     """E2E tests for StreamFieldHelper ListBlock methods with fluent API."""
 
-    def test_add_and_fill_list_block_with_struct(
-        self, authenticated_page, server_url, home_page
+    def test_multiple_list_items(
+        self, authenticated_page, server_url, advanced_add_url
     ):
-        """Test adding a ListBlock with StructBlock items using fluent API."""
+        """Test adding and filling StructBlock items in a ListBlock."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
         # Navigate to add AdvancedStreamFieldPage
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        # Fill title
-        authenticated_page.locator("#id_title").fill("ListBlock Test Page")
+        page_admin.goto(advanced_add_url)
 
         # Add Links block (ListBlock of LinkBlock StructBlock)
         sf = StreamFieldHelper(authenticated_page, "body")
@@ -214,51 +136,6 @@ class TestStreamFieldHelperListBlockE2E:
         sf.block(index).item(0).struct("title").fill("Google")
         sf.block(index).item(0).struct("url").fill("https://google.com")
 
-        # Verify values using fluent API
-        assert sf.block(index).item(0).struct("title").value() == "Google"
-        assert sf.block(index).item(0).struct("url").value() == "https://google.com"
-
-        # Fill slug and save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("listblock-test-page")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
-
-        # Verify success
-        page_admin.assert_success_message()
-
-        # Verify content
-        from tests.testapp.models import AdvancedStreamFieldPage
-
-        created_page = AdvancedStreamFieldPage.objects.get(title="ListBlock Test Page")
-        assert len(created_page.body) == 1
-        assert created_page.body[0].block_type == "links"
-        assert len(created_page.body[0].value) == 1
-        assert created_page.body[0].value[0]["title"] == "Google"
-        assert created_page.body[0].value[0]["url"] == "https://google.com"
-
-    def test_multiple_list_items(self, authenticated_page, server_url, home_page):
-        """Test adding and filling multiple items in a ListBlock."""
-        page_admin = PageAdminPage(authenticated_page, server_url)
-
-        # Navigate to add AdvancedStreamFieldPage
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        # Fill title
-        authenticated_page.locator("#id_title").fill("Multiple Links Page")
-
-        # Add Links block
-        sf = StreamFieldHelper(authenticated_page, "body")
-        index = sf.add_block("Links")
-
-        # Fill first item (default)
-        sf.block(index).item(0).struct("title").fill("Google")
-        sf.block(index).item(0).struct("url").fill("https://google.com")
-
         # Add second item
         sf.block(index).add_item()
         sf.block(index).item(1).struct("title").fill("GitHub")
@@ -267,58 +144,56 @@ class TestStreamFieldHelperListBlockE2E:
         # Verify item count
         assert sf.block(index).item_count() == 2
 
-        # Fill slug and save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("multiple-links-page")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Verify every item field with one read of the form state
+        values = sf.snapshot()["blocks"][index]["values"]
+        assert values["0-value-title"] == "Google"
+        assert values["0-value-url"] == "https://google.com"
+        assert values["1-value-title"] == "GitHub"
+        assert values["1-value-url"] == "https://github.com"
+
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Multiple Links Page", "id_slug": "multiple-links-page"}
+        )
+        page_admin.save_draft(wait=False)
 
         # Verify success
         page_admin.assert_success_message()
 
-        # Verify content
-        from tests.testapp.models import AdvancedStreamFieldPage
-
-        created_page = AdvancedStreamFieldPage.objects.get(title="Multiple Links Page")
-        assert len(created_page.body[0].value) == 2
-        assert created_page.body[0].value[0]["title"] == "Google"
-        assert created_page.body[0].value[1]["title"] == "GitHub"
-
 
 @pytest.mark.e2e
 @pytest.mark.django_db(transaction=True)
 class TestStreamFieldHelperMixedBlocksE2E:
     """E2E tests for mixed block types."""
 
-    def test_multiple_block_types(self, authenticated_page, server_url, home_page):
+    def test_multiple_block_types(
+        self, authenticated_page, server_url, advanced_add_url
+    ):
         """Test page with multiple different block types."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
         # Navigate to add AdvancedStreamFieldPage
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        # Fill title
-        authenticated_page.locator("#id_title").fill("Mixed Blocks Page")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
-        # Add heading block (simple)
-        heading_idx = sf.add_block("Heading")
-        sf.block(heading_idx).fill("Page Title")
-
-        # Add Hero Section (StructBlock)
-        hero_idx = sf.add_block("Hero Section")
-        sf.block(hero_idx).struct("title").fill("Hero Title")
-        sf.block(hero_idx).struct("subtitle").fill("Hero Subtitle")
+        # Add heading (simple), Hero Section (StructBlock) and Links (ListBlock)
+        heading_idx, hero_idx, links_idx = sf.add_blocks(
+            ["Heading", "Hero Section", "Links"]
+        )
 
-        # Add Links (ListBlock)
-        links_idx = sf.add_block("Links")
-        sf.block(links_idx).item(0).struct("title").fill("First Link")
-        sf.block(links_idx).item(0).struct("url").fill("https://example.com")
+        # Fill every field in one browser call
+        hero = sf.block(hero_idx)
+        first_link = sf.block(links_idx).item(0)
+        sf.bulk_fill(
+            {
+                sf.block(heading_idx): "Page Title",
+                hero.struct("title"): "Hero Title",
+                hero.struct("subtitle"): "Hero Subtitle",
+                first_link.struct("title"): "First Link",
+                first_link.struct("url"): "https://example.com",
+            }
+        )
 
         # Verify block count
         assert sf.get_block_count() == 3
@@ -328,27 +203,15 @@ class TestStreamFieldHelperMixedBlocksE2E:
         assert sf.get_block_type(hero_idx) == "hero"
         assert sf.get_block_type(links_idx) == "links"
 
-        # Fill slug and save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("mixed-blocks-page")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Mixed Blocks Page", "id_slug": "mixed-blocks-page"}
+        )
+        page_admin.save_draft(wait=False)
 
         # Verify success
         page_admin.assert_success_message()
 
-        # Verify content
-        from tests.testapp.models import AdvancedStreamFieldPage
-
-        created_page = AdvancedStreamFieldPage.objects.get(title="Mixed Blocks Page")
-        assert len(created_page.body) == 3
-        assert created_page.body[0].block_type == "heading"
-        assert created_page.body[0].value == "Page Title"
-        assert created_page.body[1].block_type == "hero"
-        assert created_page.body[1].value["title"] == "Hero Title"
-        assert created_page.body[2].block_type == "links"
-        assert created_page.body[2].value[0]["title"] == "First Link"
-
 
 @pytest.mark.e2e
 @pytest.mark.django_db(transaction=True)
@@ -356,18 +219,12 @@ class TestStreamFieldHelperSimpleListBlockE2E:
     """E2E tests for simple ListBlock (CharBlock items)."""
 
     def test_simple_list_block_single_item(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, advanced_add_url
     ):
         """Test ListBlock with simple CharBlock items."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Simple List Page")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -378,35 +235,27 @@ class TestStreamFieldHelperSimpleListBlockE2E:
         sf.block(index).item(0).fill("First Item")
 
         # Verify value
-        assert sf.block(index).item(0).value() == "First Item"
+        expect(sf.block(index).item(0).locator).to_have_value("First Item")
 
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("simple-list-page")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Simple List Page", "id_slug": "simple-list-page"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
-        from tests.testapp.models import AdvancedStreamFieldPage
-
-        created_page = AdvancedStreamFieldPage.objects.get(title="Simple List Page")
-        assert created_page.body[0].block_type == "items"
-        assert created_page.body[0].value[0] == "First Item"
+        assert_streamfield_content(
+            AdvancedStreamFieldPage, "Simple List Page", [("items", ["First Item"])]
+        )
 
     def test_simple_list_block_multiple_items(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, advanced_add_url
     ):
         """Test adding multiple items to a simple ListBlock."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Multi Item List Page")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
         index = sf.add_block("Items")
@@ -425,25 +274,23 @@ class TestStreamFieldHelperSimpleListBlockE2E:
         assert sf.block(index).item_count() == 3
 
         # Verify values
-        assert sf.block(index).item(0).value() == "Apple"
-        assert sf.block(index).item(1).value() == "Banana"
-        assert sf.block(index).item(2).value() == "Cherry"
+        expect(sf.block(index).item(0).locator).to_have_value("Apple")
+        expect(sf.block(index).item(1).locator).to_have_value("Banana")
+        expect(sf.block(index).item(2).locator).to_have_value("Cherry")
 
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("multi-item-list-page")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Multi Item List Page", "id_slug": "multi-item-list-page"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
-        from tests.testapp.models import AdvancedStreamFieldPage
-
-        created_page = AdvancedStreamFieldPage.objects.get(title="Multi Item List Page")
-        assert len(created_page.body[0].value) == 3
-        assert created_page.body[0].value[0] == "Apple"
-        assert created_page.body[0].value[1] == "Banana"
-        assert created_page.body[0].value[2] == "Cherry"
+        assert_streamfield_content(
+            AdvancedStreamFieldPage,
+            "Multi Item List Page",
+            [("items", ["Apple", "Banana", "Cherry"])],
+        )
 
 
 @pytest.mark.e2e
@@ -451,17 +298,13 @@ class TestStreamFieldHelperSimpleListBlockE2E:
 class TestStreamFieldHelperTextBlockE2E:
     """E2E tests for TextBlock (textarea)."""
 
-    def test_text_block_fill_and_save(self, authenticated_page, server_url, home_page):
+    def test_text_block_fill_and_save(
+        self, authenticated_page, server_url, advanced_add_url
+    ):
         """Test filling a TextBlock (quote) with multiline content."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Quote Page")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -472,16 +315,12 @@ class TestStreamFieldHelperTextBlockE2E:
         quote_text = "To be or not to be,\nthat is the question."
         sf.block(index).fill(quote_text)
 
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("quote-page")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form({"id_title": "Quote Page", "id_slug": "quote-page"})
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
-        from tests.testapp.models import AdvancedStreamFieldPage
-
         created_page = AdvancedStreamFieldPage.objects.get(title="Quote Page")
         assert created_page.body[0].block_type == "quote"
         assert "To be or not to be" in created_page.body[0].value
@@ -493,18 +332,12 @@ class TestStreamFieldHelperDeepNestingE2E:
     """E2E tests for deeply nested block structures."""
 
     def test_struct_with_list_of_structs(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, advanced_add_url
     ):
         """Test StructBlock > ListBlock > StructBlock nesting."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Deep Nesting Page")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -521,83 +354,93 @@ class TestStreamFieldHelperDeepNestingE2E:
         )
 
         # Verify values at deep nesting level
-        assert sf.block(index).struct("heading").value() == "Featured Cards"
-        assert sf.block(index).struct("cards").item(0).struct("title").value() == (
-            "Card 1"
+        expect(sf.block(index).struct("heading").locator).to_have_value(
+            "Featured Cards"
         )
+        card_title = sf.block(index).struct("cards").item(0).struct("title")
+        expect(card_title.locator).to_have_value("Card 1")
 
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("deep-nesting-page")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Deep Nesting Page", "id_slug": "deep-nesting-page"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
-        from tests.testapp.models import AdvancedStreamFieldPage
-
-        created_page = AdvancedStreamFieldPage.objects.get(title="Deep Nesting Page")
-        assert created_page.body[0].block_type == "section"
-        assert created_page.body[0].value["heading"] == "Featured Cards"
-        assert created_page.body[0].value["cards"][0]["title"] == "Card 1"
-        assert (
-            created_page.body[0].value["cards"][0]["description"]
-            == "First card description"
+        assert_streamfield_content(
+            AdvancedStreamFieldPage,
+            "Deep Nesting Page",
+            [
+                (
+                    "section",
+                    {
+                        "heading": "Featured Cards",
+                        "cards": [
+                            {"title": "Card 1", "description": "First card description"}
+                        ],
+                    },
+                )
+            ],
         )
 
     def test_deep_nesting_multiple_items(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, advanced_add_url
     ):
         """Test adding multiple items in deeply nested ListBlock."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Multi Card Section")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
-        # Add Section block
+        # Add Section block with three cards (one exists by default)
         index = sf.add_block("Section")
-        sf.block(index).struct("heading").fill("Our Team")
-
-        # Fill first card
-        sf.block(index).struct("cards").item(0).struct("title").fill("Alice")
-        sf.block(index).struct("cards").item(0).struct("description").fill("Developer")
-
-        # Add second card
-        sf.block(index).struct("cards").add_item()
-        sf.block(index).struct("cards").item(1).struct("title").fill("Bob")
-        sf.block(index).struct("cards").item(1).struct("description").fill("Designer")
-
-        # Add third card
-        sf.block(index).struct("cards").add_item()
-        sf.block(index).struct("cards").item(2).struct("title").fill("Charlie")
-        sf.block(index).struct("cards").item(2).struct("description").fill("Manager")
+        cards = sf.block(index).struct("cards")
+        cards.add_item()
+        cards.add_item()
+
+        # Fill the heading and every card in one browser call
+        sf.bulk_fill(
+            {
+                sf.block(index).struct("heading"): "Our Team",
+                cards.item(0).struct("title"): "Alice",
+                cards.item(0).struct("description"): "Developer",
+                cards.item(1).struct("title"): "Bob",
+                cards.item(1).struct("description"): "Designer",
+                cards.item(2).struct("title"): "Charlie",
+                cards.item(2).struct("description"): "Manager",
+            }
+        )
 
         # Verify item count in nested ListBlock
         assert sf.block(index).struct("cards").item_count() == 3
 
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("multi-card-section")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Multi Card Section", "id_slug": "multi-card-section"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
-        from tests.testapp.models import AdvancedStreamFieldPage
-
-        created_page = AdvancedStreamFieldPage.objects.get(title="Multi Card Section")
-        cards = created_page.body[0].value["cards"]
-        assert len(cards) == 3
-        assert cards[0]["title"] == "Alice"
-        assert cards[1]["title"] == "Bob"
-        assert cards[2]["title"] == "Charlie"
+        assert_streamfield_content(
+            AdvancedStreamFieldPage,
+            "Multi Card Section",
+            [
+                (
+                    "section",
+                    {
+                        "heading": "Our Team",
+                        "cards": [
+                            {"title": "Alice", "description": "Developer"},
+                            {"title": "Bob", "description": "Designer"},
+                            {"title": "Charlie", "description": "Manager"},
+                        ],
+                    },
+                )
+            ],
+        )
 
 
 @pytest.mark.e2e
@@ -605,15 +448,13 @@ class TestStreamFieldHelperDeepNestingE2E:
 class TestStreamFieldHelperValueMethodE2E:
     """E2E tests for value() method across different block types."""
 
-    def test_value_method_simple_block(self, authenticated_page, server_url, home_page):
+    def test_value_method_simple_block(
+        self, authenticated_page, server_url, advanced_add_url
+    ):
         """Test value() on simple CharBlock."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -623,15 +464,13 @@ class TestStreamFieldHelperValueMethodE2E:
         # Verify value() returns what was filled
         assert sf.block(index).value() == "Test Heading"
 
-    def test_value_method_struct_block(self, authenticated_page, server_url, home_page):
+    def test_value_method_struct_block(
+        self, authenticated_page, server_url, advanced_add_url
+    ):
         """Test value() on StructBlock fields."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -643,15 +482,13 @@ class TestStreamFieldHelperValueMethodE2E:
         assert sf.block(index).struct("title").value() == "Hero Title"
         assert sf.block(index).struct("subtitle").value() == "Hero Subtitle"
 
-    def test_value_method_list_block(self, authenticated_page, server_url, home_page):
+    def test_value_method_list_block(
+        self, authenticated_page, server_url, advanced_add_url
+    ):
         """Test value() on ListBlock items."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -665,15 +502,13 @@ class TestStreamFieldHelperValueMethodE2E:
         assert sf.block(index).item(0).value() == "Item One"
         assert sf.block(index).item(1).value() == "Item Two"
 
-    def test_value_method_deep_nesting(self, authenticated_page, server_url, home_page):
+    def test_value_method_deep_nesting(
+        self, authenticated_page, server_url, advanced_add_url
+    ):
         """Test value() on deeply nested fields."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -702,106 +537,101 @@ class TestStreamFieldHelperComplexScenarioE2E:
     """E2E tests for complex real-world scenarios."""
 
     def test_full_page_with_all_block_types(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, advanced_add_url
     ):
         """Test creating a page with all available block types."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Complete Page")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
-        # 1. Add Heading (simple CharBlock)
-        heading_idx = sf.add_block("Heading")
-        sf.block(heading_idx).fill("Welcome to Our Website")
-
-        # 2. Add Quote (TextBlock)
-        quote_idx = sf.add_block("Quote")
-        sf.block(quote_idx).fill("Innovation distinguishes leaders from followers.")
-
-        # 3. Add Hero Section (StructBlock)
-        hero_idx = sf.add_block("Hero Section")
-        sf.block(hero_idx).struct("title").fill("Main Hero")
-        sf.block(hero_idx).struct("subtitle").fill("Your journey starts here")
-
-        # 4. Add Links (ListBlock > StructBlock)
-        links_idx = sf.add_block("Links")
-        sf.block(links_idx).item(0).struct("title").fill("Documentation")
-        sf.block(links_idx).item(0).struct("url").fill("https://docs.example.com")
-        sf.block(links_idx).add_item()
-        sf.block(links_idx).item(1).struct("title").fill("Support")
-        sf.block(links_idx).item(1).struct("url").fill("https://support.example.com")
-
-        # 5. Add Items (ListBlock > CharBlock)
-        items_idx = sf.add_block("Items")
-        sf.block(items_idx).item(0).fill("Feature 1")
-        sf.block(items_idx).add_item()
-        sf.block(items_idx).item(1).fill("Feature 2")
-        sf.block(items_idx).add_item()
-        sf.block(items_idx).item(2).fill("Feature 3")
-
-        # 6. Add Section (StructBlock > ListBlock > StructBlock)
-        section_idx = sf.add_block("Section")
-        sf.block(section_idx).struct("heading").fill("Team Members")
-        sf.block(section_idx).struct("cards").item(0).struct("title").fill("John Doe")
-        sf.block(section_idx).struct("cards").item(0).struct("description").fill("CEO")
-        sf.block(section_idx).struct("cards").add_item()
-        sf.block(section_idx).struct("cards").item(1).struct("title").fill("Jane Doe")
-        sf.block(section_idx).struct("cards").item(1).struct("description").fill("CTO")
+        # Add every block type first: Heading (CharBlock), Quote (TextBlock),
+        # Hero Section (StructBlock), Links (ListBlock > StructBlock),
+        # Items (ListBlock > CharBlock) and Section (StructBlock > ListBlock >
+        # StructBlock)
+        heading_idx, quote_idx, hero_idx, links_idx, items_idx, section_idx = (
+            sf.add_blocks(
+                ["Heading", "Quote", "Hero Section", "Links", "Items", "Section"]
+            )
+        )
+        links = sf.block(links_idx)
+        items = sf.block(items_idx)
+        cards = sf.block(section_idx).struct("cards")
+        links.add_item()
+        items.add_item()
+        items.add_item()
+        cards.add_item()
+
+        # Then fill every field in a single browser call
+        hero = sf.block(hero_idx)
+        sf.bulk_fill(
+            {
+                sf.block(heading_idx): "Welcome to Our Website",
+                sf.block(quote_idx): "Innovation distinguishes leaders from followers.",
+                hero.struct("title"): "Main Hero",
+                hero.struct("subtitle"): "Your journey starts here",
+                links.item(0).struct("title"): "Documentation",
+                links.item(0).struct("url"): "https://docs.example.com",
+                links.item(1).struct("title"): "Support",
+                links.item(1).struct("url"): "https://support.example.com",
+                items.item(0): "Feature 1",
+                items.item(1): "Feature 2",
+                items.item(2): "Feature 3",
+                sf.block(section_idx).struct("heading"): "Team Members",
+                cards.item(0).struct("title"): "John Doe",
+                cards.item(0).struct("description"): "CEO",
+                cards.item(1).struct("title"): "Jane Doe",
+                cards.item(1).struct("description"): "CTO",
+            }
+        )
 
         # Verify block count
         assert sf.get_block_count() == 6
 
-        # Save
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("complete-page")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form({"id_title": "Complete Page", "id_slug": "complete-page"})
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
-        # Verify all content was saved correctly
-        from tests.testapp.models import AdvancedStreamFieldPage
-
-        created_page = AdvancedStreamFieldPage.objects.get(title="Complete Page")
-
-        # Check all blocks
-        assert len(created_page.body) == 6
-
-        # Heading
-        assert created_page.body[0].block_type == "heading"
-        assert created_page.body[0].value == "Welcome to Our Website"
-
-        # Quote
-        assert created_page.body[1].block_type == "quote"
-        assert "Innovation" in created_page.body[1].value
-
-        # Hero
-        assert created_page.body[2].block_type == "hero"
-        assert created_page.body[2].value["title"] == "Main Hero"
-
-        # Links
-        assert created_page.body[3].block_type == "links"
-        assert len(created_page.body[3].value) == 2
-        assert created_page.body[3].value[0]["title"] == "Documentation"
-
-        # Items
-        assert created_page.body[4].block_type == "items"
-        assert len(created_page.body[4].value) == 3
-        assert created_page.body[4].value[0] == "Feature 1"
-
-        # Section (deep nesting)
-        assert created_page.body[5].block_type == "section"
-        assert created_page.body[5].value["heading"] == "Team Members"
-        assert len(created_page.body[5].value["cards"]) == 2
-        assert created_page.body[5].value["cards"][0]["title"] == "John Doe"
-        assert created_page.body[5].value["cards"][1]["title"] == "Jane Doe"
+        # Verify all content was saved correctly. This is the persistence
+        # check for the per-block save tests above, which stop at the
+        # success message
+        assert_streamfield_content(
+            AdvancedStreamFieldPage,
+            "Complete Page",
+            [
+                ("heading", "Welcome to Our Website"),
+                ("quote", "Innovation distinguishes leaders from followers."),
+                (
+                    "hero",
+                    {
+                        "title": "Main Hero",
+                        "subtitle": "Your journey starts here",
+                        "image": None,
+                    },
+                ),
+                (
+                    "links",
+                    [
+                        {"title": "Documentation", "url": "https://docs.example.com"},
+                        {"title": "Support", "url": "https://support.example.com"},
+                    ],
+                ),
+                ("items", ["Feature 1", "Feature 2", "Feature 3"]),
+                (
+                    "section",
+                    {
+                        "heading": "Team Members",
+                        "cards": [
+                            {"title": "John Doe", "description": "CEO"},
+                            {"title": "Jane Doe", "description": "CTO"},
+                        ],
+                    },
+                ),
+            ],
+        )
 
 
 @pytest.mark.e2e
@@ -810,16 +640,12 @@ class TestStreamFieldHelperImageChooserE2E:
     """E2E tests for ImageChooserBlock with click_chooser and select_from_chooser."""
 
     def test_click_chooser_opens_modal(
-        self, authenticated_page, server_url, home_page, test_image
+        self, authenticated_page, server_url, advanced_add_url, test_image
     ):
         """Test that click_chooser opens the image chooser modal."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         authenticated_page.locator("#id_title").fill("Image Chooser Test Page")
 
@@ -837,16 +663,12 @@ class TestStreamFieldHelperImageChooserE2E:
         assert modal.count() > 0, "Image chooser modal should be open"
 
     def test_select_image_from_chooser(
-        self, authenticated_page, server_url, home_page, test_image
+        self, authenticated_page, server_url, advanced_add_url, test_image
     ):
         """Test selecting an image from the chooser modal."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         authenticated_page.locator("#id_title").fill("Select Image Test Page")
 
@@ -867,18 +689,12 @@ class TestStreamFieldHelperImageChooserE2E:
         assert modal.count() == 0, "Modal should be closed after selection"
 
     def test_image_in_struct_block(
-        self, authenticated_page, server_url, home_page, test_image
+        self, authenticated_page, server_url, advanced_add_url, test_image
     ):
         """Test ImageChooserBlock inside a StructBlock (HeroBlock)."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Hero With Image Page")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -896,17 +712,15 @@ class TestStreamFieldHelperImageChooserE2E:
         # Wait for selection
         authenticated_page.wait_for_timeout(500)
 
-        # Save the page
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("hero-with-image")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Hero With Image Page", "id_slug": "hero-with-image"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
         # Verify the image was saved
-        from tests.testapp.models import AdvancedStreamFieldPage
-
         created_page = AdvancedStreamFieldPage.objects.get(title="Hero With Image Page")
         assert created_page.body[0].block_type == "hero"
         assert created_page.body[0].value["title"] == "Welcome Hero"
@@ -915,18 +729,12 @@ class TestStreamFieldHelperImageChooserE2E:
         assert created_page.body[0].value["image"].title == test_image.title
 
     def test_save_page_with_standalone_image(
-        self, authenticated_page, server_url, home_page, test_image
+        self, authenticated_page, server_url, advanced_add_url, test_image
     ):
         """Test saving a page with a standalone ImageChooserBlock."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Standalone Image Page")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -940,17 +748,15 @@ class TestStreamFieldHelperImageChooserE2E:
         # Wait for selection
         authenticated_page.wait_for_timeout(500)
 
-        # Save the page
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("standalone-image")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Standalone Image Page", "id_slug": "standalone-image"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
         # Verify the image was saved
-        from tests.testapp.models import AdvancedStreamFieldPage
-
         created_page = AdvancedStreamFieldPage.objects.get(
             title="Standalone Image Page"
         )
@@ -965,16 +771,12 @@ class TestStreamFieldHelperSnippetChooserE2E:
     """E2E tests for SnippetChooserBlock with click_chooser and select_from_chooser."""
 
     def test_click_chooser_opens_snippet_modal(
-        self, authenticated_page, server_url, home_page, test_snippet
+        self, authenticated_page, server_url, advanced_add_url, test_snippet
     ):
         """Test that click_chooser opens the snippet chooser modal."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         authenticated_page.locator("#id_title").fill("Snippet Chooser Test Page")
 
@@ -991,16 +793,12 @@ class TestStreamFieldHelperSnippetChooserE2E:
         assert modal.count() > 0, "Snippet chooser modal should be open"
 
     def test_select_snippet_from_chooser(
-        self, authenticated_page, server_url, home_page, test_snippet
+        self, authenticated_page, server_url, advanced_add_url, test_snippet
     ):
         """Test selecting a snippet from the chooser modal."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         authenticated_page.locator("#id_title").fill("Select Snippet Test Page")
 
@@ -1021,18 +819,12 @@ class TestStreamFieldHelperSnippetChooserE2E:
         assert modal.count() == 0, "Modal should be closed after selection"
 
     def test_save_page_with_snippet(
-        self, authenticated_page, server_url, home_page, test_snippet
+        self, authenticated_page, server_url, advanced_add_url, test_snippet
     ):
         """Test saving a page with a SnippetChooserBlock."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Page With Snippet")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1045,17 +837,15 @@ class TestStreamFieldHelperSnippetChooserE2E:
 
         authenticated_page.wait_for_timeout(500)
 
-        # Save the page
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("page-with-snippet")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Page With Snippet", "id_slug": "page-with-snippet"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
         # Verify the snippet was saved
-        from tests.testapp.models import AdvancedStreamFieldPage
-
         created_page = AdvancedStreamFieldPage.objects.get(title="Page With Snippet")
         assert created_page.body[0].block_type == "snippet"
         assert created_page.body[0].value is not None
@@ -1068,16 +858,12 @@ class TestStreamFieldHelperPageChooserE2E:
     """E2E tests for PageChooserBlock with click_chooser and select_from_chooser."""
 
     def test_click_chooser_opens_page_modal(
-        self, authenticated_page, server_url, home_page, test_related_page
+        self, authenticated_page, server_url, advanced_add_url, test_related_page
     ):
         """Test that click_chooser opens the page chooser modal."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         authenticated_page.locator("#id_title").fill("Page Chooser Test Page")
 
@@ -1093,7 +879,9 @@ class TestStreamFieldHelperPageChooserE2E:
         modal = authenticated_page.locator(".modal")
         assert modal.count() > 0, "Page chooser modal should be open"
 
-    def test_select_page_from_chooser(self, authenticated_page, server_url, home_page):
+    def test_select_page_from_chooser(
+        self, authenticated_page, server_url, home_page, advanced_add_url
+    ):
         """Test selecting a page from the chooser modal.
 
         Note: PageChooser shows a hierarchical view. This test selects the
@@ -1101,11 +889,7 @@ class TestStreamFieldHelperPageChooserE2E:
         """
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         authenticated_page.locator("#id_title").fill("Select Page Test Page")
 
@@ -1126,18 +910,12 @@ class TestStreamFieldHelperPageChooserE2E:
         assert modal.count() == 0, "Modal should be closed after selection"
 
     def test_save_page_with_related_page(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, home_page, advanced_add_url
     ):
         """Test saving a page with a PageChooserBlock."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Page With Related Page")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1150,17 +928,15 @@ class TestStreamFieldHelperPageChooserE2E:
 
         authenticated_page.wait_for_timeout(500)
 
-        # Save the page
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("page-with-related-page")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Page With Related Page", "id_slug": "page-with-related-page"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
         # Verify the related page was saved
-        from tests.testapp.models import AdvancedStreamFieldPage
-
         created_page = AdvancedStreamFieldPage.objects.get(
             title="Page With Related Page"
         )
@@ -1175,16 +951,12 @@ class TestStreamFieldHelperDocumentChooserE2E:
     """E2E tests for DocumentChooserBlock with click_chooser and select_from_chooser."""
 
     def test_click_chooser_opens_document_modal(
-        self, authenticated_page, server_url, home_page, test_document
+        self, authenticated_page, server_url, advanced_add_url, test_document
     ):
         """Test that click_chooser opens the document chooser modal."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         authenticated_page.locator("#id_title").fill("Document Chooser Test Page")
 
@@ -1201,16 +973,12 @@ class TestStreamFieldHelperDocumentChooserE2E:
         assert modal.count() > 0, "Document chooser modal should be open"
 
     def test_select_document_from_chooser(
-        self, authenticated_page, server_url, home_page, test_document
+        self, authenticated_page, server_url, advanced_add_url, test_document
     ):
         """Test selecting a document from the chooser modal."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(advanced_add_url)
 
         authenticated_page.locator("#id_title").fill("Select Document Test Page")
 
@@ -1231,18 +999,12 @@ class TestStreamFieldHelperDocumentChooserE2E:
         assert modal.count() == 0, "Modal should be closed after selection"
 
     def test_save_page_with_document(
-        self, authenticated_page, server_url, home_page, test_document
+        self, authenticated_page, server_url, advanced_add_url, test_document
     ):
         """Test saving a page with a DocumentChooserBlock."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(
-            home_page.id, "testapp", "advancedstreamfieldpage"
-        )
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Page With Document")
+        page_admin.goto(advanced_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1255,17 +1017,15 @@ class TestStreamFieldHelperDocumentChooserE2E:
 
         authenticated_page.wait_for_timeout(500)
 
-        # Save the page
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("page-with-document")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Page With Document", "id_slug": "page-with-document"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
         # Verify the document was saved
-        from tests.testapp.models import AdvancedStreamFieldPage
-
         created_page = AdvancedStreamFieldPage.objects.get(title="Page With Document")
         assert created_page.body[0].block_type == "document"
         assert created_page.body[0].value is not None
@@ -1277,13 +1037,13 @@ class TestStreamFieldHelperDocumentChooserE2E:
 class TestStreamFieldHelperDeleteBlockE2E:
     """E2E tests for StreamFieldHelper.delete_block()."""
 
-    def test_delete_block_hides_block(self, authenticated_page, server_url, home_page):
+    def test_delete_block_hides_block(
+        self, authenticated_page, server_url, streamfield_add_url
+    ):
         """Test that delete_block hides the block."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(streamfield_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1303,13 +1063,13 @@ class TestStreamFieldHelperDeleteBlockE2E:
         assert sf.is_block_deleted(1) is True
         assert sf.is_block_deleted(0) is False
 
-    def test_delete_first_block(self, authenticated_page, server_url, home_page):
+    def test_delete_first_block(
+        self, authenticated_page, server_url, streamfield_add_url
+    ):
         """Test deleting the first block."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(streamfield_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1326,13 +1086,13 @@ class TestStreamFieldHelperDeleteBlockE2E:
         assert sf.is_block_deleted(0) is True
         assert sf.is_block_deleted(1) is False
 
-    def test_delete_multiple_blocks(self, authenticated_page, server_url, home_page):
+    def test_delete_multiple_blocks(
+        self, authenticated_page, server_url, streamfield_add_url
+    ):
         """Test deleting multiple blocks."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(streamfield_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1353,15 +1113,13 @@ class TestStreamFieldHelperDeleteBlockE2E:
         assert sf.is_block_deleted(1) is False
         assert sf.is_block_deleted(2) is True
 
-    def test_save_page_after_delete(self, authenticated_page, server_url, home_page):
+    def test_save_page_after_delete(
+        self, authenticated_page, server_url, streamfield_add_url
+    ):
         """Test saving a page after deleting a block."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Page After Delete")
+        page_admin.goto(streamfield_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1374,37 +1132,30 @@ class TestStreamFieldHelperDeleteBlockE2E:
         # Delete the second block
         sf.delete_block(1)
 
-        # Save the page
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("page-after-delete")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Page After Delete", "id_slug": "page-after-delete"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
         # Verify only the first block was saved
-        from tests.testapp.models import StreamFieldPage
-
-        created_page = StreamFieldPage.objects.get(title="Page After Delete")
-        assert len(created_page.body) == 1
-        assert created_page.body[0].block_type == "heading"
-        assert created_page.body[0].value == "Keep This"
+        assert_streamfield_content(
+            StreamFieldPage, "Page After Delete", [("heading", "Keep This")]
+        )
 
     def test_delete_invalid_index_raises_error(
-        self, authenticated_page, server_url, home_page
+        self, authenticated_page, server_url, streamfield_add_url
     ):
         """Test that deleting an invalid index raises ValueError."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(streamfield_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
         # Try to delete non-existent block
-        import pytest
-
         with pytest.raises(ValueError, match="Block at index 5 not found"):
             sf.delete_block(5)
 
@@ -1414,13 +1165,11 @@ class TestStreamFieldHelperDeleteBlockE2E:
 class TestStreamFieldHelperReorderBlocksE2E:
     """E2E tests for StreamFieldHelper block reordering."""
 
-    def test_move_block_up(self, authenticated_page, server_url, home_page):
+    def test_move_block_up(self, authenticated_page, server_url, streamfield_add_url):
         """Test moving a block up one position."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(streamfield_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1441,13 +1190,11 @@ class TestStreamFieldHelperReorderBlocksE2E:
         assert sf.get_block_order(1) == 0
         assert sf.get_block_order(0) == 1
 
-    def test_move_block_down(self, authenticated_page, server_url, home_page):
+    def test_move_block_down(self, authenticated_page, server_url, streamfield_add_url):
         """Test moving a block down one position."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(streamfield_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1464,13 +1211,13 @@ class TestStreamFieldHelperReorderBlocksE2E:
         assert sf.get_block_order(0) == 1
         assert sf.get_block_order(1) == 0
 
-    def test_reorder_blocks_move_up(self, authenticated_page, server_url, home_page):
+    def test_reorder_blocks_move_up(
+        self, authenticated_page, server_url, streamfield_add_url
+    ):
         """Test reorder_blocks moving a block up multiple positions."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(streamfield_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1490,13 +1237,13 @@ class TestStreamFieldHelperReorderBlocksE2E:
         assert sf.get_block_order(0) == 1
         assert sf.get_block_order(1) == 2
 
-    def test_reorder_blocks_move_down(self, authenticated_page, server_url, home_page):
+    def test_reorder_blocks_move_down(
+        self, authenticated_page, server_url, streamfield_add_url
+    ):
         """Test reorder_blocks moving a block down multiple positions."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
+        page_admin.goto(streamfield_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1516,15 +1263,13 @@ class TestStreamFieldHelperReorderBlocksE2E:
         assert sf.get_block_order(1) == 0
         assert sf.get_block_order(2) == 1
 
-    def test_save_page_after_reorder(self, authenticated_page, server_url, home_page):
+    def test_save_page_after_reorder(
+        self, authenticated_page, server_url, streamfield_add_url
+    ):
         """Test saving a page after reordering blocks."""
         page_admin = PageAdminPage(authenticated_page, server_url)
 
-        url = page_admin.add_child_page_url(home_page.id, "testapp", "streamfieldpage")
-        page_admin.goto(url)
-        page_admin.wait_for_navigation()
-
-        authenticated_page.locator("#id_title").fill("Reordered Page")
+        page_admin.goto(streamfield_add_url)
 
         sf = StreamFieldHelper(authenticated_page, "body")
 
@@ -1539,20 +1284,18 @@ class TestStreamFieldHelperReorderBlocksE2E:
         # Move block 2 to the top
         sf.reorder_blocks(2, 0)
 
-        # Save the page
-        authenticated_page.get_by_role("tab", name="Promote").click()
-        authenticated_page.locator("#id_slug").fill("reordered-page")
-        authenticated_page.get_by_role("button", name="Save draft").click()
-        page_admin.wait_for_navigation()
+        # Fill title and slug
+        page_admin.fill_form(
+            {"id_title": "Reordered Page", "id_slug": "reordered-page"}
+        )
+        page_admin.save_draft(wait=False)
 
         page_admin.assert_success_message()
 
         # Verify the order was saved correctly
-        from tests.testapp.models import StreamFieldPage
-
-        created_page = StreamFieldPage.objects.get(title="Reordered Page")
-        assert len(created_page.body) == 3
         # After reorder, order should be: Third, First, Second
-        assert created_page.body[0].value == "Third"
-        assert created_page.body[1].value == "First"
-        assert created_page.body[2].value == "Second"
+        assert_streamfield_content(
+            StreamFieldPage,
+            "Reordered Page",
+            [("heading", "Third"), ("heading", "First"), ("quote", "Second")],
+        )
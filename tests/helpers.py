@@ -0,0 +1,41 @@
+"""Shared assertion helpers for the E2E tests."""
+
+
+def _plain(value):
+    """Strip block ids and unwrap ListBlock items in raw StreamField data."""
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        if value.keys() == {"type", "value", "id"} and value["type"] == "item":
+            return _plain(value["value"])
+        return {key: _plain(item) for key, item in value.items() if key != "id"}
+    return value
+
+
+def assert_streamfield_content(model, title, expected, field_name="body"):
+    """
+    Assert the saved StreamField content of a page in one query.
+
+    Reads the field's raw JSON with values_list(), so no page instance or
+    block values (StructValue, ListValue, ...) are built. Block ids are
+    ignored and ListBlock items compare as their plain values.
+
+    Args:
+        model: The page model class
+        title: Title of the saved page
+        expected: List of (block_type, value) tuples in block order
+        field_name: The name of the StreamField (default: "body")
+
+    Example:
+        assert_streamfield_content(
+            AdvancedStreamFieldPage,
+            "Complete Page",
+            [
+                ("heading", "Welcome"),
+                ("links", [{"title": "Docs", "url": "https://docs.example.com"}]),
+            ],
+        )
+    """
+    stream = model.objects.values_list(field_name, flat=True).get(title=title)
+    actual = [(block["type"], _plain(block["value"])) for block in stream.raw_data]
+    assert actual == expected
@@ -1,5 +1,6 @@
 """Django settings for tests."""
 
+import hashlib
 import os
 import tempfile
 
@@ -65,6 +66,21 @@ TEMPLATES = [
     },
 ]
 
+# Stable per checkout, so `pytest --reuse-db` keeps the migrated test
+# database between runs while separate checkouts never share one.
+# tests/conftest.py switches to it only when --reuse-db is passed
+REUSABLE_TEST_DB_NAME = os.path.join(
+    tempfile.gettempdir(),
+    f"wagtail_scenario_test_{hashlib.sha1(BASE_DIR.encode()).hexdigest()[:12]}.db",
+)
+
+# Unique per run by default, so concurrent runs never share a database.
+# WAGTAIL_SCENARIO_TEST_DB pins the file (e.g. one per CI job); pytest-django
+# adds a per-worker suffix under xdist
+TEST_DB_NAME = os.environ.get("WAGTAIL_SCENARIO_TEST_DB") or tempfile.mktemp(
+    suffix=".db"
+)
+
 # Database
 # Use file-based SQLite for E2E tests to avoid threading issues
 # with in-memory SQLite on certain Python/Django version combinations
@@ -72,9 +88,7 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": tempfile.mktemp(suffix=".db"),
-        "TEST": {
-            "NAME": tempfile.mktemp(suffix=".db"),
-        },
+        "TEST": {"NAME": TEST_DB_NAME},
     }
 }
 
@@ -99,5 +113,10 @@ STATIC_URL = "/static/"
 WAGTAIL_SITE_NAME = "Test Site"
 WAGTAILADMIN_BASE_URL = "http://localhost:8000"
 
+# Resolve embeds locally so EmbedBlock validation never calls oEmbed providers
+WAGTAILEMBEDS_FINDERS = [
+    {"class": "tests.testapp.embeds.FakeEmbedFinder"},
+]
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
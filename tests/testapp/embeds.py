@@ -0,0 +1,22 @@
+"""Embed finder for tests that must not reach real oEmbed providers."""
+
+from wagtail.embeds.finders.base import EmbedFinder
+
+
+class FakeEmbedFinder(EmbedFinder):
+    """Accept any URL and return a canned video embed without network access."""
+
+    def accept(self, url):
+        return True
+
+    def find_embed(self, url, max_width=None, max_height=None):
+        return {
+            "title": "Test Video",
+            "author_name": "Test Author",
+            "provider_name": "Test Provider",
+            "type": "video",
+            "thumbnail_url": None,
+            "width": 640,
+            "height": 360,
+            "html": f'<iframe src="{url}"></iframe>',
+        }
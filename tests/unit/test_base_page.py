@@ -1,5 +1,7 @@
 """Unit tests for BasePage."""
 
+import pytest
+
 from wagtail_scenario_test.page_objects.base import BasePage
 
 
@@ -31,6 +33,16 @@ class TestBasePageNavigation:
 
         mock_page.goto.assert_called_once_with("http://localhost:8000/admin/")
 
+    def test_goto_passes_wait_until(self, mock_page, test_url):
+        """goto should forward wait_until to Playwright when given."""
+        base = BasePage(mock_page, test_url)
+
+        base.goto("/admin/", wait_until="domcontentloaded")
+
+        mock_page.goto.assert_called_once_with(
+            "http://localhost:8000/admin/", wait_until="domcontentloaded"
+        )
+
     def test_current_path_returns_path_without_base(self, mock_page, test_url):
         """current_path should return URL path without base_url."""
         mock_page.url = "http://localhost:8000/admin/snippets/"
@@ -198,6 +210,28 @@ class TestBasePageInteractions:
         mock_page.get_by_label.assert_called_once_with("Subscribe")
         mock_page.get_by_label.return_value.uncheck.assert_called_once()
 
+    def test_fill_form_uses_one_evaluate(self, mock_page, test_url):
+        """fill_form should set every field in a single browser call."""
+        mock_page.evaluate.return_value = []
+        base = BasePage(mock_page, test_url)
+
+        base.fill_form({"id_title": "My Page", "#id_slug": "my-page"})
+
+        mock_page.evaluate.assert_called_once()
+        assert mock_page.evaluate.call_args.args[1] == [
+            [["#id_title", "My Page"], ["#id_slug", "my-page"]],
+            ["input"],
+        ]
+        mock_page.locator.assert_not_called()
+
+    def test_fill_form_raises_for_missing_fields(self, mock_page, test_url):
+        """fill_form should fail when a field is not on the page."""
+        mock_page.evaluate.return_value = ["#id_missing"]
+        base = BasePage(mock_page, test_url)
+
+        with pytest.raises(ValueError, match="#id_missing"):
+            base.fill_form({"id_missing": "value"})
+
 
 class TestBasePageAssertions:
     """Tests for BasePage assertion methods."""
@@ -63,14 +63,24 @@ class TestWagtailAdminSnippet:
         assert result.app_name == "myapp"
         assert result.model_name == "sub.model"
 
-    def test_snippet_returns_new_instance(self, mock_page, test_url):
-        """snippet should return new instance each time."""
+    def test_snippet_reuses_instance_for_same_model(self, mock_page, test_url):
+        """snippet should return the same instance for the same model."""
         admin = WagtailAdmin(mock_page, test_url)
 
         result1 = admin.snippet("myapp.mymodel")
         result2 = admin.snippet("myapp.mymodel")
 
+        assert result1 is result2
+
+    def test_snippet_returns_new_instance_per_model(self, mock_page, test_url):
+        """snippet should return a separate instance for each model."""
+        admin = WagtailAdmin(mock_page, test_url)
+
+        result1 = admin.snippet("myapp.mymodel")
+        result2 = admin.snippet("myapp.othermodel")
+
         assert result1 is not result2
+        assert result2.model_name == "othermodel"
 
     def test_snippet_shares_page(self, mock_page, test_url):
         """snippet instances should share the same page."""
@@ -147,6 +157,7 @@ class TestWagtailAdminDelegation:
     ):
         """assert_success_message should pass contains argument."""
         admin = WagtailAdmin(mock_page, test_url)
+        mock_page.locator.return_value.text_content.return_value = "Item Created"
 
         admin.assert_success_message(contains="Created")
 
@@ -188,18 +199,18 @@ class TestWagtailAdminChaining:
 class TestWagtailAdminAdditionalMethods:
     """Tests for additional WagtailAdmin methods."""
 
-    def test_is_logged_in_returns_true_on_admin(self, mock_page, test_url):
-        """is_logged_in should return True when on admin page."""
-        mock_page.url = f"{test_url}/admin/"
+    def test_is_logged_in_returns_true_with_session(self, mock_page, test_url):
+        """is_logged_in should return True when a session cookie exists."""
+        mock_page.context.cookies.return_value = [{"name": "sessionid"}]
         admin = WagtailAdmin(mock_page, test_url)
 
         result = admin.is_logged_in()
 
         assert result is True
 
-    def test_is_logged_in_returns_false_on_login(self, mock_page, test_url):
-        """is_logged_in should return False when on login page."""
-        mock_page.url = f"{test_url}/admin/login/"
+    def test_is_logged_in_returns_false_without_session(self, mock_page, test_url):
+        """is_logged_in should return False without a session cookie."""
+        mock_page.context.cookies.return_value = []
         admin = WagtailAdmin(mock_page, test_url)
 
         result = admin.is_logged_in()
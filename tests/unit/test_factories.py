@@ -4,8 +4,11 @@ import pytest
 from django.contrib.auth import get_user_model
 
 from wagtail_scenario_test.utils.factories import (
+    DEFAULT_PASSWORD,
+    UserModel,
     WagtailSuperUserFactory,
     WagtailUserFactory,
+    fast_password_hasher,
 )
 
 User = get_user_model()
@@ -40,6 +43,38 @@ class TestWagtailUserFactory:
 
         assert user.check_password("password123")
 
+    def test_sets_custom_password(self):
+        """WagtailUserFactory should hash an explicitly passed password."""
+        user = WagtailUserFactory(password="secret")
+
+        assert user.check_password("secret")
+        assert not user.check_password("password123")
+
+    def test_default_password_constant(self):
+        """DEFAULT_PASSWORD should be the password of default users."""
+        user = WagtailUserFactory()
+
+        assert user.check_password(DEFAULT_PASSWORD)
+
+    def test_reuses_password_hash(self):
+        """Users with the same password should share one computed hash."""
+        user1 = WagtailUserFactory()
+        user2 = WagtailUserFactory()
+
+        assert user1.password == user2.password
+
+    def test_creates_user_without_update(self):
+        """WagtailUserFactory should persist the hashed password in one INSERT."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            WagtailUserFactory(password="single-insert")
+
+        statements = [q["sql"].lstrip().upper() for q in queries.captured_queries]
+        assert sum(sql.startswith("INSERT") for sql in statements) == 1
+        assert not any(sql.startswith("UPDATE") for sql in statements)
+
     def test_user_is_active(self):
         """WagtailUserFactory should create active user."""
         user = WagtailUserFactory()
@@ -65,6 +100,15 @@ class TestWagtailUserFactory:
 
         assert user1.pk == user2.pk
 
+    def test_password_override_updates_existing_user(self):
+        """An explicit password should be applied to an existing username."""
+        WagtailSuperUserFactory(username="same_admin", password="first")
+        user = WagtailSuperUserFactory(username="same_admin", password="second")
+
+        user.refresh_from_db()
+        assert user.check_password("second")
+        assert not user.check_password("first")
+
     def test_unique_usernames_by_sequence(self):
         """WagtailUserFactory should create unique usernames."""
         user1 = WagtailUserFactory()
@@ -73,6 +117,53 @@ class TestWagtailUserFactory:
         assert user1.username != user2.username
 
 
+@pytest.mark.django_db
+class TestWagtailUserFactoryBulk:
+    """Tests for WagtailUserFactory.bulk()."""
+
+    def test_creates_n_users(self):
+        """bulk should create and return n saved users."""
+        users = WagtailUserFactory.bulk(3)
+
+        assert len(users) == 3
+        assert all(user.pk for user in users)
+        assert User.objects.filter(pk__in=[u.pk for u in users]).count() == 3
+
+    def test_uses_single_insert(self):
+        """bulk should save every user in one INSERT."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            WagtailUserFactory.bulk(5)
+
+        statements = [q["sql"].lstrip().upper() for q in queries.captured_queries]
+        assert sum(sql.startswith("INSERT") for sql in statements) == 1
+
+    def test_users_can_log_in_with_default_password(self):
+        """bulk users should share the default password hash."""
+        users = WagtailUserFactory.bulk(2)
+
+        assert users[0].password == users[1].password
+        assert users[0].check_password(DEFAULT_PASSWORD)
+
+    def test_skips_existing_usernames(self):
+        """bulk should return the existing user for a taken username."""
+        existing = WagtailUserFactory(username="taken")
+
+        users = WagtailUserFactory.bulk(1, username="taken")
+
+        assert users[0].pk == existing.pk
+        assert User.objects.filter(username="taken").count() == 1
+
+    def test_superuser_factory_keeps_flags(self):
+        """bulk on WagtailSuperUserFactory should create superusers."""
+        users = WagtailSuperUserFactory.bulk(2)
+
+        assert all(user.is_superuser and user.is_staff for user in users)
+        assert all(user.username.startswith("admin") for user in users)
+
+
 @pytest.mark.django_db
 class TestWagtailSuperUserFactory:
     """Tests for WagtailSuperUserFactory."""
@@ -108,8 +199,36 @@ class TestWagtailSuperUserFactory:
 
         assert admin.check_password("password123")
 
+    def test_shares_module_user_model(self):
+        """Both factories should use the module-level UserModel."""
+        assert WagtailUserFactory._meta.model is UserModel
+        assert WagtailSuperUserFactory._meta.model is UserModel
+        assert UserModel is User
+
     def test_inherits_email_generation(self):
         """WagtailSuperUserFactory should inherit email generation."""
         admin = WagtailSuperUserFactory(username="myadmin")
 
         assert admin.email == "myadmin@example.com"
+
+
+@pytest.mark.django_db
+class TestFastPasswordHasher:
+    """Tests for fast_password_hasher."""
+
+    def test_uses_md5_hasher(self):
+        """Users created inside the block should get an MD5 hash."""
+        with fast_password_hasher():
+            user = WagtailUserFactory()
+
+            assert user.password.startswith("md5$")
+            assert user.check_password("password123")
+
+    def test_restores_hashers(self):
+        """The default hasher should be used again after the block."""
+        with fast_password_hasher():
+            pass
+
+        user = WagtailUserFactory()
+
+        assert not user.password.startswith("md5$")
@@ -141,85 +141,104 @@ class TestAdminUserE2EFixture:
         assert admin_user_e2e.check_password("e2e_password_123")
 
 
+@pytest.mark.django_db
 class TestAuthenticatedPageFunction:
     """Tests for authenticated_page fixture function logic."""
 
-    def test_navigates_to_login(self):
-        """authenticated_page should navigate to login page."""
-        from wagtail_scenario_test.fixtures import authenticated_page
-
-        mock_page = MagicMock()
-        server_url = "http://localhost:8000"
-        credentials = {"username": "admin", "password": "pass"}
+    SERVER_URL = "http://localhost:8000"
 
-        # Get the internal function (unwrap the fixture)
-        authenticated_page.__wrapped__(mock_page, server_url, None, credentials)
+    def test_adds_session_cookie(self, admin_user_e2e):
+        """authenticated_page should hand a valid session cookie to the browser."""
+        from django.contrib.sessions.models import Session
 
-        mock_page.goto.assert_called_once_with(f"{server_url}/admin/login/")
-
-    def test_fills_username(self):
-        """authenticated_page should fill username."""
         from wagtail_scenario_test.fixtures import authenticated_page
 
         mock_page = MagicMock()
-        server_url = "http://localhost:8000"
-        credentials = {"username": "admin", "password": "pass"}
 
-        authenticated_page.__wrapped__(mock_page, server_url, None, credentials)
+        authenticated_page.__wrapped__(
+            mock_page, self.SERVER_URL, admin_user_e2e, "/admin/"
+        )
 
-        mock_page.get_by_label.assert_any_call("Username")
+        (cookies,) = mock_page.context.add_cookies.call_args.args
+        assert len(cookies) == 1
+        assert cookies[0]["name"] == "sessionid"
+        assert cookies[0]["url"] == self.SERVER_URL
+        session = Session.objects.get(session_key=cookies[0]["value"])
+        assert session.get_decoded()["_auth_user_id"] == str(admin_user_e2e.pk)
 
-    def test_fills_password(self):
-        """authenticated_page should fill password."""
+    def test_navigates_to_dashboard(self, admin_user_e2e):
+        """authenticated_page should open the admin dashboard."""
         from wagtail_scenario_test.fixtures import authenticated_page
 
         mock_page = MagicMock()
-        server_url = "http://localhost:8000"
-        credentials = {"username": "admin", "password": "pass"}
 
-        authenticated_page.__wrapped__(mock_page, server_url, None, credentials)
+        authenticated_page.__wrapped__(
+            mock_page, self.SERVER_URL, admin_user_e2e, "/admin/"
+        )
 
-        mock_page.get_by_label.assert_any_call("Password")
+        mock_page.goto.assert_called_once_with(f"{self.SERVER_URL}/admin/")
 
-    def test_clicks_sign_in(self):
-        """authenticated_page should click Sign in button."""
+    def test_skips_navigation_without_start_path(self, admin_user_e2e):
+        """authenticated_page should stay blank when the start path is None."""
         from wagtail_scenario_test.fixtures import authenticated_page
 
         mock_page = MagicMock()
-        server_url = "http://localhost:8000"
-        credentials = {"username": "admin", "password": "pass"}
 
-        authenticated_page.__wrapped__(mock_page, server_url, None, credentials)
+        authenticated_page.__wrapped__(mock_page, self.SERVER_URL, admin_user_e2e, None)
 
-        mock_page.get_by_role.assert_called_once_with("button", name="Sign in")
+        mock_page.context.add_cookies.assert_called_once()
+        mock_page.goto.assert_not_called()
 
-    def test_waits_for_redirect(self):
-        """authenticated_page should wait for admin redirect."""
+    def test_does_not_submit_login_form(self, admin_user_e2e):
+        """authenticated_page should not go through the login form."""
         from wagtail_scenario_test.fixtures import authenticated_page
 
         mock_page = MagicMock()
-        server_url = "http://localhost:8000"
-        credentials = {"username": "admin", "password": "pass"}
 
-        authenticated_page.__wrapped__(mock_page, server_url, None, credentials)
+        authenticated_page.__wrapped__(
+            mock_page, self.SERVER_URL, admin_user_e2e, "/admin/"
+        )
 
-        mock_page.wait_for_url.assert_called_once_with(f"{server_url}/admin/**")
+        mock_page.get_by_label.assert_not_called()
+        mock_page.get_by_role.assert_not_called()
 
-    def test_returns_page(self):
+    def test_returns_page(self, admin_user_e2e):
         """authenticated_page should return the page."""
         from wagtail_scenario_test.fixtures import authenticated_page
 
         mock_page = MagicMock()
-        server_url = "http://localhost:8000"
-        credentials = {"username": "admin", "password": "pass"}
 
         result = authenticated_page.__wrapped__(
-            mock_page, server_url, None, credentials
+            mock_page, self.SERVER_URL, admin_user_e2e, "/admin/"
         )
 
         assert result is mock_page
 
 
+@pytest.mark.django_db
+class TestAuthenticatedStorageStateFunction:
+    """Tests for _authenticated_storage_state fixture function logic."""
+
+    def test_saves_session_cookie_without_loading_a_page(self, tmp_path):
+        """The storage state should be built from a server-side session."""
+        from wagtail_scenario_test.fixtures import _authenticated_storage_state
+
+        mock_browser = MagicMock()
+        mock_live_server = MagicMock(url="http://localhost:8000")
+        path = tmp_path / "storage_state.json"
+
+        result = _authenticated_storage_state.__wrapped__(
+            mock_browser, mock_live_server, None, MagicMock(), path
+        )
+
+        context = mock_browser.new_context.return_value
+        (cookies,) = context.add_cookies.call_args.args
+        assert cookies[0]["name"] == "sessionid"
+        context.new_page.assert_not_called()
+        context.storage_state.assert_called_once_with(path=str(path))
+        assert result == path
+
+
 class TestPytestConfigure:
     """Tests for pytest_configure hook."""
 
@@ -246,3 +265,54 @@ class TestPytestConfigure:
         # Check that addinivalue_line was called for slow marker
         calls = [str(c) for c in mock_config.addinivalue_line.call_args_list]
         assert any("slow" in str(c) for c in calls)
+
+
+class TestPytestSessionfinish:
+    """Tests for pytest_sessionfinish hook."""
+
+    def test_skips_without_gif_option(self):
+        """pytest_sessionfinish should do nothing without --gif."""
+        from unittest.mock import patch
+
+        from wagtail_scenario_test.fixtures import pytest_sessionfinish
+
+        session = MagicMock()
+        session.config.getoption.return_value = False
+
+        with patch(
+            "wagtail_scenario_test.utils.video.convert_all_videos_to_gif"
+        ) as mock_convert:
+            pytest_sessionfinish(session, 0)
+
+        mock_convert.assert_not_called()
+
+    def test_skips_on_xdist_worker(self, tmp_path, monkeypatch):
+        """pytest_sessionfinish should leave GIF conversion to the controller."""
+        from unittest.mock import patch
+
+        from wagtail_scenario_test.fixtures import pytest_sessionfinish
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "test-results").mkdir()
+        worker = MagicMock()
+        worker.config.getoption.return_value = True
+        worker.config.workerinput = {"workerid": "gw0"}
+        controller = MagicMock()
+        controller.config = MagicMock(spec=["getoption"])
+        controller.config.getoption.return_value = True
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch(
+                "wagtail_scenario_test.utils.video.convert_all_videos_to_gif",
+                return_value=[],
+            ) as mock_convert,
+        ):
+            pytest_sessionfinish(worker, 0)
+            mock_convert.assert_not_called()
+
+            pytest_sessionfinish(controller, 0)
+            mock_convert.assert_called_once()
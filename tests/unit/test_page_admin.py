@@ -54,6 +54,14 @@ class TestPageAdminPageUrls:
 
         assert url == "/admin/pages/42/edit/"
 
+    def test_unpublish_page_url(self, mock_page, test_url):
+        """unpublish_page_url should return correct URL."""
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        url = page_admin.unpublish_page_url(page_id=42)
+
+        assert url == "/admin/pages/42/unpublish/"
+
     def test_delete_page_url(self, mock_page, test_url):
         """delete_page_url should return correct URL."""
         page_admin = PageAdminPage(mock_page, test_url)
@@ -76,20 +84,18 @@ class TestPageAdminPageGetLiveUrl:
 
     def test_get_live_url_returns_href(self, mock_page, test_url):
         """get_live_url should return href when status link exists."""
-        mock_link = mock_page.locator.return_value
-        mock_link.count.return_value = 1
-        mock_link.first.get_attribute.return_value = "/my-page/"
+        mock_page.evaluate.return_value = "/my-page/"
 
         page_admin = PageAdminPage(mock_page, test_url)
         url = page_admin.get_live_url()
 
-        mock_page.locator.assert_called_with("a.page-status-tag[href]")
+        mock_page.evaluate.assert_called_once()
+        assert "a.page-status-tag[href]" in mock_page.evaluate.call_args[0][0]
         assert url == "/my-page/"
 
     def test_get_live_url_returns_none_when_not_found(self, mock_page, test_url):
         """get_live_url should return None when status link not found."""
-        mock_link = mock_page.locator.return_value
-        mock_link.count.return_value = 0
+        mock_page.evaluate.return_value = None
 
         page_admin = PageAdminPage(mock_page, test_url)
         url = page_admin.get_live_url()
@@ -117,6 +123,17 @@ class TestPageAdminPageEditPage:
         # Should call wait_for_load_state (from wait_for_navigation)
         mock_page.wait_for_load_state.assert_called()
 
+    def test_edit_page_with_wait_until(self, mock_page, test_url):
+        """edit_page with wait_until should skip the network idle wait."""
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_admin.edit_page(page_id=5, wait_until="domcontentloaded")
+
+        mock_page.goto.assert_called_once_with(
+            f"{test_url}/admin/pages/5/edit/", wait_until="domcontentloaded"
+        )
+        mock_page.wait_for_load_state.assert_not_called()
+
 
 class TestPageAdminPageVisitPreview:
     """Tests for PageAdminPage visit_preview method."""
@@ -137,15 +154,24 @@ class TestPageAdminPageVisitPreview:
 
         mock_page.wait_for_load_state.assert_called()
 
+    def test_visit_preview_with_wait_until(self, mock_page, test_url):
+        """visit_preview with wait_until should skip the network idle wait."""
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_admin.visit_preview(page_id=5, wait_until="domcontentloaded")
+
+        mock_page.goto.assert_called_once_with(
+            f"{test_url}/admin/pages/5/edit/preview/", wait_until="domcontentloaded"
+        )
+        mock_page.wait_for_load_state.assert_not_called()
+
 
 class TestPageAdminPageVisitLive:
     """Tests for PageAdminPage visit_live method."""
 
     def test_visit_live_navigates_to_live_url(self, mock_page, test_url):
         """visit_live should navigate to the live URL."""
-        mock_link = mock_page.locator.return_value
-        mock_link.count.return_value = 1
-        mock_link.first.get_attribute.return_value = "/my-page/"
+        mock_page.evaluate.return_value = "/my-page/"
 
         page_admin = PageAdminPage(mock_page, test_url)
 
@@ -156,12 +182,26 @@ class TestPageAdminPageVisitLive:
         # Then navigate to live URL
         mock_page.goto.assert_called_with(f"{test_url}/my-page/")
 
+    def test_visit_live_with_wait_until(self, mock_page, test_url):
+        """visit_live should pass wait_until to both navigations."""
+        mock_page.evaluate.return_value = "/my-page/"
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_admin.visit_live(page_id=5, wait_until="domcontentloaded")
+
+        mock_page.goto.assert_any_call(
+            f"{test_url}/admin/pages/5/edit/", wait_until="domcontentloaded"
+        )
+        mock_page.goto.assert_called_with(
+            f"{test_url}/my-page/", wait_until="domcontentloaded"
+        )
+        mock_page.wait_for_load_state.assert_not_called()
+
     def test_visit_live_raises_error_when_not_published(self, mock_page, test_url):
         """visit_live should raise ValueError when page has no live URL."""
         import pytest
 
-        mock_link = mock_page.locator.return_value
-        mock_link.count.return_value = 0
+        mock_page.evaluate.return_value = None
 
         page_admin = PageAdminPage(mock_page, test_url)
 
@@ -213,19 +253,16 @@ class TestPageAdminPageUnpublish:
     """Tests for PageAdminPage unpublish method."""
 
     def test_unpublish_with_page_id_and_confirm(self, mock_page, test_url):
-        """unpublish with page_id should navigate, open dropdown, and confirm."""
+        """unpublish with page_id should open the confirm page and confirm."""
         page_admin = PageAdminPage(mock_page, test_url)
 
         page_admin.unpublish(page_id=5)
 
-        # Should navigate to edit page first
-        mock_page.goto.assert_called_with(f"{test_url}/admin/pages/5/edit/")
-
-        # Should open "Actions" dropdown (exact match)
-        mock_page.get_by_role.assert_any_call("button", name="Actions", exact=True)
+        # Should go straight to the confirmation page, not the edit page
+        mock_page.goto.assert_called_once_with(f"{test_url}/admin/pages/5/unpublish/")
+        for call in mock_page.get_by_role.call_args_list:
+            assert call.args[:1] != ("link",)
 
-        # Should click Unpublish link and Yes, unpublish button
-        mock_page.get_by_role.assert_any_call("link", name="Unpublish", exact=True)
         mock_page.get_by_role.assert_any_call("button", name="Yes, unpublish")
 
     def test_unpublish_without_page_id(self, mock_page, test_url):
@@ -248,9 +285,8 @@ class TestPageAdminPageUnpublish:
 
         page_admin.unpublish(page_id=5, confirm=False)
 
-        # Should open "Actions" dropdown and click Unpublish link
-        mock_page.get_by_role.assert_any_call("button", name="Actions", exact=True)
-        mock_page.get_by_role.assert_any_call("link", name="Unpublish", exact=True)
+        # Should stop on the confirmation page
+        mock_page.goto.assert_called_once_with(f"{test_url}/admin/pages/5/unpublish/")
 
         # Should NOT call Yes, unpublish
         for call in mock_page.get_by_role.call_args_list:
@@ -307,6 +343,47 @@ class TestPageAdminPageDeletePage:
                 raise AssertionError("Yes, delete should not be clicked")
 
 
+class TestPageAdminPageEditorActions:
+    """Tests for PageAdminPage editor action methods."""
+
+    def test_open_promote_tab(self, mock_page, test_url):
+        """open_promote_tab should click the Promote tab label by id."""
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_admin.open_promote_tab()
+
+        mock_page.locator.assert_called_once_with("#tab-label-promote")
+        mock_page.locator.return_value.click.assert_called_once()
+        mock_page.get_by_role.assert_not_called()
+
+    def test_save_draft(self, mock_page, test_url):
+        """save_draft should click the footer save button and wait."""
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_admin.save_draft()
+
+        mock_page.locator.assert_called_once_with("footer button.action-save")
+        mock_page.locator.return_value.click.assert_called_once()
+        mock_page.wait_for_load_state.assert_called_once()
+
+    def test_save_draft_without_wait(self, mock_page, test_url):
+        """save_draft(wait=False) should not wait for navigation."""
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_admin.save_draft(wait=False)
+
+        mock_page.wait_for_load_state.assert_not_called()
+
+    def test_save_draft_reuses_locator(self, mock_page, test_url):
+        """save_draft should build its locator once per Page Object."""
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_admin.save_draft(wait=False)
+        page_admin.save_draft(wait=False)
+
+        mock_page.locator.assert_called_once_with("footer button.action-save")
+
+
 class TestPageAdminPageCreateChildPage:
     """Tests for PageAdminPage create_child_page method."""
 
@@ -326,15 +403,18 @@ class TestPageAdminPageCreateChildPage:
             f"{test_url}/admin/pages/add/testapp/testpage/1/"
         )
 
-        # Should fill title
+        # Should fill title and slug in one call, without the Promote tab
         mock_page.locator.assert_any_call("#id_title")
-
-        # Should click Promote tab and fill slug
-        mock_page.get_by_role.assert_any_call("tab", name="Promote")
-        mock_page.locator.assert_any_call("#id_slug")
+        entries, _ = mock_page.evaluate.call_args.args[1]
+        assert dict(entries) == {
+            "#id_title": "My Test Page",
+            "#id_slug": "my-test-page",
+        }
+        selectors = [args[0] for args, _ in mock_page.locator.call_args_list]
+        assert "#tab-label-promote" not in selectors
 
         # Should click Save draft (default behavior)
-        mock_page.get_by_role.assert_any_call("button", name="Save draft")
+        mock_page.locator.assert_any_call("footer button.action-save")
 
     def test_create_child_page_generates_slug_from_title(self, mock_page, test_url):
         """create_child_page should generate slug from title if not provided."""
@@ -347,7 +427,8 @@ class TestPageAdminPageCreateChildPage:
         )
 
         # Should fill slug field (auto-generated)
-        mock_page.locator.assert_any_call("#id_slug")
+        entries, _ = mock_page.evaluate.call_args.args[1]
+        assert dict(entries)["#id_slug"] == "my-test-page"
 
     def test_create_child_page_with_publish(self, mock_page, test_url):
         """create_child_page with publish=True should click Publish."""
@@ -375,15 +456,34 @@ class TestPageAdminPageCreateChildPage:
             save=False,
         )
 
-        # Should still click Promote tab (to fill slug)
-        mock_page.get_by_role.assert_any_call("tab", name="Promote")
+        # Should still fill title and slug
+        mock_page.evaluate.assert_called_once()
 
         # Should NOT click any save button
-        for call in mock_page.get_by_role.call_args_list:
-            args, kwargs = call
+        selectors = [args[0] for args, _ in mock_page.locator.call_args_list]
+        assert "footer button.action-save" not in selectors
+        for args, kwargs in mock_page.get_by_role.call_args_list:
             if args[0] == "button":
                 assert kwargs.get("name") not in ["Save draft", "Publish"]
 
+    def test_create_child_page_does_not_wait_for_networkidle_on_form(
+        self, mock_page, test_url
+    ):
+        """create_child_page should fill the form once the title is visible."""
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_admin.create_child_page(
+            parent_page_id=1,
+            page_type="testapp.TestPage",
+            title="Unsaved Page",
+            save=False,
+        )
+
+        mock_page.wait_for_load_state.assert_not_called()
+        mock_page.locator.return_value.wait_for.assert_any_call(
+            state="visible", timeout=PageAdminPage.DEFAULT_NAV_TIMEOUT_MS
+        )
+
     def test_create_child_page_with_additional_fields(self, mock_page, test_url):
         """create_child_page should fill additional fields."""
         page_admin = PageAdminPage(mock_page, test_url)
@@ -434,6 +534,61 @@ class TestPageAdminPageCreateChildPage:
         # Should use the field ID as-is when it has # prefix
         mock_page.locator.assert_any_call("#id_subtitle")
 
+    def test_create_child_page_returns_id_from_edit_url(self, mock_page, test_url):
+        """create_child_page should return the ID from the edit view URL."""
+        mock_page.url = f"{test_url}/admin/pages/57/edit/"
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_id = page_admin.create_child_page(
+            parent_page_id=1, page_type="testapp.TestPage", title="Draft"
+        )
+
+        assert page_id == 57
+
+    def test_create_child_page_returns_id_from_success_message(
+        self, mock_page, test_url
+    ):
+        """After publishing, the ID should come from the message's Edit link."""
+        mock_page.url = f"{test_url}/admin/pages/3/"
+        mock_page.locator.return_value.get_attribute.return_value = (
+            "/admin/pages/58/edit/"
+        )
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_id = page_admin.create_child_page(
+            parent_page_id=3,
+            page_type="testapp.TestPage",
+            title="Published",
+            publish=True,
+        )
+
+        mock_page.locator.assert_any_call(".w-message--success a[href*='/edit/']")
+        assert page_id == 58
+
+    def test_create_child_page_returns_none_without_id(self, mock_page, test_url):
+        """create_child_page should return None when no ID can be read."""
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_id = page_admin.create_child_page(
+            parent_page_id=1, page_type="testapp.TestPage", title="Unknown"
+        )
+
+        assert page_id is None
+
+    def test_create_child_page_without_save_returns_none(self, mock_page, test_url):
+        """create_child_page with save=False should not look up an ID."""
+        mock_page.url = f"{test_url}/admin/pages/57/edit/"
+        page_admin = PageAdminPage(mock_page, test_url)
+
+        page_id = page_admin.create_child_page(
+            parent_page_id=1,
+            page_type="testapp.TestPage",
+            title="Unsaved",
+            save=False,
+        )
+
+        assert page_id is None
+
 
 class TestPageAdminPageGenerateSlug:
     """Tests for PageAdminPage._generate_slug method."""
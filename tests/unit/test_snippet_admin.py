@@ -1,7 +1,5 @@
 """Unit tests for SnippetAdminPage."""
 
-from unittest.mock import MagicMock
-
 import pytest
 
 from wagtail_scenario_test.page_objects.wagtail_admin import SnippetAdminPage
@@ -70,6 +68,20 @@ class TestSnippetAdminPageUrls:
 
         assert page.delete_url(456) == "/admin/snippets/myapp/mymodel/delete/456/"
 
+    def test_list_and_add_urls_are_built_once(self, mock_page, test_url):
+        """list_url and add_url should be stored on first access."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+
+        add_url = page.add_url
+
+        assert vars(page)["add_url"] is add_url
+        assert vars(page)["list_url"] == "/admin/snippets/myapp/mymodel/"
+
 
 class TestSnippetAdminPageNavigation:
     """Tests for SnippetAdminPage navigation methods."""
@@ -137,7 +149,8 @@ class TestSnippetAdminPageCreate:
 
         # Check navigation to add page
         mock_page.goto.assert_called_with(
-            f"{test_url}/admin/snippets/myapp/mymodel/add/"
+            f"{test_url}/admin/snippets/myapp/mymodel/add/",
+            wait_until="domcontentloaded",
         )
 
         # Check name field was filled
@@ -192,6 +205,78 @@ class TestSnippetAdminPageCreate:
         calls = [str(c) for c in mock_page.locator.call_args_list]
         assert any("#id_custom_field" in str(c) for c in calls)
 
+    def test_create_does_not_wait_for_networkidle(self, mock_page, test_url):
+        """create should not wait for networkidle before filling the form."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+
+        page.create(name="Test Item", save=False)
+
+        mock_page.wait_for_load_state.assert_not_called()
+
+    def test_create_returns_id_from_success_message(self, mock_page, test_url):
+        """create should return the key from the success message's Edit link."""
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/"
+        mock_page.locator.return_value.get_attribute.return_value = (
+            "/admin/snippets/myapp/mymodel/edit/12/"
+        )
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+
+        item_id = page.create(name="Test Item")
+
+        mock_page.locator.assert_any_call(".w-message--success a[href*='/edit/']")
+        assert item_id == 12
+
+    def test_create_returns_id_from_edit_url(self, mock_page, test_url):
+        """create should return the key when saving redirects to the edit view."""
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/edit/7/"
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+
+        item_id = page.create(name="Test Item")
+
+        assert item_id == 7
+
+    def test_create_returns_none_without_id(self, mock_page, test_url):
+        """create should return None when no key can be read."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+
+        item_id = page.create(name="Test Item")
+
+        assert item_id is None
+
+    def test_create_without_save_returns_none(self, mock_page, test_url):
+        """create with save=False should not look up a key."""
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/edit/7/"
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+
+        item_id = page.create(name="Test Item", save=False)
+
+        assert item_id is None
+
 
 class TestSnippetAdminPageFormInteractions:
     """Tests for SnippetAdminPage form interactions."""
@@ -210,6 +295,20 @@ class TestSnippetAdminPageFormInteractions:
         mock_page.get_by_role.assert_called_with("button", name="Save")
         mock_page.get_by_role.return_value.click.assert_called_once()
 
+    def test_save_without_wait(self, mock_page, test_url):
+        """save(wait=False) should not wait for navigation."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+
+        page.save(wait=False)
+
+        mock_page.get_by_role.return_value.click.assert_called_once()
+        mock_page.wait_for_load_state.assert_not_called()
+
     def test_save_draft(self, mock_page, test_url):
         """save_draft should click Save draft button."""
         page = SnippetAdminPage(
@@ -245,6 +344,20 @@ class TestSnippetAdminPageFormInteractions:
         mock_page.get_by_role.assert_any_call("link", name="Delete", exact=True)
         mock_page.get_by_role.assert_any_call("button", name="Yes, delete")
 
+    def test_delete_without_wait(self, mock_page, test_url):
+        """delete(wait=False) should confirm but not wait for navigation."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+
+        page.delete(wait=False)
+
+        mock_page.get_by_role.assert_any_call("button", name="Yes, delete")
+        mock_page.wait_for_load_state.assert_not_called()
+
     def test_delete_without_confirm(self, mock_page, test_url):
         """delete with confirm=False should only open dropdown and click Delete link."""
         page = SnippetAdminPage(
@@ -276,11 +389,14 @@ class TestSnippetAdminPageListOperations:
             app_name="myapp",
             model_name="mymodel",
         )
-        mock_page.locator.return_value.count.return_value = 5
+        mock_page.evaluate.return_value = {"rows": 5, "titles": []}
 
         result = page.get_item_count()
 
-        mock_page.locator.assert_called_with("table tbody tr")
+        mock_page.goto.assert_called_once_with(
+            f"{test_url}/admin/snippets/myapp/mymodel/"
+        )
+        assert "table tbody tr" in mock_page.evaluate.call_args.args[0]
         assert result == 5
 
     def test_item_exists_in_list_returns_true(self, mock_page, test_url):
@@ -291,11 +407,12 @@ class TestSnippetAdminPageListOperations:
             app_name="myapp",
             model_name="mymodel",
         )
-        mock_page.get_by_role.return_value.count.return_value = 1
+        mock_page.locator.return_value.count.return_value = 1
 
         result = page.item_exists_in_list("Test Item")
 
-        mock_page.get_by_role.assert_called_with("link", name="Test Item")
+        mock_page.locator.assert_called_with("table tbody tr td a")
+        mock_page.locator.return_value.filter.assert_called_with(has_text="Test Item")
         assert result is True
 
     def test_item_exists_in_list_returns_false(self, mock_page, test_url):
@@ -306,12 +423,56 @@ class TestSnippetAdminPageListOperations:
             app_name="myapp",
             model_name="mymodel",
         )
-        mock_page.get_by_role.return_value.count.return_value = 0
+        mock_page.locator.return_value.count.return_value = 0
 
         result = page.item_exists_in_list("Nonexistent")
 
         assert result is False
 
+    def test_item_exists_in_list_reloads_by_default(self, mock_page, test_url):
+        """item_exists_in_list should reload even when already on the list."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/"
+
+        page.item_exists_in_list("Test Item")
+
+        mock_page.goto.assert_called_once()
+
+    def test_item_exists_in_list_skip_reload(self, mock_page, test_url):
+        """item_exists_in_list(skip_reload=True) should reuse the open list."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/"
+
+        page.item_exists_in_list("Test Item", skip_reload=True)
+
+        mock_page.goto.assert_not_called()
+
+    def test_refresh_list(self, mock_page, test_url):
+        """refresh_list should always navigate to the list."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/"
+
+        page.refresh_list()
+
+        mock_page.goto.assert_called_once_with(
+            f"{test_url}/admin/snippets/myapp/mymodel/"
+        )
+
     def test_click_item_in_list(self, mock_page, test_url):
         """click_item_in_list should click item link."""
         page = SnippetAdminPage(
@@ -323,8 +484,10 @@ class TestSnippetAdminPageListOperations:
 
         page.click_item_in_list("Test Item")
 
-        mock_page.get_by_role.assert_called_with("link", name="Test Item")
-        mock_page.get_by_role.return_value.click.assert_called_once()
+        mock_page.locator.assert_called_with("table tbody tr td a")
+        mock_page.locator.return_value.filter.assert_called_with(has_text="Test Item")
+        mock_page.locator.return_value.click.assert_called_once()
+        mock_page.get_by_role.assert_not_called()
 
     def test_get_list_items(self, mock_page, test_url):
         """get_list_items should return list of item titles."""
@@ -334,15 +497,11 @@ class TestSnippetAdminPageListOperations:
             app_name="myapp",
             model_name="mymodel",
         )
-        link1 = MagicMock()
-        link1.text_content.return_value = "Item 1"
-        link2 = MagicMock()
-        link2.text_content.return_value = "Item 2"
-        mock_page.locator.return_value.all.return_value = [link1, link2]
+        mock_page.evaluate.return_value = {"rows": 2, "titles": ["Item 1", "Item 2"]}
 
         result = page.get_list_items()
 
-        mock_page.locator.assert_called_with("table tbody tr td a")
+        assert "table tbody tr td a" in mock_page.evaluate.call_args.args[0]
         assert result == ["Item 1", "Item 2"]
 
     def test_get_list_items_handles_none_text(self, mock_page, test_url):
@@ -353,14 +512,60 @@ class TestSnippetAdminPageListOperations:
             app_name="myapp",
             model_name="mymodel",
         )
-        link = MagicMock()
-        link.text_content.return_value = None
-        mock_page.locator.return_value.all.return_value = [link]
+        mock_page.evaluate.return_value = {"rows": 1, "titles": [None]}
 
         result = page.get_list_items()
 
         assert result == [""]
 
+    def test_list_reads_are_not_cached(self, mock_page, test_url):
+        """Each list read should evaluate the page again."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/"
+        mock_page.evaluate.return_value = {"rows": 1, "titles": ["Item 1"]}
+
+        assert page.get_item_count() == 1
+        assert page.get_list_items() == ["Item 1"]
+
+        mock_page.goto.assert_not_called()
+        assert mock_page.evaluate.call_count == 2
+
+    def test_get_item_count_skips_navigation_on_list(self, mock_page, test_url):
+        """get_item_count should read the open list without reloading it."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/"
+        mock_page.evaluate.return_value = {"rows": 3, "titles": []}
+
+        assert page.get_item_count() == 3
+        mock_page.goto.assert_not_called()
+
+    def test_get_item_count_reloads_filtered_list(self, mock_page, test_url):
+        """get_item_count should not count the rows of a search result."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/?q=test"
+        mock_page.evaluate.return_value = {"rows": 3, "titles": []}
+
+        page.get_item_count()
+
+        mock_page.goto.assert_called_once_with(
+            f"{test_url}/admin/snippets/myapp/mymodel/"
+        )
+
 
 class TestSnippetAdminPageAssertions:
     """Tests for SnippetAdminPage assertion methods."""
@@ -399,7 +604,7 @@ class TestSnippetAdminPageAssertions:
             app_name="myapp",
             model_name="mymodel",
         )
-        mock_page.get_by_role.return_value.count.return_value = 1
+        mock_page.locator.return_value.count.return_value = 1
 
         page.assert_item_created("Test Item")
 
@@ -413,11 +618,47 @@ class TestSnippetAdminPageAssertions:
             app_name="myapp",
             model_name="mymodel",
         )
-        mock_page.get_by_role.return_value.count.return_value = 0
+        mock_page.locator.return_value.count.return_value = 0
 
         with pytest.raises(AssertionError, match="not found in list"):
             page.assert_item_created("Missing Item")
 
+    def test_assert_item_created_reuses_list_after_redirect(
+        self, mock_page, test_url, mock_playwright_expect
+    ):
+        """assert_item_created should not reload when already on the list."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/"
+        mock_page.locator.return_value.count.return_value = 1
+
+        page.assert_item_created("Test Item")
+
+        mock_page.goto.assert_not_called()
+
+    def test_assert_item_created_navigates_when_off_list(
+        self, mock_page, test_url, mock_playwright_expect
+    ):
+        """assert_item_created should go to the list from another page."""
+        page = SnippetAdminPage(
+            mock_page,
+            test_url,
+            app_name="myapp",
+            model_name="mymodel",
+        )
+        mock_page.url = f"{test_url}/admin/snippets/myapp/mymodel/edit/1/"
+        mock_page.locator.return_value.count.return_value = 1
+
+        page.assert_item_created("Test Item")
+
+        mock_page.goto.assert_called_once_with(
+            f"{test_url}/admin/snippets/myapp/mymodel/"
+        )
+
     def test_assert_item_updated(self, mock_page, test_url, mock_playwright_expect):
         """assert_item_updated should check success and list."""
         page = SnippetAdminPage(
@@ -426,7 +667,7 @@ class TestSnippetAdminPageAssertions:
             app_name="myapp",
             model_name="mymodel",
         )
-        mock_page.get_by_role.return_value.count.return_value = 1
+        mock_page.locator.return_value.count.return_value = 1
 
         page.assert_item_updated("Updated Item")
 
@@ -440,7 +681,7 @@ class TestSnippetAdminPageAssertions:
             app_name="myapp",
             model_name="mymodel",
         )
-        mock_page.get_by_role.return_value.count.return_value = 0
+        mock_page.locator.return_value.count.return_value = 0
 
         with pytest.raises(AssertionError, match="not found in list"):
             page.assert_item_updated("Missing Item")
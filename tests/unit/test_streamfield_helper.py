@@ -2,6 +2,9 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
 from wagtail_scenario_test import BlockPath, StreamFieldHelper
 
 
@@ -24,10 +27,38 @@ class TestStreamFieldHelperInit:
         assert helper.field_name == "content"
 
 
+class TestStreamFieldHelperLocatorCache:
+    """Tests for StreamFieldHelper locator caching."""
+
+    def test_repeated_access_reuses_locator(self):
+        """The same field should be resolved through page.locator only once."""
+        mock_page = MagicMock()
+        mock_page.locator.return_value.count.return_value = 1
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.block(0).struct("title").value()
+        helper.block(0).struct("title").value()
+
+        mock_page.locator.assert_called_once_with(
+            "#body-0-value-title, textarea[name='body-0-value-title']"
+        )
+
+    def test_invalidate_cache_rebuilds_locators(self):
+        """invalidate_cache should force locators to be rebuilt."""
+        mock_page = MagicMock()
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.get_block_type(0)
+        helper.invalidate_cache()
+        helper.get_block_type(0)
+
+        assert mock_page.locator.call_count == 2
+
+
 class TestStreamFieldHelperAddBlock:
     """Tests for StreamFieldHelper.add_block()."""
 
-    def test_add_block_clicks_add_button(self):
+    def test_add_block_clicks_add_button(self, mock_playwright_expect):
         """add_block should click the add button."""
         mock_page = MagicMock()
         mock_panel = MagicMock()
@@ -51,7 +82,7 @@ class TestStreamFieldHelperAddBlock:
 
         mock_add_button.click.assert_called_once()
 
-    def test_add_block_selects_block_type(self):
+    def test_add_block_selects_block_type(self, mock_playwright_expect):
         """add_block should select the correct block type with exact match."""
         mock_page = MagicMock()
         mock_panel = MagicMock()
@@ -76,9 +107,9 @@ class TestStreamFieldHelperAddBlock:
         mock_page.get_by_role.assert_called_once_with(
             "option", name="Heading", exact=True
         )
-        mock_option.click.assert_called_once()
+        mock_option.first.click.assert_called_once()
 
-    def test_add_block_returns_block_index(self):
+    def test_add_block_returns_block_index(self, mock_playwright_expect):
         """add_block should return the index of the new block."""
         mock_page = MagicMock()
         mock_panel = MagicMock()
@@ -102,6 +133,52 @@ class TestStreamFieldHelperAddBlock:
 
         assert index == 2  # New block gets index 2
 
+    def test_add_block_waits_for_count_increment(self, mock_playwright_expect):
+        """add_block should wait for the count input instead of sleeping."""
+        mock_page = MagicMock()
+        mock_count_input = MagicMock()
+        mock_count_input.input_value.return_value = "2"
+        mock_page.locator.side_effect = [mock_count_input, MagicMock(), MagicMock()]
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.add_block("Quote")
+
+        mock_playwright_expect.assert_called_once_with(mock_count_input)
+        mock_playwright_expect.return_value.to_have_value.assert_called_once_with("3")
+        mock_page.wait_for_timeout.assert_not_called()
+
+
+class TestStreamFieldHelperAddBlocks:
+    """Tests for StreamFieldHelper.add_blocks()."""
+
+    def test_add_blocks_returns_indices(self, mock_playwright_expect):
+        """add_blocks should return consecutive indices for the new blocks."""
+        mock_page = MagicMock()
+        mock_page.locator.return_value.input_value.return_value = "2"
+
+        helper = StreamFieldHelper(mock_page, "body")
+        indices = helper.add_blocks(["Heading", "Quote"])
+
+        assert indices == [2, 3]
+        mock_page.get_by_role.assert_any_call("option", name="Heading", exact=True)
+        mock_page.get_by_role.assert_any_call("option", name="Quote", exact=True)
+
+    def test_add_blocks_reads_count_once(self, mock_playwright_expect):
+        """add_blocks should not re-read the count before each block."""
+        mock_page = MagicMock()
+        mock_page.locator.return_value.input_value.return_value = "0"
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.add_blocks(["Heading", "Quote", "Text"])
+
+        mock_page.locator.return_value.input_value.assert_called_once()
+        to_have_value = mock_playwright_expect.return_value.to_have_value
+        assert [c.args for c in to_have_value.call_args_list] == [
+            ("1",),
+            ("2",),
+            ("3",),
+        ]
+
 
 class TestStreamFieldHelperGetBlockCount:
     """Tests for StreamFieldHelper.get_block_count()."""
@@ -125,7 +202,7 @@ class TestStreamFieldHelperGetBlockCount:
         """get_block_count should return 0 when count input not found."""
         mock_page = MagicMock()
         mock_count_input = MagicMock()
-        mock_count_input.count.return_value = 0
+        mock_count_input.input_value.side_effect = PlaywrightTimeoutError("missing")
 
         mock_page.locator.return_value = mock_count_input
 
@@ -134,6 +211,77 @@ class TestStreamFieldHelperGetBlockCount:
 
         assert count == 0
 
+    def test_get_block_count_reuses_count_locator(self):
+        """get_block_count should build the count locator only once."""
+        mock_page = MagicMock()
+        mock_page.locator.return_value.input_value.return_value = "1"
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.get_block_count()
+        helper.get_block_count()
+
+        mock_page.locator.assert_called_once_with("input[name='body-count']")
+        mock_page.locator.return_value.count.assert_not_called()
+
+
+class TestStreamFieldHelperSnapshot:
+    """Tests for StreamFieldHelper.snapshot()."""
+
+    def test_snapshot_uses_single_evaluate(self):
+        """snapshot() should read the field state in one evaluate call."""
+        mock_page = MagicMock()
+        state = {"count": 1, "blocks": [{"type": "heading", "values": {}}]}
+        mock_page.evaluate.return_value = state
+
+        helper = StreamFieldHelper(mock_page, "content")
+        result = helper.snapshot()
+
+        assert result == state
+        mock_page.evaluate.assert_called_once()
+        assert mock_page.evaluate.call_args.args[1] == "content"
+        mock_page.locator.assert_not_called()
+
+
+class TestStreamFieldHelperBulkFill:
+    """Tests for StreamFieldHelper.bulk_fill()."""
+
+    def test_bulk_fill_uses_single_evaluate(self):
+        """bulk_fill() should set every field in one evaluate call."""
+        mock_page = MagicMock()
+        mock_page.evaluate.return_value = []
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.bulk_fill(
+            {
+                helper.block(0): "Heading",
+                helper.block(1).item(0).struct("url"): "https://example.com",
+            }
+        )
+
+        mock_page.evaluate.assert_called_once()
+        assert mock_page.evaluate.call_args.args[1] == [
+            [
+                ["#body-0-value, textarea[name='body-0-value']", "Heading"],
+                [
+                    "#body-1-value-0-value-url, "
+                    "textarea[name='body-1-value-0-value-url']",
+                    "https://example.com",
+                ],
+            ],
+            ["input", "change"],
+        ]
+        mock_page.locator.assert_not_called()
+
+    def test_bulk_fill_raises_for_missing_fields(self):
+        """bulk_fill() should report fields that are not on the page."""
+        mock_page = MagicMock()
+        mock_page.evaluate.return_value = ["#body-5-value"]
+
+        helper = StreamFieldHelper(mock_page, "body")
+
+        with pytest.raises(ValueError, match="#body-5-value"):
+            helper.bulk_fill({helper.block(5): "Missing"})
+
 
 class TestStreamFieldHelperGetBlockType:
     """Tests for StreamFieldHelper.get_block_type()."""
@@ -448,59 +596,112 @@ class TestBlockPathFill:
         """fill() on simple block should use correct selector."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 1
+        mock_field.first = mock_field
 
         mock_page.locator.return_value = mock_field
 
         helper = StreamFieldHelper(mock_page, "body")
         helper.block(0).fill("Test Value")
 
-        mock_page.locator.assert_called_with("#body-0-value")
+        mock_page.locator.assert_called_with(
+            "#body-0-value, textarea[name='body-0-value']"
+        )
         mock_field.fill.assert_called_once_with("Test Value")
+        mock_field.count.assert_not_called()
 
     def test_fill_struct_field(self):
         """fill() on struct field should use correct selector."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 1
+        mock_field.first = mock_field
 
         mock_page.locator.return_value = mock_field
 
         helper = StreamFieldHelper(mock_page, "body")
         helper.block(0).struct("title").fill("Welcome")
 
-        mock_page.locator.assert_called_with("#body-0-value-title")
+        mock_page.locator.assert_called_with(
+            "#body-0-value-title, textarea[name='body-0-value-title']"
+        )
         mock_field.fill.assert_called_once_with("Welcome")
 
     def test_fill_list_item(self):
         """fill() on list item should use correct selector."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 1
+        mock_field.first = mock_field
 
         mock_page.locator.return_value = mock_field
 
         helper = StreamFieldHelper(mock_page, "body")
         helper.block(0).item(0).fill("First item")
 
-        mock_page.locator.assert_called_with("#body-0-value-0-value")
+        mock_page.locator.assert_called_with(
+            "#body-0-value-0-value, textarea[name='body-0-value-0-value']"
+        )
         mock_field.fill.assert_called_once_with("First item")
 
     def test_fill_list_item_struct_field(self):
         """fill() on list item struct field should use correct selector."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 1
+        mock_field.first = mock_field
 
         mock_page.locator.return_value = mock_field
 
         helper = StreamFieldHelper(mock_page, "content")
         helper.block(1).item(2).struct("url").fill("https://example.com")
 
-        mock_page.locator.assert_called_with("#content-1-value-2-value-url")
+        mock_page.locator.assert_called_with(
+            "#content-1-value-2-value-url, textarea[name='content-1-value-2-value-url']"
+        )
         mock_field.fill.assert_called_once_with("https://example.com")
 
 
+class TestBlockPathFillStruct:
+    """Tests for BlockPath.fill_struct()."""
+
+    def test_fill_struct_uses_single_evaluate(self):
+        """fill_struct() should set every field in one evaluate call."""
+        mock_page = MagicMock()
+        mock_page.evaluate.return_value = []
+        fields = {"title": "Card", "url": "/card/"}
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.block(0).item(1).fill_struct(fields)
+
+        mock_page.evaluate.assert_called_once()
+        assert mock_page.evaluate.call_args.args[1] == [
+            [
+                ["#body-0-value-1-value-title", "Card"],
+                ["#body-0-value-1-value-url", "/card/"],
+            ],
+            ["input", "change"],
+        ]
+        mock_page.locator.assert_not_called()
+
+    def test_fill_struct_on_block(self):
+        """fill_struct() on a block should target its -value prefix."""
+        mock_page = MagicMock()
+        mock_page.evaluate.return_value = []
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.block(2).fill_struct({"title": "Hero"})
+
+        entries, _ = mock_page.evaluate.call_args.args[1]
+        assert entries == [["#body-2-value-title", "Hero"]]
+
+    def test_fill_struct_raises_for_unknown_fields(self):
+        """fill_struct() should name the fields that are not on the page."""
+        mock_page = MagicMock()
+        mock_page.evaluate.return_value = ["#body-0-value-titel"]
+
+        helper = StreamFieldHelper(mock_page, "body")
+
+        with pytest.raises(ValueError, match="#body-0-value-titel"):
+            helper.block(0).fill_struct({"titel": "Hero"})
+
+
 class TestBlockPathValue:
     """Tests for BlockPath.value()."""
 
@@ -508,7 +709,7 @@ class TestBlockPathValue:
         """value() should return the field's current value."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 1
+        mock_field.first = mock_field
         mock_field.input_value.return_value = "Current value"
 
         mock_page.locator.return_value = mock_field
@@ -517,13 +718,15 @@ class TestBlockPathValue:
         value = helper.block(0).struct("title").value()
 
         assert value == "Current value"
-        mock_page.locator.assert_called_with("#body-0-value-title")
+        mock_page.locator.assert_called_with(
+            "#body-0-value-title, textarea[name='body-0-value-title']"
+        )
 
     def test_value_returns_empty_when_not_found(self):
         """value() should return empty string when field not found."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 0
+        mock_field.first.input_value.side_effect = PlaywrightTimeoutError("missing")
 
         mock_page.locator.return_value = mock_field
 
@@ -533,6 +736,33 @@ class TestBlockPathValue:
         assert value == ""
 
 
+class TestBlockPathLocator:
+    """Tests for BlockPath.locator."""
+
+    def test_locator_returns_value_field(self):
+        """locator should return the first input or textarea for the path."""
+        mock_page = MagicMock()
+        mock_field = MagicMock()
+        mock_page.locator.return_value = mock_field
+
+        helper = StreamFieldHelper(mock_page, "body")
+        locator = helper.block(3).locator
+
+        assert locator is mock_field.first
+        mock_page.locator.assert_called_with(
+            "#body-3-value, textarea[name='body-3-value']"
+        )
+
+    def test_locator_does_not_read_value(self):
+        """locator should not query the browser for the field's value."""
+        mock_page = MagicMock()
+
+        helper = StreamFieldHelper(mock_page, "body")
+        locator = helper.block(0).locator
+
+        locator.input_value.assert_not_called()
+
+
 class TestBlockPathItemCount:
     """Tests for BlockPath.item_count()."""
 
@@ -550,12 +780,15 @@ class TestBlockPathItemCount:
 
         assert count == 3
         mock_page.locator.assert_called_with("input[name='body-0-value-count']")
+        mock_count_input.input_value.assert_called_once_with(
+            timeout=StreamFieldHelper.PROBE_TIMEOUT
+        )
 
     def test_item_count_returns_zero_when_no_input(self):
         """item_count() should return 0 when count input not found."""
         mock_page = MagicMock()
         mock_count_input = MagicMock()
-        mock_count_input.count.return_value = 0
+        mock_count_input.input_value.side_effect = PlaywrightTimeoutError("missing")
 
         mock_page.locator.return_value = mock_count_input
 
@@ -594,9 +827,73 @@ class TestBlockPathClickChooser:
 
         # Verify locator was called with the struct field context
         mock_page.locator.assert_called()
-        call_args = mock_page.locator.call_args[0][0]
+        call_args = mock_page.locator.call_args_list[0][0][0]
         assert "body-0-value-image" in call_args
 
+    def test_click_chooser_uses_exact_wrapper_id(self):
+        """click_chooser() should look up the chooser wrapper by exact id."""
+        mock_page = MagicMock()
+        mock_page.locator.return_value.first.count.return_value = 1
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.block(0).click_chooser()
+
+        first_selector = mock_page.locator.call_args_list[0][0][0]
+        assert "#body-0-value-chooser .chooser__choose-button" in first_selector
+        assert "[id^=" not in first_selector
+
+    def test_click_chooser_falls_back_to_prefix_match(self):
+        """click_chooser() should fall back to an id prefix match."""
+        mock_page = MagicMock()
+        exact = MagicMock()
+        exact.first.count.return_value = 0
+        prefix = MagicMock()
+        prefix.first.count.return_value = 1
+        mock_page.locator.side_effect = [exact, prefix, MagicMock()]
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.block(0).click_chooser()
+
+        assert mock_page.locator.call_args_list[1][0][0] == (
+            "[id^='body-0-value'] .chooser__choose-button"
+        )
+        prefix.first.click.assert_called_once()
+
+    def test_click_chooser_waits_for_modal(self):
+        """click_chooser() should wait for the modal rather than sleeping."""
+        mock_page = MagicMock()
+        mock_page.locator.return_value.first.count.return_value = 1
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.block(0).click_chooser()
+
+        mock_page.locator.assert_called_with(".modal")
+        mock_page.locator.return_value.wait_for.assert_called_once_with(state="visible")
+        mock_page.wait_for_timeout.assert_not_called()
+
+
+class TestStreamFieldHelperSelectFromChooser:
+    """Tests for StreamFieldHelper.select_from_chooser()."""
+
+    def test_select_from_chooser_waits_for_modal_to_close(self):
+        """select_from_chooser should wait for the modal to be hidden."""
+        mock_page = MagicMock()
+        mock_modal = MagicMock()
+        mock_item = MagicMock()
+        mock_item.count.return_value = 1
+        mock_modal.locator.return_value.first = mock_item
+        mock_page.locator.return_value = mock_modal
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.select_from_chooser("My Image")
+
+        mock_modal.locator.assert_called_with(
+            "[data-chooser-modal-choice][title='My Image']"
+        )
+        mock_item.click.assert_called_once()
+        assert mock_modal.wait_for.call_args_list[-1].kwargs == {"state": "hidden"}
+        mock_page.wait_for_timeout.assert_not_called()
+
 
 class TestLegacyMethods:
     """Tests for backward-compatible legacy methods."""
@@ -605,46 +902,64 @@ class TestLegacyMethods:
         """fill_block() should delegate to block().fill()."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 1
+        mock_field.first = mock_field
         mock_page.locator.return_value = mock_field
 
         helper = StreamFieldHelper(mock_page, "body")
         helper.fill_block(0, "Test Value")
 
-        mock_page.locator.assert_called_with("#body-0-value")
+        mock_page.locator.assert_called_with(
+            "#body-0-value, textarea[name='body-0-value']"
+        )
         mock_field.fill.assert_called_once_with("Test Value")
 
     def test_fill_struct_field_calls_fluent_api(self):
         """fill_struct_field() should delegate to block().struct().fill()."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 1
+        mock_field.first = mock_field
         mock_page.locator.return_value = mock_field
 
         helper = StreamFieldHelper(mock_page, "body")
         helper.fill_struct_field(0, "title", "Welcome")
 
-        mock_page.locator.assert_called_with("#body-0-value-title")
+        mock_page.locator.assert_called_with(
+            "#body-0-value-title, textarea[name='body-0-value-title']"
+        )
         mock_field.fill.assert_called_once_with("Welcome")
 
     def test_fill_list_item_field_calls_fluent_api(self):
         """fill_list_item_field() should delegate to fluent API."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 1
+        mock_field.first = mock_field
         mock_page.locator.return_value = mock_field
 
         helper = StreamFieldHelper(mock_page, "body")
         helper.fill_list_item_field(0, 0, "title", "Link Title")
 
-        mock_page.locator.assert_called_with("#body-0-value-0-value-title")
+        mock_page.locator.assert_called_with(
+            "#body-0-value-0-value-title, textarea[name='body-0-value-0-value-title']"
+        )
         mock_field.fill.assert_called_once_with("Link Title")
 
+    def test_fill_list_item_fields_calls_fluent_api(self):
+        """fill_list_item_fields() should delegate to fill_struct()."""
+        mock_page = MagicMock()
+        mock_page.evaluate.return_value = []
+
+        helper = StreamFieldHelper(mock_page, "body")
+        helper.fill_list_item_fields(0, 2, {"title": "Link Title"})
+
+        mock_page.evaluate.assert_called_once()
+        entries, _ = mock_page.evaluate.call_args.args[1]
+        assert entries == [["#body-0-value-2-value-title", "Link Title"]]
+
     def test_get_struct_field_value_calls_fluent_api(self):
         """get_struct_field_value() should delegate to fluent API."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 1
+        mock_field.first = mock_field
         mock_field.input_value.return_value = "Current value"
         mock_page.locator.return_value = mock_field
 
@@ -652,13 +967,15 @@ class TestLegacyMethods:
         value = helper.get_struct_field_value(0, "title")
 
         assert value == "Current value"
-        mock_page.locator.assert_called_with("#body-0-value-title")
+        mock_page.locator.assert_called_with(
+            "#body-0-value-title, textarea[name='body-0-value-title']"
+        )
 
     def test_get_list_item_field_value_calls_fluent_api(self):
         """get_list_item_field_value() should delegate to fluent API."""
         mock_page = MagicMock()
         mock_field = MagicMock()
-        mock_field.count.return_value = 1
+        mock_field.first = mock_field
         mock_field.input_value.return_value = "https://google.com"
         mock_page.locator.return_value = mock_field
 
@@ -666,4 +983,6 @@ class TestLegacyMethods:
         value = helper.get_list_item_field_value(0, 0, "url")
 
         assert value == "https://google.com"
-        mock_page.locator.assert_called_with("#body-0-value-0-value-url")
+        mock_page.locator.assert_called_with(
+            "#body-0-value-0-value-url, textarea[name='body-0-value-0-value-url']"
+        )
@@ -1,15 +1,42 @@
 """Tests for video conversion utilities."""
 
+import asyncio
+import os
 import subprocess
-from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from wagtail_scenario_test.utils.video import (
     convert_all_videos_to_gif,
+    convert_all_videos_to_gif_async,
     convert_video_to_gif,
+    convert_video_to_gif_async,
+    convert_video_to_gif_with_palette,
+    generate_palette,
     is_ffmpeg_available,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_ffmpeg_cache():
+    """Reset the cached ffmpeg lookup around each test."""
+    is_ffmpeg_available.cache_clear()
+    yield
+    is_ffmpeg_available.cache_clear()
+
+
+@pytest.fixture
+def ffmpeg_available():
+    """Pretend ffmpeg is installed for batch conversion tests."""
+    with patch(
+        "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+        return_value=True,
+    ):
+        yield
+
+
 class TestIsFfmpegAvailable:
     """Tests for is_ffmpeg_available function."""
 
@@ -23,6 +50,14 @@ class TestIsFfmpegAvailable:
         with patch("shutil.which", return_value=None):
             assert is_ffmpeg_available() is False
 
+    def test_result_is_cached(self):
+        """Test looks ffmpeg up on PATH only once."""
+        with patch("shutil.which", return_value="/usr/bin/ffmpeg") as mock_which:
+            is_ffmpeg_available()
+            is_ffmpeg_available()
+
+        mock_which.assert_called_once_with("ffmpeg")
+
 
 class TestConvertVideoToGif:
     """Tests for convert_video_to_gif function."""
@@ -113,6 +148,176 @@ class TestConvertVideoToGif:
             assert "fps=15" in vf_value
             assert "scale=1024" in vf_value
 
+    def test_uses_single_pass_palette_filter(self, tmp_path):
+        """Test builds the fused palettegen/paletteuse filter graph."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run") as mock_run,
+        ):
+            convert_video_to_gif(video_file)
+
+        call_args = mock_run.call_args[0][0]
+        assert call_args[call_args.index("-vf") + 1] == (
+            "fps=10,scale=800:-1:flags=bilinear,split[s0][s1];"
+            "[s0]palettegen[p];[s1][p]paletteuse"
+        )
+
+    def test_uses_lanczos_above_800px(self, tmp_path):
+        """Test keeps the lanczos scaler for wide GIFs."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run") as mock_run,
+        ):
+            convert_video_to_gif(video_file, width=1280)
+
+        call_args = mock_run.call_args[0][0]
+        assert "flags=lanczos" in call_args[call_args.index("-vf") + 1]
+
+    def test_passes_scale_flags_to_ffmpeg(self, tmp_path):
+        """Test an explicit scale_flags overrides the default scaler."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run") as mock_run,
+        ):
+            convert_video_to_gif(video_file, scale_flags="lanczos")
+
+        call_args = mock_run.call_args[0][0]
+        assert "scale=800:-1:flags=lanczos" in call_args[call_args.index("-vf") + 1]
+
+    def test_passes_threads_to_ffmpeg(self, tmp_path):
+        """Test passes the thread count before the filter graph."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run") as mock_run,
+        ):
+            convert_video_to_gif(video_file, threads=3)
+
+        call_args = mock_run.call_args[0][0]
+        vf_index = call_args.index("-vf")
+        for option in ("-threads", "-filter_threads", "-filter_complex_threads"):
+            index = call_args.index(option)
+            assert index < vf_index
+            assert call_args[index + 1] == "3"
+
+    def test_threads_default_to_cpu_count(self, tmp_path):
+        """Test uses every CPU when threads is not given."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("wagtail_scenario_test.utils.video.os.cpu_count", return_value=6),
+            patch("subprocess.run") as mock_run,
+        ):
+            convert_video_to_gif(video_file)
+
+        call_args = mock_run.call_args[0][0]
+        assert call_args[call_args.index("-threads") + 1] == "6"
+
+    def test_incremental_skips_up_to_date_gif(self, tmp_path):
+        """Test skips ffmpeg when the GIF is newer than the video."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+        gif_file = tmp_path / "video.gif"
+        gif_file.touch()
+        os.utime(video_file, (1000, 1000))
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run") as mock_run,
+        ):
+            result = convert_video_to_gif(video_file, incremental=True)
+
+        assert result == gif_file
+        mock_run.assert_not_called()
+
+    def test_incremental_converts_stale_gif(self, tmp_path):
+        """Test re-converts when the video is newer than the GIF."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+        gif_file = tmp_path / "video.gif"
+        gif_file.touch()
+        os.utime(gif_file, (1000, 1000))
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run") as mock_run,
+        ):
+            convert_video_to_gif(video_file, incremental=True)
+
+        mock_run.assert_called_once()
+
+    def test_discards_ffmpeg_output_by_default(self, tmp_path):
+        """Test sends ffmpeg output to DEVNULL instead of capturing it."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run") as mock_run,
+        ):
+            convert_video_to_gif(video_file)
+
+        kwargs = mock_run.call_args.kwargs
+        assert "capture_output" not in kwargs
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        assert kwargs["stderr"] == subprocess.DEVNULL
+
+    def test_capture_logs_writes_log_file(self, tmp_path):
+        """Test writes ffmpeg's stderr next to the GIF when requested."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+
+        def fake_run(cmd, **kwargs):
+            kwargs["stderr"].write(b"frame=1\n")
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run", side_effect=fake_run),
+        ):
+            convert_video_to_gif(video_file, capture_logs=True)
+
+        assert (tmp_path / "video.ffmpeg.log").read_bytes() == b"frame=1\n"
+
     def test_deletes_original_when_requested(self, tmp_path):
         """Test deletes original video when delete_original is True."""
         video_file = tmp_path / "video.webm"
@@ -216,6 +421,98 @@ class TestConvertVideoToGif:
             assert result is None
 
 
+class TestGeneratePalette:
+    """Tests for generate_palette function."""
+
+    def test_runs_palettegen(self, tmp_path):
+        """Test runs a palettegen-only ffmpeg pass."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+        palette = tmp_path / "palette.png"
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run") as mock_run,
+        ):
+            palette.touch()
+            result = generate_palette(video_file, palette, fps=15, width=640)
+
+        assert result == palette
+        call_args = mock_run.call_args[0][0]
+        vf_value = call_args[call_args.index("-vf") + 1]
+        assert vf_value == "fps=15,scale=640:-1:flags=bilinear,palettegen"
+        assert call_args[-1] == str(palette)
+
+    def test_returns_none_on_subprocess_error(self, tmp_path):
+        """Test returns None when palette generation fails."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch(
+                "subprocess.run",
+                side_effect=subprocess.CalledProcessError(1, "ffmpeg"),
+            ),
+        ):
+            result = generate_palette(video_file, tmp_path / "palette.png")
+
+        assert result is None
+
+
+class TestConvertVideoToGifWithPalette:
+    """Tests for convert_video_to_gif_with_palette function."""
+
+    def test_uses_palette_input(self, tmp_path):
+        """Test feeds the palette as a second input to paletteuse."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+        palette = tmp_path / "palette.png"
+        expected_gif = tmp_path / "video.gif"
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run") as mock_run,
+        ):
+            expected_gif.touch()
+            result = convert_video_to_gif_with_palette(video_file, palette)
+
+        assert result == expected_gif
+        call_args = mock_run.call_args[0][0]
+        assert str(palette) in call_args
+        lavfi = call_args[call_args.index("-lavfi") + 1]
+        assert "palettegen" not in lavfi
+        assert lavfi.endswith("[x][1:v]paletteuse")
+
+    def test_returns_none_when_output_not_created(self, tmp_path):
+        """Test returns None when output file is not created."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch("subprocess.run"),
+        ):
+            result = convert_video_to_gif_with_palette(
+                video_file, tmp_path / "palette.png"
+            )
+
+        assert result is None
+
+
+@pytest.mark.usefixtures("ffmpeg_available")
 class TestConvertAllVideosToGif:
     """Tests for convert_all_videos_to_gif function."""
 
@@ -224,6 +521,24 @@ class TestConvertAllVideosToGif:
         result = convert_all_videos_to_gif(tmp_path / "nonexistent")
         assert result == []
 
+    def test_returns_empty_list_without_ffmpeg(self, tmp_path):
+        """Test returns early without scanning when ffmpeg is missing."""
+        (tmp_path / "video.webm").touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=False,
+            ),
+            patch(
+                "wagtail_scenario_test.utils.video.convert_video_to_gif"
+            ) as mock_convert,
+        ):
+            result = convert_all_videos_to_gif(tmp_path)
+
+        assert result == []
+        mock_convert.assert_not_called()
+
     def test_converts_all_webm_files(self, tmp_path):
         """Test converts all webm files in directory."""
         # Create test video files
@@ -294,3 +609,320 @@ class TestConvertAllVideosToGif:
             result = convert_all_videos_to_gif(str(tmp_path))
 
             assert len(result) == 1
+
+    def test_returns_empty_list_when_no_videos(self, tmp_path):
+        """Test returns empty list without starting a pool for no videos."""
+        with patch("wagtail_scenario_test.utils.video.ThreadPoolExecutor") as mock_pool:
+            result = convert_all_videos_to_gif(tmp_path)
+
+        assert result == []
+        mock_pool.assert_not_called()
+
+    def test_limits_workers_to_video_count(self, tmp_path):
+        """Test never starts more workers than there are videos."""
+        (tmp_path / "video1.webm").touch()
+        (tmp_path / "video2.webm").touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.convert_video_to_gif",
+                return_value=None,
+            ),
+            patch(
+                "wagtail_scenario_test.utils.video.ThreadPoolExecutor",
+                wraps=ThreadPoolExecutor,
+            ) as mock_pool,
+        ):
+            convert_all_videos_to_gif(tmp_path, max_workers=8)
+
+        mock_pool.assert_called_once_with(max_workers=2)
+
+    def test_incremental_by_default(self, tmp_path):
+        """Test asks each conversion to skip up-to-date GIFs by default."""
+        (tmp_path / "video.webm").touch()
+
+        with patch(
+            "wagtail_scenario_test.utils.video.convert_video_to_gif",
+            return_value=None,
+        ) as mock_convert:
+            convert_all_videos_to_gif(tmp_path)
+            convert_all_videos_to_gif(tmp_path, incremental=False)
+
+        incremental = [c.kwargs["incremental"] for c in mock_convert.call_args_list]
+        assert incremental == [True, False]
+
+    def test_shared_palette_skipped_when_all_up_to_date(self, tmp_path):
+        """Test does not generate a palette when every GIF is current."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+        (tmp_path / "video.gif").touch()
+        os.utime(video_file, (1000, 1000))
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.generate_palette"
+            ) as mock_generate,
+            patch(
+                "wagtail_scenario_test.utils.video.convert_video_to_gif",
+                return_value=tmp_path / "video.gif",
+            ),
+        ):
+            result = convert_all_videos_to_gif(
+                tmp_path, shared_palette=tmp_path / "palette.png"
+            )
+
+        assert result == [tmp_path / "video.gif"]
+        mock_generate.assert_not_called()
+
+    def test_passes_scale_flags_to_convert(self, tmp_path):
+        """Test forwards scale_flags to each conversion."""
+        (tmp_path / "video.webm").touch()
+
+        with patch(
+            "wagtail_scenario_test.utils.video.convert_video_to_gif",
+            return_value=None,
+        ) as mock_convert:
+            convert_all_videos_to_gif(tmp_path, scale_flags="lanczos")
+
+        assert mock_convert.call_args.kwargs["scale_flags"] == "lanczos"
+
+    def test_splits_threads_between_workers(self, tmp_path):
+        """Test divides the CPUs between concurrent conversions."""
+        for i in range(4):
+            (tmp_path / f"video{i}.webm").touch()
+
+        with (
+            patch("wagtail_scenario_test.utils.video.os.cpu_count", return_value=8),
+            patch(
+                "wagtail_scenario_test.utils.video.convert_video_to_gif",
+                return_value=None,
+            ) as mock_convert,
+        ):
+            convert_all_videos_to_gif(tmp_path, max_workers=4)
+
+        assert {c.kwargs["threads"] for c in mock_convert.call_args_list} == {2}
+
+    def test_returns_gifs_in_discovery_order(self, tmp_path):
+        """Test keeps results in the order the videos were found."""
+        videos = [tmp_path / f"video{i}.webm" for i in range(4)]
+        for video in videos:
+            video.touch()
+
+        with patch(
+            "wagtail_scenario_test.utils.video.convert_video_to_gif",
+            side_effect=lambda path, **kwargs: path.with_suffix(".gif"),
+        ):
+            result = convert_all_videos_to_gif(tmp_path, max_workers=4)
+
+        expected = [p.with_suffix(".gif") for p in tmp_path.rglob("*.webm")]
+        assert result == expected
+
+    def test_shared_palette_is_generated_once(self, tmp_path):
+        """Test generates one palette and reuses it for every video."""
+        (tmp_path / "video1.webm").touch()
+        (tmp_path / "video2.webm").touch()
+        palette = tmp_path / "palette.png"
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.generate_palette",
+                return_value=palette,
+            ) as mock_generate,
+            patch(
+                "wagtail_scenario_test.utils.video.convert_video_to_gif_with_palette",
+                side_effect=lambda path, pal, **kwargs: path.with_suffix(".gif"),
+            ) as mock_convert,
+            patch(
+                "wagtail_scenario_test.utils.video.convert_video_to_gif"
+            ) as mock_plain,
+        ):
+            result = convert_all_videos_to_gif(tmp_path, shared_palette=palette)
+
+        assert len(result) == 2
+        mock_generate.assert_called_once()
+        assert mock_convert.call_count == 2
+        assert all(c.args[1] == palette for c in mock_convert.call_args_list)
+        mock_plain.assert_not_called()
+
+    def test_shared_palette_falls_back_when_generation_fails(self, tmp_path):
+        """Test uses per-video palettes if the shared palette fails."""
+        (tmp_path / "video.webm").touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.generate_palette",
+                return_value=None,
+            ),
+            patch(
+                "wagtail_scenario_test.utils.video.convert_video_to_gif",
+                return_value=tmp_path / "video.gif",
+            ) as mock_plain,
+        ):
+            result = convert_all_videos_to_gif(
+                tmp_path, shared_palette=tmp_path / "palette.png"
+            )
+
+        assert result == [tmp_path / "video.gif"]
+        mock_plain.assert_called_once()
+
+
+def _mock_process(returncode=0):
+    """Build a mock asyncio subprocess that exits with returncode."""
+    proc = MagicMock()
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
+class TestConvertVideoToGifAsync:
+    """Tests for convert_video_to_gif_async function."""
+
+    def test_runs_ffmpeg_without_blocking(self, tmp_path):
+        """Test runs the same ffmpeg command via create_subprocess_exec."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+        expected_gif = tmp_path / "video.gif"
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch(
+                "asyncio.create_subprocess_exec",
+                new=AsyncMock(return_value=_mock_process()),
+            ) as mock_exec,
+            patch("subprocess.run") as mock_run,
+        ):
+            expected_gif.touch()
+            result = asyncio.run(convert_video_to_gif_async(video_file, fps=15))
+
+        assert result == expected_gif
+        mock_run.assert_not_called()
+        args = mock_exec.call_args.args
+        assert args[0] == "ffmpeg"
+        assert "fps=15" in args[args.index("-vf") + 1]
+        assert args[-1] == str(expected_gif)
+
+    def test_returns_none_on_nonzero_exit(self, tmp_path):
+        """Test returns None when ffmpeg exits with an error."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+        (tmp_path / "video.gif").touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch(
+                "asyncio.create_subprocess_exec",
+                new=AsyncMock(return_value=_mock_process(returncode=1)),
+            ),
+        ):
+            result = asyncio.run(convert_video_to_gif_async(video_file))
+
+        assert result is None
+
+    def test_returns_none_on_file_not_found(self, tmp_path):
+        """Test returns None when the ffmpeg binary cannot be started."""
+        video_file = tmp_path / "video.webm"
+        video_file.touch()
+
+        with (
+            patch(
+                "wagtail_scenario_test.utils.video.is_ffmpeg_available",
+                return_value=True,
+            ),
+            patch(
+                "asyncio.create_subprocess_exec",
+                new=AsyncMock(side_effect=FileNotFoundError()),
+            ),
+        ):
+            result = asyncio.run(convert_video_to_gif_async(video_file))
+
+        assert result is None
+
+
+@pytest.mark.usefixtures("ffmpeg_available")
+class TestConvertAllVideosToGifAsync:
+    """Tests for convert_all_videos_to_gif_async function."""
+
+    def test_returns_empty_list_when_directory_not_exists(self, tmp_path):
+        """Test returns empty list when directory doesn't exist."""
+        result = asyncio.run(convert_all_videos_to_gif_async(tmp_path / "missing"))
+
+        assert result == []
+
+    def test_converts_all_webm_files(self, tmp_path):
+        """Test converts every webm file and skips failures."""
+        (tmp_path / "video1.webm").touch()
+        (tmp_path / "video2.webm").touch()
+
+        async def fake_convert(path, **kwargs):
+            return None if path.name == "video2.webm" else path.with_suffix(".gif")
+
+        with patch(
+            "wagtail_scenario_test.utils.video.convert_video_to_gif_async",
+            side_effect=fake_convert,
+        ) as mock_convert:
+            result = asyncio.run(convert_all_videos_to_gif_async(tmp_path))
+
+        assert result == [tmp_path / "video1.gif"]
+        assert mock_convert.call_count == 2
+
+    def test_limits_concurrency(self, tmp_path):
+        """Test never runs more conversions at once than max_workers."""
+        for i in range(4):
+            (tmp_path / f"video{i}.webm").touch()
+        running = 0
+        peak = 0
+
+        async def fake_convert(path, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return path.with_suffix(".gif")
+
+        with patch(
+            "wagtail_scenario_test.utils.video.convert_video_to_gif_async",
+            side_effect=fake_convert,
+        ):
+            result = asyncio.run(
+                convert_all_videos_to_gif_async(tmp_path, max_workers=2)
+            )
+
+        assert len(result) == 4
+        assert peak == 2
+
+    def test_returns_empty_list_when_no_videos(self, tmp_path):
+        """Test returns empty list when the directory has no webm files."""
+        with patch(
+            "wagtail_scenario_test.utils.video.convert_video_to_gif_async"
+        ) as mock_convert:
+            result = asyncio.run(convert_all_videos_to_gif_async(tmp_path))
+
+        assert result == []
+        mock_convert.assert_not_called()
+
+    def test_limits_workers_to_video_count(self, tmp_path):
+        """Test gives each job the cores left idle by a small batch."""
+        (tmp_path / "video1.webm").touch()
+        (tmp_path / "video2.webm").touch()
+
+        async def fake_convert(path, **kwargs):
+            return path.with_suffix(".gif")
+
+        with (
+            patch("wagtail_scenario_test.utils.video.os.cpu_count", return_value=16),
+            patch(
+                "wagtail_scenario_test.utils.video.convert_video_to_gif_async",
+                side_effect=fake_convert,
+            ) as mock_convert,
+        ):
+            asyncio.run(convert_all_videos_to_gif_async(tmp_path))
+
+        assert mock_convert.call_count == 2
+        for call in mock_convert.call_args_list:
+            assert call.kwargs["threads"] == 8
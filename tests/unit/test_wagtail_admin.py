@@ -2,6 +2,9 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
 from wagtail_scenario_test.page_objects.wagtail_admin import WagtailAdminPage
 
 
@@ -68,24 +71,195 @@ class TestWagtailAdminPageAuth:
         mock_page.get_by_text.assert_called_with("Log out", exact=True)
         mock_logout_link.click.assert_called_once()
 
+    def test_login_submits_form_with_existing_session(self, mock_page, test_url):
+        """login should submit the form even when a session cookie exists."""
+        mock_page.context.cookies.return_value = [{"name": "sessionid"}]
+        admin = WagtailAdminPage(mock_page, test_url)
+
+        admin.login("editor", "password123")
+
+        mock_page.goto.assert_called_once_with(f"{test_url}/admin/login/")
+        mock_page.get_by_label.return_value.fill.assert_any_call("editor")
+
+    def test_ensure_logged_in_skips_form_with_valid_session(self, mock_page, test_url):
+        """ensure_logged_in should not log in when the server accepts the session."""
+        mock_page.context.cookies.return_value = [{"name": "sessionid"}]
+        mock_page.request.get.return_value.url = f"{test_url}/admin/"
+        admin = WagtailAdminPage(mock_page, test_url)
+
+        admin.ensure_logged_in("admin", "password123")
+
+        mock_page.request.get.assert_called_once_with(f"{test_url}/admin/")
+        mock_page.goto.assert_not_called()
+
+    def test_ensure_logged_in_logs_in_when_session_rejected(self, mock_page, test_url):
+        """ensure_logged_in should log in when the admin redirects to login."""
+        mock_page.context.cookies.return_value = [{"name": "sessionid"}]
+        mock_page.request.get.return_value.url = f"{test_url}/admin/login/?next=/admin/"
+        admin = WagtailAdminPage(mock_page, test_url)
+
+        admin.ensure_logged_in("admin", "password123")
+
+        mock_page.goto.assert_called_once_with(f"{test_url}/admin/login/")
+
+    def test_ensure_logged_in_logs_in_without_cookie(self, mock_page, test_url):
+        """ensure_logged_in should log in without asking the server first."""
+        mock_page.context.cookies.return_value = []
+        admin = WagtailAdminPage(mock_page, test_url)
+
+        admin.ensure_logged_in("admin", "password123")
+
+        mock_page.request.get.assert_not_called()
+        mock_page.goto.assert_called_once_with(f"{test_url}/admin/login/")
+
     def test_is_logged_in_returns_true(self, mock_page, test_url):
-        """is_logged_in should return True when on admin page."""
-        mock_page.url = f"{test_url}/admin/"
+        """is_logged_in should return True when a session cookie exists."""
+        mock_page.context.cookies.return_value = [
+            {"name": "csrftoken"},
+            {"name": "sessionid"},
+        ]
         admin = WagtailAdminPage(mock_page, test_url)
 
         result = admin.is_logged_in()
 
+        mock_page.context.cookies.assert_called_once_with(test_url)
         assert result is True
 
     def test_is_logged_in_returns_false(self, mock_page, test_url):
-        """is_logged_in should return False when on login page."""
-        mock_page.url = f"{test_url}/admin/login/"
+        """is_logged_in should return False without a session cookie."""
+        mock_page.context.cookies.return_value = [{"name": "csrftoken"}]
         admin = WagtailAdminPage(mock_page, test_url)
 
         result = admin.is_logged_in()
 
         assert result is False
 
+    def test_is_logged_in_rereads_cookies(self, mock_page, test_url):
+        """is_logged_in should see cookies changed by anyone sharing the context."""
+        mock_page.context.cookies.return_value = []
+        admin = WagtailAdminPage(mock_page, test_url)
+        assert admin.is_logged_in() is False
+
+        # e.g. another Page Object or context.add_cookies() logged in
+        mock_page.context.cookies.return_value = [{"name": "sessionid"}]
+
+        assert admin.is_logged_in() is True
+        assert mock_page.context.cookies.call_count == 2
+
+    def test_is_logged_in_does_not_navigate(self, mock_page, test_url):
+        """is_logged_in should not touch page navigation."""
+        mock_page.context.cookies.return_value = []
+        admin = WagtailAdminPage(mock_page, test_url)
+
+        admin.is_logged_in()
+
+        mock_page.goto.assert_not_called()
+
+
+class TestWagtailAdminPageNetwork:
+    """Tests for WagtailAdminPage network helpers."""
+
+    def test_block_heavy_resources_installs_context_route(self, mock_page, test_url):
+        """block_heavy_resources should route every request in the context."""
+        admin = WagtailAdminPage(mock_page, test_url)
+
+        admin.block_heavy_resources()
+
+        mock_page.context.route.assert_called_once()
+        assert mock_page.context.route.call_args.args[0] == "**/*"
+
+    def test_heavy_resources_are_aborted(self, mock_page, test_url):
+        """Images, fonts and media should be aborted."""
+        admin = WagtailAdminPage(mock_page, test_url)
+        admin.block_heavy_resources()
+        handler = mock_page.context.route.call_args.args[1]
+
+        for resource_type in ("image", "font", "media"):
+            route = MagicMock()
+            route.request.resource_type = resource_type
+            handler(route)
+            route.abort.assert_called_once()
+            route.continue_.assert_not_called()
+
+    def test_other_resources_continue(self, mock_page, test_url):
+        """Documents, scripts and XHR should continue."""
+        admin = WagtailAdminPage(mock_page, test_url)
+        admin.block_heavy_resources()
+        handler = mock_page.context.route.call_args.args[1]
+
+        for resource_type in ("document", "script", "stylesheet", "xhr"):
+            route = MagicMock()
+            route.request.resource_type = resource_type
+            handler(route)
+            route.continue_.assert_called_once()
+            route.abort.assert_not_called()
+
+    def test_cache_static_assets_installs_context_route(self, mock_page, test_url):
+        """cache_static_assets should route the static URL prefix."""
+        admin = WagtailAdminPage(mock_page, test_url)
+
+        admin.cache_static_assets()
+
+        mock_page.context.route.assert_called_once()
+        assert mock_page.context.route.call_args.args[0] == "**/static/**"
+
+    def test_static_asset_is_fetched_once(self, mock_page, test_url):
+        """A static file should be fetched once and then served from memory."""
+        admin = WagtailAdminPage(mock_page, test_url)
+        admin.cache_static_assets()
+        handler = mock_page.context.route.call_args.args[1]
+        url = f"{test_url}/static/fetched-once.js"
+
+        first = MagicMock()
+        first.request.url = url
+        first.request.method = "GET"
+        first.request.resource_type = "script"
+        first.fetch.return_value.status = 200
+        first.fetch.return_value.headers = {"content-type": "text/javascript"}
+        first.fetch.return_value.body.return_value = b"console.log(1);"
+        handler(first)
+
+        second = MagicMock()
+        second.request = first.request
+        handler(second)
+
+        second.fetch.assert_not_called()
+        second.fulfill.assert_called_once_with(
+            status=200,
+            headers={"content-type": "text/javascript"},
+            body=b"console.log(1);",
+        )
+
+    def test_static_asset_error_is_not_cached(self, mock_page, test_url):
+        """A failed static response should be passed through, not cached."""
+        admin = WagtailAdminPage(mock_page, test_url)
+        admin.cache_static_assets()
+        handler = mock_page.context.route.call_args.args[1]
+
+        for _ in range(2):
+            route = MagicMock()
+            route.request.url = f"{test_url}/static/missing.js"
+            route.request.method = "GET"
+            route.request.resource_type = "script"
+            route.fetch.return_value.status = 404
+            handler(route)
+            route.fetch.assert_called_once()
+            route.fulfill.assert_called_once_with(response=route.fetch.return_value)
+
+    def test_heavy_static_assets_fall_back(self, mock_page, test_url):
+        """Static images should be left to the heavy resource route."""
+        admin = WagtailAdminPage(mock_page, test_url)
+        admin.cache_static_assets()
+        handler = mock_page.context.route.call_args.args[1]
+
+        route = MagicMock()
+        route.request.method = "GET"
+        route.request.resource_type = "image"
+        handler(route)
+
+        route.fallback.assert_called_once()
+        route.fetch.assert_not_called()
+
 
 class TestWagtailAdminPageNavigation:
     """Tests for WagtailAdminPage navigation methods."""
@@ -147,18 +321,21 @@ class TestWagtailAdminPageNotifications:
         """get_success_message should return message text."""
         admin = WagtailAdminPage(mock_page, test_url)
         locator = mock_page.locator.return_value
-        locator.count.return_value = 1
         locator.first.text_content.return_value = "Saved successfully"
 
         result = admin.get_success_message()
 
         mock_page.locator.assert_called_with(".w-message--success")
+        locator.first.text_content.assert_called_once_with(timeout=500)
+        locator.count.assert_not_called()
         assert result == "Saved successfully"
 
     def test_get_success_message_returns_none(self, mock_page, test_url):
         """get_success_message should return None if no message."""
         admin = WagtailAdminPage(mock_page, test_url)
-        mock_page.locator.return_value.count.return_value = 0
+        mock_page.locator.return_value.first.text_content.side_effect = (
+            PlaywrightTimeoutError("not found")
+        )
 
         result = admin.get_success_message()
 
@@ -168,7 +345,6 @@ class TestWagtailAdminPageNotifications:
         """get_error_message should return message text."""
         admin = WagtailAdminPage(mock_page, test_url)
         locator = mock_page.locator.return_value
-        locator.count.return_value = 1
         locator.first.text_content.return_value = "Error occurred"
 
         result = admin.get_error_message()
@@ -179,20 +355,34 @@ class TestWagtailAdminPageNotifications:
     def test_get_error_message_returns_none(self, mock_page, test_url):
         """get_error_message should return None if no message."""
         admin = WagtailAdminPage(mock_page, test_url)
-        mock_page.locator.return_value.count.return_value = 0
+        mock_page.locator.return_value.first.text_content.side_effect = (
+            PlaywrightTimeoutError("not found")
+        )
 
         result = admin.get_error_message()
 
         assert result is None
 
     def test_assert_success_message(self, mock_page, test_url, mock_playwright_expect):
-        """assert_success_message should check for success message."""
+        """assert_success_message should wait for the message to be visible."""
         admin = WagtailAdminPage(mock_page, test_url)
 
         admin.assert_success_message()
 
-        mock_page.locator.assert_called()
-        mock_playwright_expect.assert_called()
+        mock_page.locator.return_value.first.wait_for.assert_called_once_with(
+            state="visible", timeout=admin.DEFAULT_NAV_TIMEOUT_MS
+        )
+        mock_page.wait_for_load_state.assert_not_called()
+
+    def test_assert_success_message_missing(self, mock_page, test_url):
+        """assert_success_message should fail if no message appears."""
+        admin = WagtailAdminPage(mock_page, test_url)
+        mock_page.locator.return_value.first.wait_for.side_effect = (
+            PlaywrightTimeoutError("not found")
+        )
+
+        with pytest.raises(AssertionError, match="No success message"):
+            admin.assert_success_message()
 
     def test_assert_success_message_with_contains(
         self, mock_page, test_url, mock_playwright_expect
@@ -200,9 +390,22 @@ class TestWagtailAdminPageNotifications:
         """assert_success_message should check message content."""
         admin = WagtailAdminPage(mock_page, test_url)
 
+        mock_page.locator.return_value.text_content.return_value = "Page Created"
+
         admin.assert_success_message(contains="Created")
 
         mock_page.locator.assert_called()
+        mock_playwright_expect.return_value.to_contain_text.assert_not_called()
+
+    def test_assert_success_message_contains_mismatch(
+        self, mock_page, test_url, mock_playwright_expect
+    ):
+        """assert_success_message should fail if the text does not match."""
+        admin = WagtailAdminPage(mock_page, test_url)
+        mock_page.locator.return_value.text_content.return_value = "Page saved"
+
+        with pytest.raises(AssertionError, match="does not contain 'Created'"):
+            admin.assert_success_message(contains="Created")
 
     def test_assert_error_message(self, mock_page, test_url, mock_playwright_expect):
         """assert_error_message should check for error message."""